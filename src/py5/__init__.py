@@ -31,7 +31,16 @@ import sys
 import warnings
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Callable, ContextManager, Sequence, Union, overload  # noqa
+from typing import (  # noqa
+    Any,
+    Callable,
+    ContextManager,
+    Coroutine,
+    Iterator,
+    Sequence,
+    Union,
+    overload,
+)
 
 import jpype.imports  # noqa
 import numpy as np  # noqa
@@ -144,16 +153,27 @@ if not py5_tools.is_jvm_running():
         raise RuntimeError("py5 is unable to start Java 17 Virtual Machine")
 
     try:
-        if JClass("py5.util.CheckHeadless")().test():
-            raise RuntimeError(
-                "py5 is unable to run correctly in headless mode. "
-                "Make sure you are running in a graphical environment and that your Java Virtual Machine is not a Headless JVM."
-            )
+        headless_jvm = JClass("py5.util.CheckHeadless")().test()
     except:
         raise RuntimeError(
             "Unable to instantiate Java class py5.util.CheckHeadless. "
             "If you are using PyInstaller right now, please check that all of py5's jar files are included in your package."
         )
+    if headless_jvm and not py5_tools.is_headless_mode():
+        raise RuntimeError(
+            "py5 is unable to run correctly in headless mode. "
+            "Make sure you are running in a graphical environment and that your Java Virtual Machine is not a Headless JVM. "
+            "To render offscreen without a display server, call `py5_tools.set_headless_mode()` before importing py5 "
+            "or set the PY5_HEADLESS environment variable to 1."
+        )
+    if py5_tools.is_headless_mode():
+        # keep Processing from initializing AWT windowing in runSketch()
+        _disable_awt = JClass("processing.core.PApplet").class_.getDeclaredField(
+            "disableAWT"
+        )
+        _disable_awt.setAccessible(True)
+        _disable_awt.setBoolean(None, True)
+        del _disable_awt
 
 import py5_tools.colors.css4 as css4_colors  # noqa
 import py5_tools.colors.mpl_cmaps as mpl_cmaps  # noqa
@@ -170,6 +190,7 @@ from .image_conversion import NumpyImageArray, register_image_conversion  # noqa
 from .render_helper import render, render_frame, render_frame_sequence, render_sequence
 from .shape_conversion import register_shape_conversion  # noqa
 from .sketch import (
+    Py5Assets,
     Py5Font,
     Py5Graphics,
     Py5Image,
@@ -178,6 +199,7 @@ from .sketch import (
     Py5Promise,
     Py5Shader,
     Py5Shape,
+    Py5ShapeIndex,
     Py5Surface,
     Sketch,
 )
@@ -18385,6 +18407,16 @@ def launch_promise_thread(
     `result` property contains the value function `f` returned. Before then, the
     `result` property will be `None`.
 
+    The `Py5Promise` object also supports the methods of Python's
+    `concurrent.futures.Future` class, such as `done()`, `cancel()`,
+    `exception()`, and `add_done_callback()`. Call `wait()` to block until the
+    function completes, optionally with a `timeout`. If function `f` throws an
+    exception, the error message will be printed and the exception will be re-raised
+    when the `result` property is accessed or `wait()` is called. The Sketch will
+    continue to run. A `Py5Promise` object can also be awaited in asyncio code, and
+    its `future` property can be passed to functions such as
+    `concurrent.futures.as_completed()`.
+
     The `name` parameter is optional but useful if you want to monitor the thread
     with other methods such as `has_thread()`. If the provided `name` is identical
     to an already running thread, the running thread will first be stopped with a
@@ -18420,6 +18452,7 @@ def launch_repeating_thread(
     name: str = None,
     *,
     time_delay: float = 0,
+    fixed_rate: bool = True,
     daemon: bool = True,
     args: tuple = None,
     kwargs: dict = None,
@@ -18439,6 +18472,9 @@ def launch_repeating_thread(
     f: Callable
         function to call in the launched thread
 
+    fixed_rate: bool = True
+        measure the time delay from the start of each call instead of the end
+
     kwargs: dict = None
         keyword arguments to pass to the given function
 
@@ -18461,6 +18497,20 @@ def launch_repeating_thread(
     takes longer than expected to finish, py5 will wait for it to finish before
     making the next call. There will not be overlapping calls to function `f`.
 
+    By default the calls are made at a fixed rate, meaning the `time_delay` is
+    measured from the scheduled start of one call to the start of the next. The
+    schedule does not drift, even if the function's execution time varies. Set
+    `fixed_rate` to `False` to measure the `time_delay` from the end of one call to
+    the start of the next instead.
+
+    Repeating threads do not each get their own Python thread. All of a Sketch's
+    repeating threads share a single timer and a small pool of worker threads,
+    which keeps the number of threads low when there are many periodic tasks. Use
+    `repeating_thread_stats()` to monitor the scheduler. Setting `daemon` to
+    `False` will run the function in a dedicated non-daemon thread instead. That
+    thread follows the same `fixed_rate` timing but is not included in the
+    scheduler statistics.
+
     The `name` parameter is optional but useful if you want to monitor the thread
     with other methods such as `has_thread()`. If the provided `name` is identical
     to an already running thread, the running thread will first be stopped with a
@@ -18486,6 +18536,7 @@ def launch_repeating_thread(
         f,
         name=name,
         time_delay=time_delay,
+        fixed_rate=fixed_rate,
         daemon=daemon,
         args=args,
         kwargs=kwargs,
@@ -18607,6 +18658,323 @@ def list_threads() -> None:
     return _py5sketch.list_threads()
 
 
+def run_async(coro: Coroutine, *, callback: Callable[[Any], None] = None) -> Py5Promise:
+    """Run an asyncio coroutine in an event loop running in parallel with your
+    Sketch code.
+
+    Parameters
+    ----------
+
+    callback: Callable[[Any], None] = None
+        function to call with the coroutine's result before the next call to draw
+
+    coro: Coroutine
+        coroutine to run in the Sketch's asyncio event loop
+
+    Notes
+    -----
+
+    Run an asyncio coroutine in an event loop running in parallel with your
+    Sketch code. This makes it possible to use async libraries, such as websocket
+    clients, async http clients, or async database drivers, that would otherwise
+    slow down the animation thread and reduce the Sketch's frame rate.
+
+    The Sketch's asyncio event loop is created the first time this method is called
+    and runs in its own Python thread. All coroutines passed to `run_async()` run
+    in that same event loop, so they can share asyncio objects such as queues and
+    network connections. When the Sketch exits, any coroutines that are still
+    running will be cancelled and the event loop will be closed.
+
+    This method returns a `Py5Promise` object that will store the coroutine's
+    result when it completes. Calling the Py5Promise's `cancel()` method will
+    cancel the coroutine.
+
+    Use the `callback` parameter to receive the coroutine's result on the animation
+    thread. The callback function will be called with the result right before the
+    next call to `draw()`, making it safe to use the result to update the Sketch's
+    state or to draw to the screen. If the coroutine throws an exception, the
+    callback will not be called and the error will be printed instead.
+
+    Callbacks wait for `draw()`, so none will be called while the Sketch is paused
+    with `no_loop()`. If the Sketch does not have a `draw()` function, the callback
+    is instead called from the event loop's thread as soon as the coroutine
+    completes.
+    """
+    return _py5sketch.run_async(coro, callback=callback)
+
+
+def repeating_thread_stats() -> dict[str, Any]:
+    """Get statistics about the scheduler that runs the Sketch's repeating threads.
+
+    Notes
+    -----
+
+    Get statistics about the scheduler that runs the Sketch's repeating threads.
+    Repeating threads launched with `launch_repeating_thread()` share a single
+    timer and a bounded pool of worker threads. This method reports how many Python
+    threads that scheduler is using and how accurately it is keeping to each
+    repeating thread's schedule.
+
+    The returned dictionary contains the number of scheduled tasks, the number of
+    worker threads and idle worker threads, and the maximum allowed number of
+    worker threads. The `tasks` key maps each repeating thread's name to the number
+    of calls made so far and the mean and maximum scheduling jitter in seconds. The
+    jitter is the time between when a call was supposed to start and when it
+    actually started.
+    """
+    return _py5sketch.repeating_thread_stats()
+
+
+def schedule_idle_task(
+    f: Callable,
+    name: str = None,
+    *,
+    priority: int = 0,
+    cost: float = 0.0,
+    repeating: bool = False,
+    max_delay: float = None,
+    args: tuple = None,
+    kwargs: dict = None,
+) -> str:
+    """Schedule a function to be called on the animation thread after `draw()`, when
+    there is time left before the next frame is due.
+
+    Parameters
+    ----------
+
+    args: tuple = None
+        positional arguments to pass to the given function
+
+    cost: float = 0.0
+        estimated time in seconds the function takes to run
+
+    f: Callable
+        function to call when the Sketch has idle time
+
+    kwargs: dict = None
+        keyword arguments to pass to the given function
+
+    max_delay: float = None
+        maximum time in seconds the task can be postponed
+
+    name: str = None
+        name of the idle task
+
+    priority: int = 0
+        tasks with higher priorities are run first
+
+    repeating: bool = False
+        call the function again every frame that has time for it
+
+    Notes
+    -----
+
+    Schedule a function to be called on the animation thread after `draw()`, when
+    there is time left before the next frame is due. This is useful for work that
+    must happen on the animation thread but can be postponed, such as saving files,
+    logging, or maintaining caches. Running this work when the Sketch has time for
+    it instead of in `draw()` will avoid dropped frames.
+
+    The time available is based on the frame rate set with `frame_rate()`. After
+    each call to `draw()`, idle tasks are run in order of their `priority`, as long
+    as each task's estimated cost fits in the time remaining. Tasks that do not fit
+    are carried over to the next frame and the scheduler will try again. The cost
+    estimate starts with the `cost` parameter and is replaced by the measured run
+    time once the task has been called. A task with a large cost might never fit
+    in a frame, so use the `max_delay` parameter to set the longest time in
+    seconds a task can wait before it will be run regardless of the time
+    available.
+
+    By default a task is called once and then discarded. Set `repeating` to `True`
+    to call the function every frame that has time for it, until the task is
+    cancelled with `cancel_idle_task()`. Scheduling a task with the same `name` as
+    an existing task will replace the existing task. This can be used to coalesce
+    repeated requests for the same work, such as saving the Sketch's state.
+
+    Idle tasks are only run after calls to `draw()`, so they will not run if the
+    Sketch does not have a `draw()` method or if `no_loop()` was called. If a task
+    throws an exception, the Sketch will stop, just like an exception in `draw()`.
+    Use `idle_task_stats()` to see how often tasks are run and postponed.
+    """
+    return _py5sketch.schedule_idle_task(
+        f,
+        name=name,
+        priority=priority,
+        cost=cost,
+        repeating=repeating,
+        max_delay=max_delay,
+        args=args,
+        kwargs=kwargs,
+    )
+
+
+def cancel_idle_task(name: str) -> bool:
+    """Cancel an idle task of a given name.
+
+    Parameters
+    ----------
+
+    name: str
+        name of the idle task
+
+    Notes
+    -----
+
+    Cancel an idle task of a given name. The task will not be called again. This
+    method returns `True` if the task was waiting to be called and `False` if there
+    is no task of that name, which is also the case for non-repeating tasks that
+    have already been called. Idle tasks are created with `schedule_idle_task()`.
+    """
+    return _py5sketch.cancel_idle_task(name)
+
+
+def idle_task_stats() -> dict[str, Any]:
+    """Get statistics about the Sketch's idle tasks.
+
+    Notes
+    -----
+
+    Get statistics about the Sketch's idle tasks. Idle tasks are created with
+    `schedule_idle_task()` and run after `draw()` when there is time left before
+    the next frame is due.
+
+    The returned dictionary contains the number of pending tasks, the number of
+    frames the scheduler has run in, and the mean idle time and mean time spent
+    running tasks per frame, in seconds. The `tasks` key maps each pending task's
+    name to its priority, the number of calls made so far, the number of times it
+    was carried over to the next frame, and the mean and maximum time each call
+    took.
+    """
+    return _py5sketch.idle_task_stats()
+
+
+##############################################################################
+# module functions from buffer_pool.py
+##############################################################################
+
+
+def borrow_graphics(
+    w: int, h: int, renderer: str = None, *, clear: bool = True
+) -> Py5Graphics:
+    """Borrow a `Py5Graphics` object from the Sketch's buffer pool.
+
+    Parameters
+    ----------
+
+    clear: bool = True
+        reset the graphics object's pixels and drawing styles
+
+    h: int
+        height in pixels
+
+    renderer: str = None
+        renderer for the graphics object
+
+    w: int
+        width in pixels
+
+    Notes
+    -----
+
+    Borrow a `Py5Graphics` object from the Sketch's buffer pool. Use this with a
+    `with` statement to get a `Py5Graphics` object for temporary drawing, such as a
+    blur pass, a mask, or compositing. At the end of the `with` block the object is
+    returned to the pool so it can be borrowed again.
+
+    Creating new graphics objects with `create_graphics()` in `draw()` allocates
+    new memory for every frame. Borrowing them from the pool instead reuses
+    graphics objects of the same size, renderer, and pixel density, including the
+    memory used by `Py5Graphics.load_np_pixels()`. After the first frame, a Sketch
+    that borrows the same sizes every frame will not allocate any new memory for
+    them.
+
+    By default a reused graphics object's pixels are made transparent and its
+    drawing styles are reset, just like a new graphics object. Set `clear` to
+    `False` to skip this if your code will draw over all of the pixels and set all
+    of the styles it uses. Don't keep a reference to the borrowed object after the
+    `with` block ends because it might be given to other code.
+
+    Idle graphics objects in the pool are discarded in least recently used order
+    when their total size exceeds the pool's budget. Use
+    `set_buffer_pool_budget()` to change that budget and `buffer_pool_stats()` to
+    see how the pool is used.
+    """
+    return _py5sketch.borrow_graphics(w, h, renderer=renderer, clear=clear)
+
+
+def borrow_image(w: int, h: int, format: int = None, *, clear: bool = True) -> Py5Image:
+    """Borrow a `Py5Image` object from the Sketch's buffer pool.
+
+    Parameters
+    ----------
+
+    clear: bool = True
+        set all of the image's pixels to zero
+
+    format: int = None
+        image format, either RGB, ARGB, or ALPHA
+
+    h: int
+        height in pixels
+
+    w: int
+        width in pixels
+
+    Notes
+    -----
+
+    Borrow a `Py5Image` object from the Sketch's buffer pool. Use this with a
+    `with` statement to get a `Py5Image` object for temporary use. At the end of
+    the `with` block the image is returned to the pool so it can be borrowed
+    again. The `format` parameter defaults to `RGB`.
+
+    This works the same way as `borrow_graphics()`. Images are reused if they have
+    the same size and format. By default the pixels of a reused image are set to
+    zero, which is transparent black for `ARGB` images. Set `clear` to `False` to
+    skip this if your code will set all of the pixels.
+    """
+    return _py5sketch.borrow_image(w, h, format=format, clear=clear)
+
+
+def set_buffer_pool_budget(max_bytes: int) -> None:
+    """Set the maximum total size of the idle objects in the Sketch's buffer pool.
+
+    Parameters
+    ----------
+
+    max_bytes: int
+        maximum size in bytes
+
+    Notes
+    -----
+
+    Set the maximum total size of the idle objects in the Sketch's buffer pool.
+    Objects borrowed with `borrow_graphics()` or `borrow_image()` are kept in the
+    pool after they are returned so they can be borrowed again. When the total size
+    of those idle objects exceeds this budget, the least recently used objects are
+    discarded. The size of each object is 4 bytes per pixel, doubled if its numpy
+    pixels have been used. The default budget is 256 MB. Set the budget to 0 to
+    empty the pool.
+    """
+    return _py5sketch.set_buffer_pool_budget(max_bytes)
+
+
+def buffer_pool_stats() -> dict[str, Any]:
+    """Get statistics about the Sketch's buffer pool.
+
+    Notes
+    -----
+
+    Get statistics about the Sketch's buffer pool. The returned dictionary contains
+    the number of objects created for `borrow_graphics()` and `borrow_image()`, the
+    number of times an object was reused instead, the number of borrowed and idle
+    objects, and the total size of the idle objects and the pool's budget in bytes.
+    When a Sketch borrows the same sizes every frame, the number of allocations
+    should stop increasing after the first frame.
+    """
+    return _py5sketch.buffer_pool_stats()
+
+
 ##############################################################################
 # module functions from print_tools.py
 ##############################################################################
@@ -18685,6 +19053,14 @@ def println(
     when running a Sketch through a Jupyter Notebook or an IPython terminal, but may
     be very useful if your print stream writes to a file.
 
+    When running a Sketch through a Jupyter Notebook, the printed text is collected
+    and sent to the notebook in batches several times per second. This keeps a
+    Sketch that prints text in every frame from flooding the notebook with messages
+    and slowing down the Sketch animation. If more than 100 lines are printed
+    between batches, the extra lines will be replaced with a count of the lines not
+    shown. Set the `flush` parameter to `True` to send the collected text right
+    away.
+
     Use `set_println_stream()` to customize the behavior of `println()`.
     """
     return _py5sketch.println(*args, sep=sep, end=end, stderr=stderr, flush=flush)
@@ -18695,6 +19071,64 @@ def println(
 ##############################################################################
 
 
+def set_http_options(
+    *,
+    cache_dir: Union[str, Path] = None,
+    ttl: float = 0.0,
+    retries: int = 3,
+    pool_size: int = 10,
+) -> None:
+    """Configure how `load_json()`, `load_strings()`, and `load_bytes()` download
+    data from URLs.
+
+    Parameters
+    ----------
+
+    cache_dir: Union[str, Path] = None
+        directory to cache downloaded data in
+
+    pool_size: int = 10
+        maximum number of connections to keep open for each host
+
+    retries: int = 3
+        number of times to retry a failed request
+
+    ttl: float = 0.0
+        time in seconds that cached data can be used without checking the server
+
+    Notes
+    -----
+
+    Configure how `load_json()`, `load_strings()`, and `load_bytes()` download
+    data from URLs. All of a Sketch's URL requests share a pool of connections that
+    are kept open so they can be reused. Each thread makes its requests with its own
+    requests library `Session` object, so it is safe to download data from several
+    threads at once. Use the `pool_size` parameter to set the number of connections
+    kept open for each host and the `retries` parameter to set how many times a
+    request that fails because of a connection error or server error will be
+    retried.
+
+    By default downloaded data is not cached. Set the `cache_dir` parameter to a
+    directory to store downloaded data on disk. When the same URL is requested
+    again, py5 will send the server the `ETag` and `Last-Modified` values it
+    received the first time. If the data has not changed, the server will reply
+    without sending the data again and py5 will use the cached copy. This saves
+    bandwidth for Sketches that repeatedly poll the same URLs.
+
+    Use the `ttl` parameter to set the number of seconds cached data can be reused
+    without contacting the server at all. This defaults to `0`, meaning the server
+    is always asked if the data has changed.
+
+    Requests that use keyword arguments other than `params`, `headers`, or
+    `timeout` will not be cached. Responses with a `Cache-Control: no-store` header
+    are never cached, and responses with a `Cache-Control: no-cache` header are
+    always revalidated with the server, even when `ttl` is greater than zero.
+    """
+    return _py5sketch.set_http_options(
+        cache_dir=cache_dir, ttl=ttl, retries=retries, pool_size=pool_size
+    )
+
+
 def load_json(json_path: Union[str, Path], **kwargs: dict[str, Any]) -> Any:
     """Load a JSON data file from a file or URL.
 
@@ -18720,10 +19154,46 @@ def load_json(json_path: Union[str, Path], **kwargs: dict[str, Any]) -> Any:
     `kwargs` parameter) are passed along to that method. When loading JSON data from
     a file, the data is loaded using the Python json library with the `load` method,
     and again any extra keyword arguments are passed along to that method.
+
+    URL requests are made with a shared requests library session that reuses
+    connections and can cache downloaded data on disk. Use `set_http_options()` to
+    configure caching. Use `request_json()` to load JSON data without blocking the
+    animation thread.
     """
     return _py5sketch.load_json(json_path, **kwargs)
 
 
+def request_json(json_path: Union[str, Path], **kwargs: dict[str, Any]) -> Py5Promise:
+    """Use a Py5Promise object to load a JSON data file from a file or URL.
+
+    Parameters
+    ----------
+
+    json_path: Union[str, Path]
+        url or file path for JSON data file
+
+    kwargs: dict[str, Any]
+        keyword arguments
+
+    Notes
+    -----
+
+    Use a Py5Promise object to load a JSON data file from a file or URL. This method
+    provides a convenient alternative to combining `launch_promise_thread()` with
+    `load_json()` to load JSON data. The `kwargs` parameter is passed along to
+    `load_json()`.
+
+    Consider using `request_json()` to load JSON data from within a Sketch's
+    `draw()` function. Using `load_json()` in the `draw()` function would slow down
+    the Sketch animation.
+
+    The returned Py5Promise object has an `is_ready` property that will be `True`
+    when the `result` property contains the loaded data. Before then, the `result`
+    property will be `None`.
+    """
+    return _py5sketch.request_json(json_path, **kwargs)
+
+
 def save_json(
     json_data: Any, filename: Union[str, Path], **kwargs: dict[str, Any]
 ) -> None:
@@ -18802,10 +19272,85 @@ def load_strings(string_path: Union[str, Path], **kwargs: dict[str, Any]) -> lis
     requests library with the `get` method, and any extra keyword arguments (the
     `kwargs` parameter) are passed along to that method. When loading string data
     from a file, the `kwargs` parameter is not used.
+
+    URL requests are made with a shared requests library session that reuses
+    connections and can cache downloaded data on disk. Use `set_http_options()` to
+    configure caching. Use `request_strings()` to load string data without blocking
+    the animation thread. Use `iter_strings()` to read a large file one line at a
+    time.
     """
     return _py5sketch.load_strings(string_path, **kwargs)
 
 
+def request_strings(
+    string_path: Union[str, Path], **kwargs: dict[str, Any]
+) -> Py5Promise:
+    """Use a Py5Promise object to load a list of strings from a file or URL.
+
+    Parameters
+    ----------
+
+    string_path: Union[str, Path]
+        url or file path for string data file
+
+    kwargs: dict[str, Any]
+        keyword arguments
+
+    Notes
+    -----
+
+    Use a Py5Promise object to load a list of strings from a file or URL. This
+    method provides a convenient alternative to combining `launch_promise_thread()`
+    with `load_strings()` to load string data. The `kwargs` parameter is passed
+    along to `load_strings()`.
+
+    Consider using `request_strings()` to load string data from within a Sketch's
+    `draw()` function. Using `load_strings()` in the `draw()` function would slow
+    down the Sketch animation.
+
+    The returned Py5Promise object has an `is_ready` property that will be `True`
+    when the `result` property contains the loaded data. Before then, the `result`
+    property will be `None`.
+    """
+    return _py5sketch.request_strings(string_path, **kwargs)
+
+
+def iter_strings(
+    string_path: Union[str, Path], **kwargs: dict[str, Any]
+) -> Iterator[str]:
+    """Iterate through the lines of a file or URL one string at a time.
+
+    Parameters
+    ----------
+
+    kwargs: dict[str, Any]
+        keyword arguments
+
+    string_path: Union[str, Path]
+        url or file path for string data file
+
+    Notes
+    -----
+
+    Iterate through the lines of a file or URL one string at a time. This is a
+    streaming alternative to `load_strings()` that only keeps one line in memory at
+    a time, making it suitable for replaying very large log files or CSV files that
+    would not fit in memory. The line terminators are removed from each string.
+
+    When reading a file, the path can be in the data directory, relative to the
+    current working directory (`sketch_path()`), or an absolute path. When reading
+    from a URL, the `string_path` parameter must start with `http://` or `https://`.
+    Streamed URL data is never cached. Any extra keyword arguments (the `kwargs`
+    parameter) are passed along to the Python requests library's `get` method. When
+    reading a file, the `kwargs` parameter is not used.
+
+    The file or URL is opened when `iter_strings()` is called, so a missing file or
+    a failed URL request raises an error right away. The file or connection is
+    closed when the iteration completes or the iterator is garbage collected.
+    """
+    return _py5sketch.iter_strings(string_path, **kwargs)
+
+
 def save_strings(
     string_data: list[str], filename: Union[str, Path], *, end: str = "\n"
 ) -> None:
@@ -18840,7 +19385,12 @@ def save_strings(
     return _py5sketch.save_strings(string_data, filename, end=end)
 
 
-def load_bytes(bytes_path: Union[str, Path], **kwargs: dict[str, Any]) -> bytearray:
+def load_bytes(
+    bytes_path: Union[str, Path],
+    *,
+    mmap: bool = False,
+    **kwargs: dict[str, Any],
+) -> Union[bytearray, memoryview]:
     """Load byte data from a file or URL.
 
     Parameters
@@ -18852,6 +19402,9 @@ def load_bytes(bytes_path: Union[str, Path], **kwargs: dict[str, Any]) -> bytear
     kwargs: dict[str, Any]
         keyword arguments
 
+    mmap: bool = False
+        memory-map the file instead of reading it into memory
+
     Notes
     -----
 
@@ -18864,8 +19417,90 @@ def load_bytes(bytes_path: Union[str, Path], **kwargs: dict[str, Any]) -> bytear
     requests library with the `get` method, and any extra keyword arguments (the
     `kwargs` parameter) are passed along to that method. When loading byte data from
     a file, the `kwargs` parameter is not used.
+
+    URL requests are made with a shared requests library session that reuses
+    connections and can cache downloaded data on disk. Use `set_http_options()` to
+    configure caching. Use `request_bytes()` to load byte data without blocking the
+    animation thread.
+
+    Set the `mmap` parameter to `True` to memory-map a file instead of copying its
+    contents into a `bytearray`. The returned read-only `memoryview` is backed by
+    the operating system's page cache, so only the parts of the file that are
+    actually accessed are read from disk. This makes it possible to work with files
+    that are larger than the available memory. Use `np.frombuffer()` to create a
+    numpy array view of the data without copying it. The `mmap` parameter cannot be
+    used when loading from a URL. Use `iter_records()` to read a large file in
+    fixed-size chunks.
+    """
+    return _py5sketch.load_bytes(bytes_path, mmap=mmap, **kwargs)
+
+
+def request_bytes(bytes_path: Union[str, Path], **kwargs: dict[str, Any]) -> Py5Promise:
+    """Use a Py5Promise object to load byte data from a file or URL.
+
+    Parameters
+    ----------
+
+    bytes_path: Union[str, Path]
+        url or file path for bytes data file
+
+    kwargs: dict[str, Any]
+        keyword arguments
+
+    Notes
+    -----
+
+    Use a Py5Promise object to load byte data from a file or URL. This method
+    provides a convenient alternative to combining `launch_promise_thread()` with
+    `load_bytes()` to load byte data. The `kwargs` parameter is passed along to
+    `load_bytes()`.
+
+    Consider using `request_bytes()` to load byte data from within a Sketch's
+    `draw()` function. Using `load_bytes()` in the `draw()` function would slow down
+    the Sketch animation.
+
+    The returned Py5Promise object has an `is_ready` property that will be `True`
+    when the `result` property contains the loaded data. Before then, the `result`
+    property will be `None`.
     """
-    return _py5sketch.load_bytes(bytes_path, **kwargs)
+    return _py5sketch.request_bytes(bytes_path, **kwargs)
+
+
+def iter_records(
+    bytes_path: Union[str, Path], record_size: int, *, offset: int = 0
+) -> Iterator[bytes]:
+    """Iterate through a file one fixed-size record at a time.
+
+    Parameters
+    ----------
+
+    bytes_path: Union[str, Path]
+        file path for bytes data file
+
+    offset: int = 0
+        number of bytes to skip at the beginning of the file
+
+    record_size: int
+        size of each record in bytes
+
+    Notes
+    -----
+
+    Iterate through a file one fixed-size record at a time. This is a streaming
+    alternative to `load_bytes()` for binary files made of fixed-size records, such
+    as sensor logs or raw sample data. The file is read in buffered blocks so only a
+    small, bounded amount of memory is used no matter how large the file is.
+
+    The path can be in the data directory, relative to the current working
+    directory (`sketch_path()`), or an absolute path. Use the `offset` parameter to
+    skip over a file header. If the size of the data after `offset` is not a
+    multiple of `record_size`, the incomplete record at the end of the file is
+    ignored.
+
+    Each record is a `bytes` object. Use Python's `struct` module or
+    `np.frombuffer()` to unpack the record's fields.
+    """
+    return _py5sketch.iter_records(bytes_path, record_size, offset=offset)
 
 
 def save_bytes(bytes_data: Union[bytes, bytearray], filename: Union[str, Path]) -> None:
@@ -18890,6 +19525,38 @@ def save_bytes(bytes_data: Union[bytes, bytearray], filename: Union[str, Path])
     return _py5sketch.save_bytes(bytes_data, filename)
 
 
+def load_numpy(npy_path: Union[str, Path], *, mmap_mode: str = "r") -> npt.NDArray:
+    """Load a numpy array from a `.npy` file.
+
+    Parameters
+    ----------
+
+    mmap_mode: str = "r"
+        numpy memory-map mode, or `None` to read the array into memory
+
+    npy_path: Union[str, Path]
+        file path for numpy array file
+
+    Notes
+    -----
+
+    Load a numpy array from a `.npy` file. The path can be in the data directory,
+    relative to the current working directory (`sketch_path()`), or an absolute
+    path.
+
+    By default the array is memory-mapped in read-only mode, so loading is nearly
+    instantaneous and only the parts of the array that are accessed are read from
+    disk. This makes it possible to use arrays that are larger than the available
+    memory. The `mmap_mode` parameter is passed along to numpy's `np.load()`
+    function. Use `"r+"` to write changes back to the file, `"c"` for a
+    copy-on-write array, or `None` to read the entire array into memory.
+
+    Numpy arrays can be saved to a `.npy` file with numpy's `np.save()` function.
+    Pickled object arrays are not supported.
+    """
+    return _py5sketch.load_numpy(npy_path, mmap_mode=mmap_mode)
+
+
 def load_pickle(pickle_path: Union[str, Path]) -> Any:
     """Load a pickled Python object from a file.
 
@@ -18957,6 +19624,79 @@ def save_pickle(obj: Any, filename: Union[str, Path]) -> None:
     return _py5sketch.save_pickle(obj, filename)
 
 
+def request_assets(
+    manifest: Union[dict[str, Any], str, Path],
+    *,
+    max_workers: int = None,
+) -> Py5Assets:
+    """Load a collection of images, shapes, fonts, shaders, and data files in
+    parallel using a pool of threads.
+
+    Parameters
+    ----------
+
+    manifest: Union[dict[str, Any], str, Path]
+        asset manifest dictionary or path to a TOML or JSON manifest file
+
+    max_workers: int = None
+        maximum number of threads to load assets with
+
+    Notes
+    -----
+
+    Load a collection of images, shapes, fonts, shaders, and data files in parallel
+    using a pool of threads. This method returns right away with a `Py5Assets`
+    object that tracks the loading progress and provides access to the loaded
+    assets. Call this method before running the Sketch or at the beginning of
+    `setup()` instead of loading each asset one at a time so that `draw()` can
+    start running and display the loading progress while the assets load in the
+    background.
+
+    The `manifest` parameter is a dictionary that maps asset names to file paths or
+    URLs, or the path to a TOML or JSON file containing the same information. If
+    the manifest file has an `assets` table, only that part of the file is used.
+    Relative paths in a manifest file are relative to the manifest file's
+    directory. Otherwise, paths are located the same way `load_image()` and the
+    other loading methods locate files.
+
+    The asset type is determined by the file extension. Images can be GIF, JPG,
+    TGA, PNG, BMP, TIFF, or WEBP files. Images that Processing cannot read are
+    decoded with PIL in the background threads. SVG and OBJ files are loaded as
+    shapes, VLW, TTF, and OTF files are loaded as fonts, GLSL, FRAG, and VERT files
+    are loaded as shaders, JSON files are loaded with `load_json()`, TXT and CSV
+    files are loaded with `load_strings()`, NPY files are loaded with
+    `load_numpy()`, and anything else is loaded with `load_bytes()`.
+
+    A manifest entry can also be a dictionary with a `path` key. Use a `type` key
+    to set the asset type explicitly. It can be one of `'image'`, `'shape'`,
+    `'font'`, `'shader'`, `'json'`, `'strings'`, `'numpy'`, or `'bytes'`. Shader
+    entries can use `fragment` and `vertex` keys instead of `path`. Font entries for
+    TTF and OTF files can use a `size` key to set the font size, which defaults to
+    12. Shape entries can use an `options` key for OBJ file loading options. Any
+    other keys in data file entries are passed along to the loading method as
+    keyword arguments.
+
+    The returned `Py5Assets` object's `progress` property is the fraction of the
+    asset data that has finished loading. The `loaded_bytes`, `total_bytes`,
+    `loaded_count`, and `total_count` properties provide more detail, and the
+    `is_ready` property will be `True` when everything has finished loading. Access
+    the loaded assets with `assets['name']` or with the typed `image()`, `shape()`,
+    `font()`, and `shader()` methods. An asset will be `None` until it has finished
+    loading. If an asset failed to load, accessing it will raise the exception
+    that caused the failure. Failed assets are also listed in the `errors`
+    property. Call `wait()` to block until all of the assets have loaded or failed.
+
+    Processing's loading methods are not thread-safe. Images that Processing
+    decodes, shapes, fonts, and shaders are therefore loaded one at a time by a
+    single thread, and only once the Sketch has started running. Data files and
+    images decoded with PIL are loaded in parallel by the pool of threads right
+    away. Calling `stop_all_threads()` cancels the assets that have not started
+    loading. Shaders can only be loaded by Sketches that use the `P2D` or `P3D`
+    renderers.
+    """
+    return _py5sketch.request_assets(manifest, max_workers=max_workers)
+
+
 ##############################################################################
 # module functions from pixels.py
 ##############################################################################
@@ -20252,6 +20992,34 @@ def hot_reload_draw(draw: Callable) -> None:
     return _py5sketch.hot_reload_draw(draw)
 
 
+def register_callback(key: str, func: Union[Callable, None], /) -> None:
+    """Register a callable for Processing Mode's `callPython()` method.
+
+    Parameters
+    ----------
+
+    func: Union[Callable, None]
+        callable to link to key, or None to remove the key
+
+    key: str
+        key used from Processing Mode callPython() method
+
+    Notes
+    -----
+
+    Register a callable for Processing Mode's `callPython()` method. When Java code
+    calls `callPython()` with the `key`, py5 calls `func` right away, without
+    looking up the key in the keys registered with
+    `py5_tools.register_processing_mode_key()` or in the namespace the Sketch was
+    run from. Use this for callables that Java code calls many times per frame.
+    The key can contain dots ("`.`"), but it is matched as a whole.
+
+    Registered callables belong to the Sketch, so this method can be called before
+    or after `run_sketch()`. Pass `None` for `func` to remove a key.
+    """
+    return _py5sketch.register_callback(key, func)
+
+
 def profile_functions(function_names: list[str]) -> None:
     """Profile the execution times of the Sketch's functions with a line profiler.
 
@@ -20383,6 +21151,85 @@ def save_frame(
     )
 
 
+def save_tiled(
+    filename: Union[str, Path],
+    scale: float,
+    tile_size: int,
+    draw_func: Callable[[Py5Graphics], None],
+    *,
+    renderer: str = None,
+    format: str = None,
+    drop_alpha: bool = True,
+) -> None:
+    """Save a high resolution image of a scene by drawing it one tile at a time.
+
+    Parameters
+    ----------
+
+    draw_func: Callable[[Py5Graphics], None]
+        function that draws the scene to the Py5Graphics object it is passed
+
+    drop_alpha: bool = True
+        remove the alpha channel when saving the image
+
+    filename: Union[str, Path]
+        output filename
+
+    format: str = None
+        image format, if not determined from filename extension
+
+    renderer: str = None
+        renderer used to draw each tile
+
+    scale: float
+        ratio of the saved image's size to the Sketch's size
+
+    tile_size: int
+        width and height of each tile in pixels
+
+    Notes
+    -----
+
+    Save a high resolution image of a scene by drawing it one tile at a time. The
+    saved image will be `scale` times the size of the Sketch. This makes it possible
+    to save images that are much larger than the Sketch window or any `Py5Graphics`
+    object that would fit in memory, such as print resolution posters.
+
+    The `draw_func` function is called once for each tile with a `Py5Graphics`
+    object as its only parameter. It should draw the whole scene to that object
+    using the Sketch's coordinates, as if the `Py5Graphics` object was the same size
+    as the Sketch. The transformations needed to draw each part of the scene to the
+    right tile at the right scale are set up before each call, so all of the tiles
+    can be drawn by the same code. The function is called many times, so it must
+    draw the same scene each time, including the background. Any drawing styles set
+    in `draw_func` will be reset before the next tile is drawn.
+
+    Rows of tiles are written to the file while the next row of tiles is drawn. At
+    most three rows of tiles are in memory at once: one being drawn, one waiting to
+    be written, and one being written. Memory use depends on the image's width and
+    the tile size, not on the image's height. If `draw_func` or writing the file
+    raises an exception, the partially written file is deleted. Only PNG and TIFF
+    files are supported. TIFF files are not compressed and are limited to 4 GB.
+
+    By default the tiles are drawn with the default renderer. Use the `renderer`
+    parameter to draw the tiles with a different renderer, such as `P3D`. For 3D
+    scenes each tile gets its part of the Sketch's default perspective projection,
+    so the scene should not change the camera or the projection.
+
+    Use the `drop_alpha` parameter to drop the alpha channel from the image. This
+    defaults to `True`.
+    """
+    return _py5sketch.save_tiled(
+        filename,
+        scale,
+        tile_size,
+        draw_func,
+        renderer=renderer,
+        format=format,
+        drop_alpha=drop_alpha,
+    )
+
+
 def select_folder(prompt: str, callback: Callable, default_folder: str = None) -> None:
     """Opens a file chooser dialog to select a folder.
 
@@ -20762,10 +21609,54 @@ def request_image(image_path: Union[str, Path]) -> Py5Promise:
     The returned Py5Promise object has an `is_ready` property that will be `True`
     when the `result` property contains the value function `f` returned. Before
     then, the `result` property will be `None`.
+
+    To load many images at once, use `request_images()` to load them in parallel
+    with a pool of threads.
     """
     return _py5sketch.request_image(image_path)
 
 
+def request_images(
+    image_paths: Sequence[Union[str, Path]], *, max_workers: int = None
+) -> list[Py5Promise]:
+    """Use a pool of threads to load many images into variables of type `Py5Image`.
+
+    Parameters
+    ----------
+
+    image_paths: Sequence[Union[str, Path]]
+        urls or file paths for image files
+
+    max_workers: int = None
+        maximum number of threads to load images with
+
+    Notes
+    -----
+
+    Use a pool of threads to load many images into variables of type `Py5Image`.
+    This method returns a list of Py5Promise objects, one for each of the paths in
+    `image_paths`, in the same order. The images are loaded in parallel by a bounded
+    pool of threads, which is much faster than calling `load_image()` or
+    `request_image()` for each image one at a time.
+
+    Use the `max_workers` parameter to set the maximum number of threads used to
+    load the images. By default this is based on the number of CPUs your computer
+    has.
+
+    Each Py5Promise object has an `is_ready` property that will be `True` when its
+    `result` property contains the loaded image. Call a Py5Promise's `wait()`
+    method to block until that image is loaded, or pass the Py5Promise objects'
+    `future` properties to `concurrent.futures.wait()` to wait for all of them. An
+    image that has not started loading yet can be skipped by calling its
+    Py5Promise's `cancel()` method.
+
+    The pool of threads is listed by `list_threads()` until all of the images have
+    been loaded. Calling `stop_all_threads()` or exiting the Sketch cancels the
+    images that have not started loading yet.
+    """
+    return _py5sketch.request_images(image_paths, max_workers=max_workers)
+
+
 @overload
 def color_mode(mode: int, /) -> None:
     """Changes the way py5 interprets color data.
@@ -50,6 +50,8 @@ _EXCEPTION_MSGS = {
 
 _JAVA_RUNTIMEEXCEPTION = JClass("java.lang.RuntimeException")
 
+_MISSING = object()
+
 
 def check_run_method_callstack():
     for t in traceback.extract_stack():
@@ -190,6 +192,7 @@ class Py5Bridge:
         self._caller_globals = dict()
         self._functions = dict()
         self._function_param_counts = dict()
+        self._callbacks = dict()
         self._pre_hooks = defaultdict(dict)
         self._post_hooks = defaultdict(dict)
         self._profiler = line_profiler.LineProfiler()
@@ -206,6 +209,10 @@ class Py5Bridge:
         self._caller_locals = locals
         self._caller_globals = globals
 
+    def set_callbacks(self, callbacks):
+        # the Sketch's dict, so callbacks registered later are also found
+        self._callbacks = callbacks
+
     def set_functions(self, functions, function_param_counts):
         self._function_param_counts = dict()
         self._functions = dict()
@@ -318,38 +325,56 @@ class Py5Bridge:
 
     current_running_method = property(fget=_get_current_running_method)
 
+    def _namespaces(self):
+        # in order of precedence
+        return [
+            py5_tools.config._PY5_PROCESSING_MODE_KEYS,
+            self._caller_locals,
+            self._caller_globals,
+        ]
+
+    def _resolve_callable(self, key):
+        # returns the callable or an error message
+        *str_hierarchy, c = key.split(".")
+        key_start = key.split(".")[0]
+
+        for d in self._namespaces():
+            if key_start in d:
+                namespace = d
+                break
+        else:
+            return f"callable {c} not found with key {key}"
+
+        # look up attributes directly. building a dict from dir() for every level
+        # would evaluate every attribute and property of the objects.
+        obj = namespace
+        for s in str_hierarchy:
+            if isinstance(obj, dict):
+                obj = obj.get(s, _MISSING)
+            else:
+                obj = getattr(obj, s, _MISSING)
+            if obj is _MISSING:
+                return f"{s} not found with key {key}"
+
+        func = obj.get(c) if isinstance(obj, dict) else getattr(obj, c, None)
+        if not callable(func):
+            return f"callable {c} not found with key {key}"
+
+        return func
+
+    def _get_callable(self, key):
+        # registered callbacks skip the lookup. other keys are looked up for every
+        # call because any object along the way could be rebound.
+        if (func := self._callbacks.get(key)) is not None:
+            return func
+        return self._resolve_callable(key)
+
     @JOverride
     def call_function(self, key, params):
         try:
             key = str(key)
-            *str_hierarchy, c = key.split(".")
-            key_start = key.split(".")[0]
-
-            if key_start in py5_tools.config._PY5_PROCESSING_MODE_KEYS:
-                d = py5_tools.config._PY5_PROCESSING_MODE_KEYS
-            elif key_start in self._caller_locals:
-                d = self._caller_locals
-            elif key_start in self._caller_globals:
-                d = self._caller_globals
-            else:
-                return _JAVA_RUNTIMEEXCEPTION(f"callable {c} not found with key {key}")
-
-            for s in str_hierarchy:
-                if s in d:
-                    subd = d[s]
-                    if isinstance(subd, dict):
-                        d = subd
-                    elif hasattr(subd, "__dir__") or hasattr(subd, "__dict__"):
-                        d = {k: getattr(subd, k) for k in dir(subd)}
-                    else:
-                        return _JAVA_RUNTIMEEXCEPTION(
-                            f"{s} in key {key} does not map to a dict or an object that can be inspected with dir()"
-                        )
-                else:
-                    return _JAVA_RUNTIMEEXCEPTION(f"{s} not found with key {key}")
-
-            if c not in d or not callable(func := d[c]):
-                return _JAVA_RUNTIMEEXCEPTION(f"callable {c} not found with key {key}")
+            if isinstance(func := self._get_callable(key), str):
+                return _JAVA_RUNTIMEEXCEPTION(func)
 
             try:
                 retval = func(*self._convert_to_python_types(params))
@@ -99,6 +99,21 @@ class Py5Image(PixelPy5ImageMixin, Py5Base):
     def __getattr__(self, name):
         raise AttributeError(spelling.error_msg("Py5Image", name, self))
 
+    def _activate_context_manager(self, exit_function, exit_args):
+        self._context_manager_exit_function = exit_function
+        self._context_manager_exit_args = exit_args
+
+    def __enter__(self):
+        if not (
+            hasattr(self, "_context_manager_exit_function")
+            and hasattr(self, "_context_manager_exit_args")
+        ):
+            raise RuntimeError("Cannot use this Py5Image object as a context manager")
+        return self
+
+    def __exit__(self, *exc):
+        self._context_manager_exit_function(*self._context_manager_exit_args)
+
     ADD = 2
     ALPHA = 4
     ALPHA_MASK = -16777216
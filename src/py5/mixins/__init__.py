@@ -17,6 +17,7 @@
 #   along with this library. If not, see <https://www.gnu.org/licenses/>.
 #
 # *****************************************************************************
+from .buffer_pool import BufferPoolMixin  # noqa
 from .data import DataMixin  # noqa
 from .math import MathMixin  # noqa
 from .pixels import PixelMixin, PixelPy5GraphicsMixin, PixelPy5ImageMixin  # noqa
@@ -0,0 +1,271 @@
+# *****************************************************************************
+#
+#   Part of the py5 library
+#   Copyright (C) 2020-2026 Jim Schmitz
+#
+#   This library is free software: you can redistribute it and/or modify it
+#   under the terms of the GNU Lesser General Public License as published by
+#   the Free Software Foundation, either version 2.1 of the License, or (at
+#   your option) any later version.
+#
+#   This library is distributed in the hope that it will be useful, but
+#   WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser
+#   General Public License for more details.
+#
+#   You should have received a copy of the GNU Lesser General Public License
+#   along with this library. If not, see <https://www.gnu.org/licenses/>.
+#
+# *****************************************************************************
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from jpype import JClass
+
+if TYPE_CHECKING:
+    from ..graphics import Py5Graphics
+    from ..image import Py5Image
+
+_Arrays = JClass("java.util.Arrays")
+
+
+class Py5BufferPool:
+    """Idle Py5Graphics and Py5Image objects waiting to be borrowed again, trimmed
+    in least recently used order to stay within a byte budget."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # id(buffer) -> (key, buffer, nbytes), least recently used first
+        self._idle = OrderedDict()
+        self._idle_by_key = {}
+        # id(buffer) -> key for buffers that are currently borrowed
+        self._borrowed = {}
+        self.default_styles = {}
+        self.idle_bytes = 0
+        self.allocations = 0
+        self.reuses = 0
+
+    def borrow(self, key, create):
+        with self._lock:
+            if ids := self._idle_by_key.get(key):
+                _, buffer, nbytes = self._idle.pop(ids.pop())
+                self.idle_bytes -= nbytes
+                self.reuses += 1
+                reused = True
+            else:
+                buffer = None
+                self.allocations += 1
+                reused = False
+
+        if buffer is None:
+            buffer = create()
+
+        with self._lock:
+            self._borrowed[id(buffer)] = key
+
+        return buffer, reused
+
+    def release(self, buffer):
+        with self._lock:
+            if (key := self._borrowed.pop(id(buffer), None)) is None:
+                return
+            self._idle[id(buffer)] = (key, buffer, _buffer_nbytes(buffer))
+            self._idle_by_key.setdefault(key, []).append(id(buffer))
+            self.idle_bytes += self._idle[id(buffer)][2]
+            self._trim()
+
+    def set_max_bytes(self, max_bytes):
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._trim()
+
+    def stats(self):
+        with self._lock:
+            return dict(
+                allocations=self.allocations,
+                reuses=self.reuses,
+                borrowed_buffers=len(self._borrowed),
+                idle_buffers=len(self._idle),
+                idle_bytes=self.idle_bytes,
+                max_bytes=self.max_bytes,
+            )
+
+    def _trim(self):
+        while self._idle and self.idle_bytes > self.max_bytes:
+            buffer_id, (key, _, nbytes) = self._idle.popitem(last=False)
+            self._idle_by_key[key].remove(buffer_id)
+            if not self._idle_by_key[key]:
+                self._idle_by_key.pop(key)
+            self.idle_bytes -= nbytes
+
+
+def _buffer_nbytes(buffer):
+    # the Java pixels plus the numpy pixels, if they have been used
+    nbytes = buffer.pixel_width * buffer.pixel_height * 4
+    if buffer._np_pixels is not None:
+        nbytes *= 2
+    return nbytes
+
+
+class BufferPoolMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._py5buffer_pool = Py5BufferPool(256 * 1024 * 1024)
+
+    # *** BEGIN METHODS ***
+
+    def borrow_graphics(
+        self, w: int, h: int, renderer: str = None, *, clear: bool = True
+    ) -> Py5Graphics:
+        """Borrow a `Py5Graphics` object from the Sketch's buffer pool.
+
+        Parameters
+        ----------
+
+        clear: bool = True
+            reset the graphics object's pixels and drawing styles
+
+        h: int
+            height in pixels
+
+        renderer: str = None
+            renderer for the graphics object
+
+        w: int
+            width in pixels
+
+        Notes
+        -----
+
+        Borrow a `Py5Graphics` object from the Sketch's buffer pool. Use this with a
+        `with` statement to get a `Py5Graphics` object for temporary drawing, such as a
+        blur pass, a mask, or compositing. At the end of the `with` block the object is
+        returned to the pool so it can be borrowed again.
+
+        Creating new graphics objects with `create_graphics()` in `draw()` allocates
+        new memory for every frame. Borrowing them from the pool instead reuses
+        graphics objects of the same size, renderer, and pixel density, including the
+        memory used by `Py5Graphics.load_np_pixels()`. After the first frame, a Sketch
+        that borrows the same sizes every frame will not allocate any new memory for
+        them.
+
+        By default a reused graphics object's pixels are made transparent and its
+        drawing styles are reset, just like a new graphics object. Set `clear` to
+        `False` to skip this if your code will draw over all of the pixels and set all
+        of the styles it uses. Don't keep a reference to the borrowed object after the
+        `with` block ends because it might be given to other code.
+
+        Idle graphics objects in the pool are discarded in least recently used order
+        when their total size exceeds the pool's budget. Use
+        `set_buffer_pool_budget()` to change that budget and `buffer_pool_stats()` to
+        see how the pool is used."""
+        pixel_density = self.pixel_width // max(1, self.width)
+        key = ("graphics", w, h, renderer, pixel_density)
+        g, reused = self._py5buffer_pool.borrow(
+            key,
+            lambda: (
+                self.create_graphics(w, h, renderer)
+                if renderer
+                else self.create_graphics(w, h)
+            ),
+        )
+
+        if not reused:
+            # keep the initial drawing styles so they can be restored later
+            g.begin_draw()
+            self._py5buffer_pool.default_styles[key] = g._instance.getStyle()
+            g.end_draw()
+        elif clear:
+            g.begin_draw()
+            g._instance.style(self._py5buffer_pool.default_styles[key])
+            g.clear()
+            g.end_draw()
+
+        g._activate_context_manager(self._py5buffer_pool.release, (g,))
+        return g
+
+    def borrow_image(
+        self, w: int, h: int, format: int = None, *, clear: bool = True
+    ) -> Py5Image:
+        """Borrow a `Py5Image` object from the Sketch's buffer pool.
+
+        Parameters
+        ----------
+
+        clear: bool = True
+            set all of the image's pixels to zero
+
+        format: int = None
+            image format, either RGB, ARGB, or ALPHA
+
+        h: int
+            height in pixels
+
+        w: int
+            width in pixels
+
+        Notes
+        -----
+
+        Borrow a `Py5Image` object from the Sketch's buffer pool. Use this with a
+        `with` statement to get a `Py5Image` object for temporary use. At the end of
+        the `with` block the image is returned to the pool so it can be borrowed
+        again. The `format` parameter defaults to `RGB`.
+
+        This works the same way as `borrow_graphics()`. Images are reused if they have
+        the same size and format. By default the pixels of a reused image are set to
+        zero, which is transparent black for `ARGB` images. Set `clear` to `False` to
+        skip this if your code will set all of the pixels."""
+        if format is None:
+            format = self.RGB
+        key = ("image", w, h, format)
+        img, reused = self._py5buffer_pool.borrow(
+            key, lambda: self.create_image(w, h, format)
+        )
+
+        if reused and clear:
+            img.load_pixels()
+            _Arrays.fill(img._instance.pixels, 0)
+            img.update_pixels()
+
+        img._activate_context_manager(self._py5buffer_pool.release, (img,))
+        return img
+
+    def set_buffer_pool_budget(self, max_bytes: int) -> None:
+        """Set the maximum total size of the idle objects in the Sketch's buffer pool.
+
+        Parameters
+        ----------
+
+        max_bytes: int
+            maximum size in bytes
+
+        Notes
+        -----
+
+        Set the maximum total size of the idle objects in the Sketch's buffer pool.
+        Objects borrowed with `borrow_graphics()` or `borrow_image()` are kept in the
+        pool after they are returned so they can be borrowed again. When the total size
+        of those idle objects exceeds this budget, the least recently used objects are
+        discarded. The size of each object is 4 bytes per pixel, doubled if its numpy
+        pixels have been used. The default budget is 256 MB. Set the budget to 0 to
+        empty the pool."""
+        self._py5buffer_pool.set_max_bytes(max_bytes)
+
+    def buffer_pool_stats(self) -> dict[str, Any]:
+        """Get statistics about the Sketch's buffer pool.
+
+        Notes
+        -----
+
+        Get statistics about the Sketch's buffer pool. The returned dictionary contains
+        the number of objects created for `borrow_graphics()` and `borrow_image()`, the
+        number of times an object was reused instead, the number of borrowed and idle
+        objects, and the total size of the idle objects and the pool's budget in bytes.
+        When a Sketch borrows the same sizes every frame, the number of allocations
+        should stop increasing after the first frame."""
+        return self._py5buffer_pool.stats()
@@ -19,20 +19,540 @@
 # *****************************************************************************
 from __future__ import annotations
 
+import concurrent.futures
+import hashlib
 import json
+import mmap as _mmap
+import os
 import pickle
 import re
+import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Any, Union
+from typing import TYPE_CHECKING, Any, Iterator, Union
 
+import numpy as np
+import numpy.typing as npt
 import requests
+from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .threads import Py5Promise
+
+if TYPE_CHECKING:
+    from ..font import Py5Font
+    from ..image import Py5Image
+    from ..shader import Py5Shader
+    from ..shape import Py5Shape
+
+
+class Py5HttpSession:
+    """Pooled http session with an optional on-disk cache for GET requests.
+
+    Each thread gets its own requests Session because Session objects are not
+    thread-safe. The Sessions share one adapter, and therefore one connection pool,
+    which is thread-safe."""
+
+    def __init__(self, cache_dir=None, ttl=0.0, retries=3, pool_size=10):
+        self._local = threading.local()
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=0.1,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=["GET"],
+                raise_on_status=False,
+            ),
+        )
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.ttl = ttl
+
+    @property
+    def session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", self._adapter)
+            session.mount("https://", self._adapter)
+            self._local.session = session
+        return session
+
+    def close(self):
+        self._adapter.close()
+
+    def get(self, url, error_msg, **kwargs):
+        # only requests that are fully described by the url, params, and headers
+        # can be safely cached
+        if self.cache_dir is None or set(kwargs) - {"params", "headers", "timeout"}:
+            response = self.session.get(url, **kwargs)
+            if response.status_code != 200:
+                raise RuntimeError(error_msg + response.reason)
+            return response.content, response.encoding
+
+        key = hashlib.sha256(
+            json.dumps(
+                [url, kwargs.get("params"), kwargs.get("headers")],
+                sort_keys=True,
+                default=str,
+            ).encode("utf-8")
+        ).hexdigest()
+        meta_path = self.cache_dir / (key + ".json")
+        body_path = self.cache_dir / (key + ".body")
+
+        meta = None
+        if meta_path.exists() and body_path.exists():
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf8"))
+            except Exception:
+                meta = None
+
+        if meta is not None:
+            if not meta.get("no_cache") and time.time() - meta["time"] < self.ttl:
+                return body_path.read_bytes(), meta["encoding"]
+            headers = dict(kwargs.get("headers") or {})
+            if meta["etag"]:
+                headers["If-None-Match"] = meta["etag"]
+            if meta["last_modified"]:
+                headers["If-Modified-Since"] = meta["last_modified"]
+            kwargs = {**kwargs, "headers": headers}
+
+        response = self.session.get(url, **kwargs)
+        if meta is not None and response.status_code == 304:
+            meta["time"] = time.time()
+            self._write(meta_path, json.dumps(meta).encode("utf-8"))
+            return body_path.read_bytes(), meta["encoding"]
+        if response.status_code != 200:
+            raise RuntimeError(error_msg + response.reason)
+
+        cache_control = {
+            directive.split("=")[0].strip().lower()
+            for directive in response.headers.get("Cache-Control", "").split(",")
+        }
+        if "no-store" in cache_control:
+            meta_path.unlink(missing_ok=True)
+            body_path.unlink(missing_ok=True)
+            return response.content, response.encoding
+
+        # no-cache responses can be stored but must be revalidated before every use
+        no_cache = "no-cache" in cache_control
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified or (self.ttl > 0 and not no_cache):
+            meta = dict(
+                url=url,
+                etag=etag,
+                last_modified=last_modified,
+                encoding=response.encoding,
+                no_cache=no_cache,
+                time=time.time(),
+            )
+            self._write(body_path, response.content)
+            self._write(meta_path, json.dumps(meta).encode("utf-8"))
+
+        return response.content, response.encoding
+
+    def iter_lines(self, url, error_msg, **kwargs):
+        # streamed responses are never cached
+        response = self.session.get(url, stream=True, **kwargs)
+        if response.status_code != 200:
+            response.close()
+            raise RuntimeError(error_msg + response.reason)
+        response.encoding = response.encoding or "utf-8"
+
+        def _iter_lines():
+            with response:
+                yield from response.iter_lines(decode_unicode=True)
+
+        return _iter_lines()
+
+    def _write(self, path, data):
+        # write to a temporary file first so other threads never see partial data
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+
+def _decode_text(content, encoding):
+    # decode the same way as requests' Response.text, detecting the encoding if the
+    # server did not provide one
+    response = requests.models.Response()
+    response._content = content
+    response.encoding = encoding
+    return response.text
+
+
+_ASSET_TYPE_EXTENSIONS = {
+    "image": [
+        ".gif",
+        ".jpg",
+        ".jpeg",
+        ".tga",
+        ".png",
+        ".bmp",
+        ".tif",
+        ".tiff",
+        ".webp",
+    ],
+    "shape": [".svg", ".obj"],
+    "font": [".vlw", ".ttf", ".otf"],
+    "shader": [".glsl", ".frag", ".vert"],
+    "json": [".json"],
+    "strings": [".txt", ".csv"],
+    "numpy": [".npy"],
+}
+
+# image formats Processing can decode itself. others are decoded with PIL.
+_PROCESSING_IMAGE_EXTENSIONS = [".gif", ".jpg", ".jpeg", ".tga", ".png"]
+
+
+class Py5Assets:
+    """Collection of assets loaded in parallel from an asset manifest."""
+
+    def __init__(self, sketch, manifest, max_workers=None):
+        self._sketch = sketch
+        self._specs = {}
+        if isinstance(manifest, dict):
+            base_dir = None
+        else:
+            manifest_path = sketch._find_data_file(manifest)
+            base_dir = manifest_path.parent
+            manifest = Py5Assets._read_manifest(manifest_path)
+        for name, spec in manifest.items():
+            self._specs[name] = self._parse_spec(name, spec, base_dir)
+
+        self._lock = threading.Lock()
+        self._sizes = {
+            name: self._asset_size(spec) for name, spec in self._specs.items()
+        }
+        self._total_bytes = sum(self._sizes.values())
+        self._loaded_bytes = 0
+        self._loaded_count = 0
+
+        # Processing's loading methods are not thread-safe, so those assets are
+        # loaded one at a time by a single thread after the Sketch has started
+        processing_names = [
+            name for name, spec in self._specs.items() if self._uses_processing(spec)
+        ]
+        names = [name for name in self._specs if name not in processing_names]
+        self._processing_pool = None
+        self._processing_pool = sketch._launch_promise_pool(
+            self._load_with_processing, [(name,) for name in processing_names], 1
+        )
+        pool = sketch._launch_promise_pool(
+            self._load,
+            [(name,) for name in names],
+            max_workers or min(32, (os.cpu_count() or 1) + 4),
+        )
+        promises = dict(zip(processing_names, self._processing_pool.promises))
+        promises.update(zip(names, pool.promises))
+        # keep the manifest order
+        self._promises = {name: promises[name] for name in self._specs}
+        for name, promise in self._promises.items():
+            promise.add_done_callback(lambda _, name=name: self._finished(name))
+
+    @staticmethod
+    def _read_manifest(manifest_path):
+        if manifest_path.suffix.lower() == ".toml":
+            try:
+                import tomllib
+            except ImportError:
+                raise RuntimeError("TOML asset manifests require Python 3.11 or newer")
+            with open(manifest_path, "rb") as f:
+                manifest = tomllib.load(f)
+        elif manifest_path.suffix.lower() == ".json":
+            with open(manifest_path, "r", encoding="utf8") as f:
+                manifest = json.load(f)
+        else:
+            raise RuntimeError(
+                "asset manifest file " + str(manifest_path) + " must be TOML or JSON"
+            )
+        return manifest.get("assets", manifest)
+
+    @staticmethod
+    def _parse_spec(name, spec, base_dir):
+        if isinstance(spec, (str, Path)):
+            spec = {"path": spec}
+        else:
+            spec = dict(spec)
+        path_keys = [k for k in ["path", "fragment", "vertex"] if k in spec]
+        if not path_keys:
+            raise RuntimeError(f"asset {name} must have a path")
+
+        # paths in a manifest file are relative to the manifest file's directory
+        for k in path_keys:
+            if (
+                base_dir is not None
+                and not re.match(r"https?://", str(spec[k]).lower())
+                and (base_dir / spec[k]).exists()
+            ):
+                spec[k] = base_dir / spec[k]
+
+        if "type" not in spec:
+            suffix = Path(str(spec[path_keys[0]])).suffix.lower()
+            spec["type"] = next(
+                (t for t, exts in _ASSET_TYPE_EXTENSIONS.items() if suffix in exts),
+                "bytes",
+            )
+        if spec["type"] not in [*_ASSET_TYPE_EXTENSIONS, "bytes"]:
+            raise RuntimeError(f"asset {name} has unknown type {spec['type']}")
+
+        return spec
+
+    def _asset_size(self, spec):
+        size = 0
+        for k in ["path", "fragment", "vertex"]:
+            if k in spec and not re.match(r"https?://", str(spec[k]).lower()):
+                try:
+                    size += os.path.getsize(self._sketch._find_data_file(spec[k]))
+                except Exception:
+                    # missing files are reported when they are loaded
+                    pass
+        return size
+
+    @staticmethod
+    def _uses_processing(spec):
+        if spec["type"] == "image":
+            path = spec["path"]
+            return (
+                isinstance(path, str) and re.match(r"https?://", path.lower())
+            ) or Path(path).suffix.lower() in _PROCESSING_IMAGE_EXTENSIONS
+        return spec["type"] in ["shape", "font", "shader"]
+
+    def _load_with_processing(self, name):
+        sketch = self._sketch
+        while sketch.is_ready:
+            # the pool has not been assigned yet if the first call starts right away
+            if (
+                self._processing_pool is not None
+                and self._processing_pool.stopped.is_set()
+            ):
+                raise RuntimeError(
+                    f"asset {name} was not loaded before the threads were stopped"
+                )
+            time.sleep(0.05)
+        if sketch.is_dead:
+            raise RuntimeError(f"asset {name} was not loaded before the Sketch exited")
+        return self._load(name)
+
+    def _load(self, name):
+        sketch = self._sketch
+        spec = dict(self._specs[name])
+        asset_type = spec.pop("type")
+        path = spec.pop("path", None)
+
+        if asset_type == "image":
+            if self._uses_processing(self._specs[name]):
+                return sketch.load_image(path)
+            # decode everything else with PIL here instead of on the animation thread
+            with Image.open(sketch._find_data_file(path)) as img:
+                array = np.asarray(img.convert("RGBA"))
+            return sketch.create_image_from_numpy(array, "RGBA")
+        elif asset_type == "shape":
+            if "options" in spec:
+                return sketch.load_shape(str(path), spec["options"])
+            return sketch.load_shape(str(path))
+        elif asset_type == "font":
+            if Path(path).suffix.lower() == ".vlw":
+                return sketch.load_font(str(path))
+            return sketch.create_font(str(path), spec.get("size", 12))
+        elif asset_type == "shader":
+            fragment = spec.get("fragment", path)
+            if "vertex" in spec:
+                return sketch.load_shader(str(fragment), str(spec["vertex"]))
+            return sketch.load_shader(str(fragment))
+        elif asset_type == "json":
+            return sketch.load_json(path, **spec)
+        elif asset_type == "strings":
+            return sketch.load_strings(path, **spec)
+        elif asset_type == "numpy":
+            return sketch.load_numpy(path, **spec)
+        else:
+            return sketch.load_bytes(path, **spec)
+
+    def _finished(self, name):
+        with self._lock:
+            self._loaded_bytes += self._sizes[name]
+            self._loaded_count += 1
+
+    def _get_typed(self, name, asset_type):
+        if self._specs[name]["type"] != asset_type:
+            raise RuntimeError(
+                f"asset {name} is a {self._specs[name]['type']} asset, not a {asset_type} asset"
+            )
+        return self[name]
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._specs)
+
+    @property
+    def is_ready(self) -> bool:
+        return all(p.done() for p in self._promises.values())
+
+    @property
+    def loaded_count(self) -> int:
+        return self._loaded_count
+
+    @property
+    def total_count(self) -> int:
+        return len(self._specs)
+
+    @property
+    def loaded_bytes(self) -> int:
+        return self._loaded_bytes
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    @property
+    def progress(self) -> float:
+        if self._total_bytes:
+            return self._loaded_bytes / self._total_bytes
+        return self._loaded_count / len(self._specs) if self._specs else 1.0
+
+    @property
+    def errors(self) -> dict[str, BaseException]:
+        errors = {}
+        for name, p in self._promises.items():
+            if not p.done():
+                continue
+            try:
+                e = p.exception()
+            except concurrent.futures.CancelledError as ce:
+                e = ce
+            if e is not None:
+                errors[name] = e
+        return errors
+
+    def promise(self, name: str) -> Py5Promise:
+        return self._promises[name]
+
+    def wait(self, timeout: float = None) -> None:
+        # failed and cancelled assets are reported by the errors property instead
+        concurrent.futures.wait([p.future for p in self._promises.values()], timeout)
+
+    def image(self, name: str) -> Py5Image:
+        return self._get_typed(name, "image")
+
+    def shape(self, name: str) -> Py5Shape:
+        return self._get_typed(name, "shape")
+
+    def font(self, name: str) -> Py5Font:
+        return self._get_typed(name, "font")
+
+    def shader(self, name: str) -> Py5Shader:
+        return self._get_typed(name, "shader")
+
+    def __getitem__(self, name: str) -> Any:
+        return self._promises[name].result
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._specs
+
+    def __iter__(self):
+        return iter(self._specs)
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def __repr__(self) -> str:
+        return f"Py5Assets(loaded={self._loaded_count}/{len(self._specs)})"
 
 
 class DataMixin:
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._py5_http_session = None
+
+    def _get_http_session(self):
+        if self._py5_http_session is None:
+            self._py5_http_session = Py5HttpSession()
+        return self._py5_http_session
+
+    def _shutdown(self):
+        if self._py5_http_session is not None:
+            self._py5_http_session.close()
+        super()._shutdown()
+
+    def _find_data_file(self, file_path):
+        path = Path(file_path)
+        if not path.is_absolute():
+            cwd = self.sketch_path()
+            if (cwd / "data" / file_path).exists():
+                path = cwd / "data" / file_path
+            else:
+                path = cwd / file_path
+        if not path.exists():
+            raise RuntimeError("Unable to find file " + str(file_path))
+        return path
 
     # *** BEGIN METHODS ***
+    def set_http_options(
+        self,
+        *,
+        cache_dir: Union[str, Path] = None,
+        ttl: float = 0.0,
+        retries: int = 3,
+        pool_size: int = 10,
+    ) -> None:
+        """Configure how `load_json()`, `load_strings()`, and `load_bytes()` download
+        data from URLs.
+
+        Parameters
+        ----------
+
+        cache_dir: Union[str, Path] = None
+            directory to cache downloaded data in
+
+        pool_size: int = 10
+            maximum number of connections to keep open for each host
+
+        retries: int = 3
+            number of times to retry a failed request
+
+        ttl: float = 0.0
+            time in seconds that cached data can be used without checking the server
+
+        Notes
+        -----
+
+        Configure how `load_json()`, `load_strings()`, and `load_bytes()` download
+        data from URLs. All of a Sketch's URL requests share a pool of connections that
+        are kept open so they can be reused. Each thread makes its requests with its own
+        requests library `Session` object, so it is safe to download data from several
+        threads at once. Use the `pool_size` parameter to set the number of connections
+        kept open for each host and the `retries` parameter to set how many times a
+        request that fails because of a connection error or server error will be
+        retried.
+
+        By default downloaded data is not cached. Set the `cache_dir` parameter to a
+        directory to store downloaded data on disk. When the same URL is requested
+        again, py5 will send the server the `ETag` and `Last-Modified` values it
+        received the first time. If the data has not changed, the server will reply
+        without sending the data again and py5 will use the cached copy. This saves
+        bandwidth for Sketches that repeatedly poll the same URLs.
+
+        Use the `ttl` parameter to set the number of seconds cached data can be reused
+        without contacting the server at all. This defaults to `0`, meaning the server
+        is always asked if the data has changed.
+
+        Requests that use keyword arguments other than `params`, `headers`, or
+        `timeout` will not be cached. Responses with a `Cache-Control: no-store` header
+        are never cached, and responses with a `Cache-Control: no-cache` header are
+        always revalidated with the server, even when `ttl` is greater than zero."""
+        if self._py5_http_session is not None:
+            self._py5_http_session.close()
+        self._py5_http_session = Py5HttpSession(
+            cache_dir=cache_dir, ttl=ttl, retries=retries, pool_size=pool_size
+        )
+
     def load_json(self, json_path: Union[str, Path], **kwargs: dict[str, Any]) -> Any:
         """Load a JSON data file from a file or URL.
 
@@ -57,13 +577,17 @@ class DataMixin:
         requests library with the `get` method, and any extra keyword arguments (the
         `kwargs` parameter) are passed along to that method. When loading JSON data from
         a file, the data is loaded using the Python json library with the `load` method,
-        and again any extra keyword arguments are passed along to that method."""
+        and again any extra keyword arguments are passed along to that method.
+
+        URL requests are made with a shared requests library session that reuses
+        connections and can cache downloaded data on disk. Use `set_http_options()` to
+        configure caching. Use `request_json()` to load JSON data without blocking the
+        animation thread."""
         if isinstance(json_path, str) and re.match(r"https?://", json_path.lower()):
-            response = requests.get(json_path, **kwargs)
-            if response.status_code == 200:
-                return response.json()
-            else:
-                raise RuntimeError("Unable to download JSON URL: " + response.reason)
+            content, _ = self._get_http_session().get(
+                json_path, "Unable to download JSON URL: ", **kwargs
+            )
+            return json.loads(content)
         else:
             path = Path(json_path)
             if not path.is_absolute():
@@ -78,6 +602,39 @@ class DataMixin:
             else:
                 raise RuntimeError("Unable to find JSON file " + str(json_path))
 
+    def request_json(
+        self, json_path: Union[str, Path], **kwargs: dict[str, Any]
+    ) -> Py5Promise:
+        """Use a Py5Promise object to load a JSON data file from a file or URL.
+
+        Parameters
+        ----------
+
+        json_path: Union[str, Path]
+            url or file path for JSON data file
+
+        kwargs: dict[str, Any]
+            keyword arguments
+
+        Notes
+        -----
+
+        Use a Py5Promise object to load a JSON data file from a file or URL. This method
+        provides a convenient alternative to combining `launch_promise_thread()` with
+        `load_json()` to load JSON data. The `kwargs` parameter is passed along to
+        `load_json()`.
+
+        Consider using `request_json()` to load JSON data from within a Sketch's
+        `draw()` function. Using `load_json()` in the `draw()` function would slow down
+        the Sketch animation.
+
+        The returned Py5Promise object has an `is_ready` property that will be `True`
+        when the `result` property contains the loaded data. Before then, the `result`
+        property will be `None`."""
+        return self.launch_promise_thread(
+            self.load_json, args=(json_path,), kwargs=kwargs
+        )
+
     def save_json(
         self, json_data: Any, filename: Union[str, Path], **kwargs: dict[str, Any]
     ) -> None:
@@ -161,13 +718,18 @@ class DataMixin:
         When loading string data from a URL, the data is retrieved using the Python
         requests library with the `get` method, and any extra keyword arguments (the
         `kwargs` parameter) are passed along to that method. When loading string data
-        from a file, the `kwargs` parameter is not used."""
+        from a file, the `kwargs` parameter is not used.
+
+        URL requests are made with a shared requests library session that reuses
+        connections and can cache downloaded data on disk. Use `set_http_options()` to
+        configure caching. Use `request_strings()` to load string data without blocking
+        the animation thread. Use `iter_strings()` to read a large file one line at a
+        time."""
         if isinstance(string_path, str) and re.match(r"https?://", string_path.lower()):
-            response = requests.get(string_path, **kwargs)
-            if response.status_code == 200:
-                return response.text.splitlines()
-            else:
-                raise RuntimeError("Unable to download URL: " + response.reason)
+            content, encoding = self._get_http_session().get(
+                string_path, "Unable to download URL: ", **kwargs
+            )
+            return _decode_text(content, encoding).splitlines()
         else:
             path = Path(string_path)
             if not path.is_absolute():
@@ -182,6 +744,85 @@ class DataMixin:
             else:
                 raise RuntimeError("Unable to find file " + str(string_path))
 
+    def request_strings(
+        self, string_path: Union[str, Path], **kwargs: dict[str, Any]
+    ) -> Py5Promise:
+        """Use a Py5Promise object to load a list of strings from a file or URL.
+
+        Parameters
+        ----------
+
+        string_path: Union[str, Path]
+            url or file path for string data file
+
+        kwargs: dict[str, Any]
+            keyword arguments
+
+        Notes
+        -----
+
+        Use a Py5Promise object to load a list of strings from a file or URL. This
+        method provides a convenient alternative to combining `launch_promise_thread()`
+        with `load_strings()` to load string data. The `kwargs` parameter is passed
+        along to `load_strings()`.
+
+        Consider using `request_strings()` to load string data from within a Sketch's
+        `draw()` function. Using `load_strings()` in the `draw()` function would slow
+        down the Sketch animation.
+
+        The returned Py5Promise object has an `is_ready` property that will be `True`
+        when the `result` property contains the loaded data. Before then, the `result`
+        property will be `None`."""
+        return self.launch_promise_thread(
+            self.load_strings, args=(string_path,), kwargs=kwargs
+        )
+
+    def iter_strings(
+        self, string_path: Union[str, Path], **kwargs: dict[str, Any]
+    ) -> Iterator[str]:
+        """Iterate through the lines of a file or URL one string at a time.
+
+        Parameters
+        ----------
+
+        kwargs: dict[str, Any]
+            keyword arguments
+
+        string_path: Union[str, Path]
+            url or file path for string data file
+
+        Notes
+        -----
+
+        Iterate through the lines of a file or URL one string at a time. This is a
+        streaming alternative to `load_strings()` that only keeps one line in memory at
+        a time, making it suitable for replaying very large log files or CSV files that
+        would not fit in memory. The line terminators are removed from each string.
+
+        When reading a file, the path can be in the data directory, relative to the
+        current working directory (`sketch_path()`), or an absolute path. When reading
+        from a URL, the `string_path` parameter must start with `http://` or `https://`.
+        Streamed URL data is never cached. Any extra keyword arguments (the `kwargs`
+        parameter) are passed along to the Python requests library's `get` method. When
+        reading a file, the `kwargs` parameter is not used.
+
+        The file or URL is opened when `iter_strings()` is called, so a missing file or
+        a failed URL request raises an error right away. The file or connection is
+        closed when the iteration completes or the iterator is garbage collected."""
+        if isinstance(string_path, str) and re.match(r"https?://", string_path.lower()):
+            return self._get_http_session().iter_lines(
+                string_path, "Unable to download URL: ", **kwargs
+            )
+        else:
+            path = self._find_data_file(string_path)
+
+            def _iter_strings():
+                with open(path, "r", encoding="utf8") as f:
+                    for line in f:
+                        yield line[:-1] if line.endswith("\n") else line
+
+            return _iter_strings()
+
     def save_strings(
         self, string_data: list[str], filename: Union[str, Path], *, end: str = "\n"
     ) -> None:
@@ -221,8 +862,12 @@ class DataMixin:
             f.write(end.join(str(s) for s in string_data))
 
     def load_bytes(
-        self, bytes_path: Union[str, Path], **kwargs: dict[str, Any]
-    ) -> bytearray:
+        self,
+        bytes_path: Union[str, Path],
+        *,
+        mmap: bool = False,
+        **kwargs: dict[str, Any],
+    ) -> Union[bytearray, memoryview]:
         """Load byte data from a file or URL.
 
         Parameters
@@ -234,6 +879,9 @@ class DataMixin:
         kwargs: dict[str, Any]
             keyword arguments
 
+        mmap: bool = False
+            memory-map the file instead of reading it into memory
+
         Notes
         -----
 
@@ -245,26 +893,119 @@ class DataMixin:
         When loading byte data from a URL, the data is retrieved using the Python
         requests library with the `get` method, and any extra keyword arguments (the
         `kwargs` parameter) are passed along to that method. When loading byte data from
-        a file, the `kwargs` parameter is not used."""
+        a file, the `kwargs` parameter is not used.
+
+        URL requests are made with a shared requests library session that reuses
+        connections and can cache downloaded data on disk. Use `set_http_options()` to
+        configure caching. Use `request_bytes()` to load byte data without blocking the
+        animation thread.
+
+        Set the `mmap` parameter to `True` to memory-map a file instead of copying its
+        contents into a `bytearray`. The returned read-only `memoryview` is backed by
+        the operating system's page cache, so only the parts of the file that are
+        actually accessed are read from disk. This makes it possible to work with files
+        that are larger than the available memory. Use `np.frombuffer()` to create a
+        numpy array view of the data without copying it. The `mmap` parameter cannot be
+        used when loading from a URL. Use `iter_records()` to read a large file in
+        fixed-size chunks."""
         if isinstance(bytes_path, str) and re.match(r"https?://", bytes_path.lower()):
-            response = requests.get(bytes_path, **kwargs)
-            if response.status_code == 200:
-                return bytearray(response.content)
-            else:
-                raise RuntimeError("Unable to download URL: " + response.reason)
+            if mmap:
+                raise RuntimeError("URL data cannot be memory-mapped")
+            content, _ = self._get_http_session().get(
+                bytes_path, "Unable to download URL: ", **kwargs
+            )
+            return bytearray(content)
         else:
-            path = Path(bytes_path)
-            if not path.is_absolute():
-                cwd = self.sketch_path()
-                if (cwd / "data" / bytes_path).exists():
-                    path = cwd / "data" / bytes_path
-                else:
-                    path = cwd / bytes_path
-            if path.exists():
-                with open(path, "rb") as f:
+            path = self._find_data_file(bytes_path)
+            with open(path, "rb") as f:
+                if not mmap:
                     return bytearray(f.read())
-            else:
-                raise RuntimeError("Unable to find file " + str(bytes_path))
+                if os.fstat(f.fileno()).st_size == 0:
+                    # empty files cannot be memory-mapped
+                    return memoryview(b"")
+                return memoryview(_mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ))
+
+    def request_bytes(
+        self, bytes_path: Union[str, Path], **kwargs: dict[str, Any]
+    ) -> Py5Promise:
+        """Use a Py5Promise object to load byte data from a file or URL.
+
+        Parameters
+        ----------
+
+        bytes_path: Union[str, Path]
+            url or file path for bytes data file
+
+        kwargs: dict[str, Any]
+            keyword arguments
+
+        Notes
+        -----
+
+        Use a Py5Promise object to load byte data from a file or URL. This method
+        provides a convenient alternative to combining `launch_promise_thread()` with
+        `load_bytes()` to load byte data. The `kwargs` parameter is passed along to
+        `load_bytes()`.
+
+        Consider using `request_bytes()` to load byte data from within a Sketch's
+        `draw()` function. Using `load_bytes()` in the `draw()` function would slow down
+        the Sketch animation.
+
+        The returned Py5Promise object has an `is_ready` property that will be `True`
+        when the `result` property contains the loaded data. Before then, the `result`
+        property will be `None`."""
+        return self.launch_promise_thread(
+            self.load_bytes, args=(bytes_path,), kwargs=kwargs
+        )
+
+    def iter_records(
+        self, bytes_path: Union[str, Path], record_size: int, *, offset: int = 0
+    ) -> Iterator[bytes]:
+        """Iterate through a file one fixed-size record at a time.
+
+        Parameters
+        ----------
+
+        bytes_path: Union[str, Path]
+            file path for bytes data file
+
+        offset: int = 0
+            number of bytes to skip at the beginning of the file
+
+        record_size: int
+            size of each record in bytes
+
+        Notes
+        -----
+
+        Iterate through a file one fixed-size record at a time. This is a streaming
+        alternative to `load_bytes()` for binary files made of fixed-size records, such
+        as sensor logs or raw sample data. The file is read in buffered blocks so only a
+        small, bounded amount of memory is used no matter how large the file is.
+
+        The path can be in the data directory, relative to the current working
+        directory (`sketch_path()`), or an absolute path. Use the `offset` parameter to
+        skip over a file header. If the size of the data after `offset` is not a
+        multiple of `record_size`, the incomplete record at the end of the file is
+        ignored.
+
+        Each record is a `bytes` object. Use Python's `struct` module or
+        `np.frombuffer()` to unpack the record's fields."""
+        if record_size < 1:
+            raise RuntimeError("record_size must be a positive integer")
+        path = self._find_data_file(bytes_path)
+        block_records = max(1, 65536 // record_size)
+
+        def _iter_records():
+            with open(path, "rb") as f:
+                f.seek(offset)
+                while block := f.read(block_records * record_size):
+                    for i in range(0, len(block) - record_size + 1, record_size):
+                        yield block[i : i + record_size]
+                    if len(block) < block_records * record_size:
+                        break
+
+        return _iter_records()
 
     def save_bytes(
         self, bytes_data: Union[bytes, bytearray], filename: Union[str, Path]
@@ -294,6 +1035,39 @@ class DataMixin:
         with open(path, "wb") as f:
             f.write(bytes_data)
 
+    def load_numpy(
+        self, npy_path: Union[str, Path], *, mmap_mode: str = "r"
+    ) -> npt.NDArray:
+        """Load a numpy array from a `.npy` file.
+
+        Parameters
+        ----------
+
+        mmap_mode: str = "r"
+            numpy memory-map mode, or `None` to read the array into memory
+
+        npy_path: Union[str, Path]
+            file path for numpy array file
+
+        Notes
+        -----
+
+        Load a numpy array from a `.npy` file. The path can be in the data directory,
+        relative to the current working directory (`sketch_path()`), or an absolute
+        path.
+
+        By default the array is memory-mapped in read-only mode, so loading is nearly
+        instantaneous and only the parts of the array that are accessed are read from
+        disk. This makes it possible to use arrays that are larger than the available
+        memory. The `mmap_mode` parameter is passed along to numpy's `np.load()`
+        function. Use `"r+"` to write changes back to the file, `"c"` for a
+        copy-on-write array, or `None` to read the entire array into memory.
+
+        Numpy arrays can be saved to a `.npy` file with numpy's `np.save()` function.
+        Pickled object arrays are not supported."""
+        path = self._find_data_file(npy_path)
+        return np.load(path, mmap_mode=mmap_mode, allow_pickle=False)
+
     def load_pickle(self, pickle_path: Union[str, Path]) -> Any:
         """Load a pickled Python object from a file.
 
@@ -373,3 +1147,75 @@ class DataMixin:
             path.parent.mkdir(parents=True)
         with open(path, "wb") as f:
             pickle.dump(obj, f)
+
+    def request_assets(
+        self,
+        manifest: Union[dict[str, Any], str, Path],
+        *,
+        max_workers: int = None,
+    ) -> Py5Assets:
+        """Load a collection of images, shapes, fonts, shaders, and data files in
+        parallel using a pool of threads.
+
+        Parameters
+        ----------
+
+        manifest: Union[dict[str, Any], str, Path]
+            asset manifest dictionary or path to a TOML or JSON manifest file
+
+        max_workers: int = None
+            maximum number of threads to load assets with
+
+        Notes
+        -----
+
+        Load a collection of images, shapes, fonts, shaders, and data files in parallel
+        using a pool of threads. This method returns right away with a `Py5Assets`
+        object that tracks the loading progress and provides access to the loaded
+        assets. Call this method before running the Sketch or at the beginning of
+        `setup()` instead of loading each asset one at a time so that `draw()` can
+        start running and display the loading progress while the assets load in the
+        background.
+
+        The `manifest` parameter is a dictionary that maps asset names to file paths or
+        URLs, or the path to a TOML or JSON file containing the same information. If
+        the manifest file has an `assets` table, only that part of the file is used.
+        Relative paths in a manifest file are relative to the manifest file's
+        directory. Otherwise, paths are located the same way `load_image()` and the
+        other loading methods locate files.
+
+        The asset type is determined by the file extension. Images can be GIF, JPG,
+        TGA, PNG, BMP, TIFF, or WEBP files. Images that Processing cannot read are
+        decoded with PIL in the background threads. SVG and OBJ files are loaded as
+        shapes, VLW, TTF, and OTF files are loaded as fonts, GLSL, FRAG, and VERT files
+        are loaded as shaders, JSON files are loaded with `load_json()`, TXT and CSV
+        files are loaded with `load_strings()`, NPY files are loaded with
+        `load_numpy()`, and anything else is loaded with `load_bytes()`.
+
+        A manifest entry can also be a dictionary with a `path` key. Use a `type` key
+        to set the asset type explicitly. It can be one of `'image'`, `'shape'`,
+        `'font'`, `'shader'`, `'json'`, `'strings'`, `'numpy'`, or `'bytes'`. Shader
+        entries can use `fragment` and `vertex` keys instead of `path`. Font entries for
+        TTF and OTF files can use a `size` key to set the font size, which defaults to
+        12. Shape entries can use an `options` key for OBJ file loading options. Any
+        other keys in data file entries are passed along to the loading method as
+        keyword arguments.
+
+        The returned `Py5Assets` object's `progress` property is the fraction of the
+        asset data that has finished loading. The `loaded_bytes`, `total_bytes`,
+        `loaded_count`, and `total_count` properties provide more detail, and the
+        `is_ready` property will be `True` when everything has finished loading. Access
+        the loaded assets with `assets['name']` or with the typed `image()`, `shape()`,
+        `font()`, and `shader()` methods. An asset will be `None` until it has finished
+        loading. If an asset failed to load, accessing it will raise the exception
+        that caused the failure. Failed assets are also listed in the `errors`
+        property. Call `wait()` to block until all of the assets have loaded or failed.
+
+        Processing's loading methods are not thread-safe. Images that Processing
+        decodes, shapes, fonts, and shaders are therefore loaded one at a time by a
+        single thread, and only once the Sketch has started running. Data files and
+        images decoded with PIL are loaded in parallel by the pool of threads right
+        away. Calling `stop_all_threads()` cancels the assets that have not started
+        loading. Shaders can only be loaded by Sketches that use the `P2D` or `P3D`
+        renderers."""
+        return Py5Assets(self, manifest, max_workers=max_workers)
@@ -19,6 +19,7 @@
 # *****************************************************************************
 from __future__ import annotations
 
+import sys
 import tempfile
 import threading
 from io import BytesIO
@@ -92,6 +93,148 @@ class PixelArray:
         return len(self._instance.pixels)
 
 
+_BANDS_ERROR_MSG = "Unknown `bands` value '{}'. Supported values are 'L', 'ARGB', 'RGB', 'RGBA', 'BGR', and 'BGRA'."
+_BAND_COUNTS = {"L": None, "ARGB": 4, "RGB": 3, "RGBA": 4, "BGR": 3, "BGRA": 4}
+
+# the color bytes of each pixel as a single 3 byte field, for fast copies
+_ARGB_FIELDS = np.dtype([("a", np.uint8), ("rgb", "V3")])
+_BGRA_FIELDS = np.dtype([("bgr", "V3"), ("a", np.uint8)])
+# 0.299, 0.587, and 0.114 in 16 bit fixed point
+_LUMA_WEIGHTS = (np.uint32(19595), np.uint32(38470), np.uint32(7471))
+_LITTLE_ENDIAN = sys.byteorder == "little"
+# conversions that need intermediate values work on blocks of rows with about this
+# many pixels, so the intermediate arrays stay small and fit in the CPU cache
+_BANDS_BLOCK_SIZE = 2**16
+
+
+def _packed(array):
+    # view each 4 byte pixel as a uint32 so that bands can be moved around with
+    # shifts and byte swaps instead of strided copies of single bytes
+    if (
+        _LITTLE_ENDIAN
+        and array.dtype == np.uint8
+        and array.ndim == 3
+        and array.shape[2] == 4
+        and array.strides[2] == 1
+    ):
+        return array.view(np.uint32)[:, :, 0]
+
+
+def _rgb_field(array):
+    if array.dtype == np.uint8 and array.ndim == 3 and array.strides[2] == 1:
+        if array.shape[2] == 4:
+            return array.view(_ARGB_FIELDS)[:, :, 0]["rgb"]
+        elif array.shape[2] == 3:
+            return array.view("V3")[:, :, 0]
+
+
+def _row_blocks(height, width, count):
+    # yields row slices and uint32 scratch arrays of matching size. each call has
+    # its own scratch arrays so that conversions can run on several threads at once
+    rows = max(1, min(height, _BANDS_BLOCK_SIZE // max(width, 1)))
+    scratch = np.empty((count, rows, width), dtype=np.uint32)
+    for y in range(0, height, rows):
+        block = slice(y, min(y + rows, height))
+        yield block, [buf[: block.stop - y] for buf in scratch]
+
+
+def _argb_to_bands(src, bands, dst):
+    """Convert ARGB pixels to another band order, writing the result into `dst`."""
+    src32, dst32 = _packed(src), _packed(dst)
+    if bands == "L":
+        for rows, (acc, tmp) in _row_blocks(*src.shape[:2], 2):
+            np.multiply(src[rows, :, 1], _LUMA_WEIGHTS[0], out=acc)
+            np.multiply(src[rows, :, 2], _LUMA_WEIGHTS[1], out=tmp)
+            np.add(acc, tmp, out=acc)
+            np.multiply(src[rows, :, 3], _LUMA_WEIGHTS[2], out=tmp)
+            np.add(acc, tmp, out=acc)
+            np.right_shift(acc, 16, out=dst[rows], casting="unsafe")
+    elif bands == "ARGB":
+        np.copyto(dst, src)
+    elif bands == "RGB":
+        np.copyto(_rgb_field(dst), _rgb_field(src))
+    elif bands == "RGBA" and src32 is not None and dst32 is not None:
+        np.right_shift(src32, 8, out=dst32)
+        np.copyto(dst[:, :, 3], src[:, :, 0])
+    elif bands == "BGR" and src32 is not None and _rgb_field(dst) is not None:
+        # byte swapping ARGB gives BGRA
+        for rows, (tmp,) in _row_blocks(*src.shape[:2], 1):
+            np.copyto(tmp, src32[rows])
+            tmp.byteswap(inplace=True)
+            np.copyto(_rgb_field(dst[rows]), tmp.view(_BGRA_FIELDS)["bgr"])
+    elif bands == "BGR":
+        np.copyto(dst, src[:, :, 3:0:-1])
+    elif bands == "BGRA" and src32 is not None and dst32 is not None:
+        np.copyto(dst32, src32)
+        dst32.byteswap(inplace=True)
+    else:
+        dst[:, :, :3] = src[:, :, 1:] if bands == "RGBA" else src[:, :, 3:0:-1]
+        dst[:, :, 3] = src[:, :, 0]
+
+
+def _bands_to_argb(array, bands, dst):
+    """Convert pixels in another band order to ARGB, writing the result into `dst`."""
+    dst32 = _packed(dst)
+    if array.dtype != np.uint8 or dst32 is None:
+        # other dtypes are cast to uint8 by numpy's assignment
+        dst32 = None
+    if bands == "L":
+        if array.ndim == 3 and array.shape[2] == 1:
+            array = array[:, :, 0]
+        if dst32 is not None and array.ndim == 2:
+            # the gray value repeated in the R, G, and B bytes, with A set to 255
+            np.multiply(array, np.uint32(0x01010100), out=dst32)
+            np.bitwise_or(dst32, np.uint32(0xFF), out=dst32)
+        else:
+            dst[:, :, 0] = 255
+            dst[:, :, 1:] = array[:, :, None] if array.ndim == 2 else array
+    elif bands == "ARGB":
+        np.copyto(dst, array[:, :, :4], casting="unsafe")
+    elif bands == "RGB":
+        if dst32 is not None and (rgb := _rgb_field(array[:, :, :3])) is not None:
+            dst32.fill(0xFF)
+            np.copyto(_rgb_field(dst), rgb)
+        else:
+            dst[:, :, 0] = 255
+            dst[:, :, 1:] = array[:, :, :3]
+    elif bands == "RGBA" and dst32 is not None and (a32 := _packed(array)) is not None:
+        np.left_shift(a32, 8, out=dst32)
+        np.copyto(dst[:, :, 0], array[:, :, 3])
+    elif bands == "BGRA" and dst32 is not None and (a32 := _packed(array)) is not None:
+        np.copyto(dst32, a32)
+        dst32.byteswap(inplace=True)
+    elif bands in ["RGBA", "BGRA"]:
+        dst[:, :, 0] = array[:, :, 3]
+        dst[:, :, 1:] = array[:, :, :3] if bands == "RGBA" else array[:, :, 2::-1]
+    elif bands == "BGR":
+        if dst32 is not None and (bgr := _rgb_field(array)) is not None:
+            # fill in BGRA and byte swap it to get ARGB
+            dst32.fill(0xFF000000)
+            np.copyto(dst32.view(_BGRA_FIELDS)["bgr"], bgr)
+            dst32.byteswap(inplace=True)
+        else:
+            dst[:, :, 0] = 255
+            dst[:, :, 1:] = array[:, :, 2::-1]
+    else:
+        raise RuntimeError(_BANDS_ERROR_MSG.format(bands))
+
+
+def _argb_to_pil(np_pixels, src, drop_alpha):
+    """Create a PIL Image from a region of `np_pixels`, letting Pillow convert the
+    ARGB bytes while it copies them."""
+    h, w = src.shape[:2]
+    offset = src.ctypes.data - np_pixels.ctypes.data
+    return Image.frombuffer(
+        "RGB" if drop_alpha else "RGBA",
+        (w, h),
+        memoryview(np_pixels.reshape(-1))[offset:],
+        "raw",
+        "XRGB" if drop_alpha else "ARGB",
+        np_pixels.strides[0],
+        1,
+    )
+
+
 class PixelMixin:
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -276,27 +419,7 @@ class PixelMixin:
         bands = bands.upper()
 
         self.load_np_pixels()
-        if bands == "L":
-            self._np_pixels[:, :, 0] = 255
-            self._np_pixels[:, :, 1:] = array[:, :, None] if array.ndim == 2 else array
-        elif bands == "ARGB":
-            self._np_pixels[:] = array[:, :, :4]
-        elif bands == "RGB":
-            self._np_pixels[:, :, 0] = 255
-            self._np_pixels[:, :, 1:] = array[:, :, :3]
-        elif bands == "RGBA":
-            self._np_pixels[:, :, 0] = array[:, :, 3]
-            self._np_pixels[:, :, 1:] = array[:, :, :3]
-        elif bands == "BGR":
-            self._np_pixels[:, :, 0] = 255
-            self._np_pixels[:, :, 1:] = array[:, :, 2::-1]
-        elif bands == "BGRA":
-            self._np_pixels[:, :, 0] = array[:, :, 3]
-            self._np_pixels[:, :, 1:] = array[:, :, 2::-1]
-        else:
-            raise RuntimeError(
-                f"Unknown `bands` value '{bands}'. Supported values are 'L', 'ARGB', 'RGB', 'RGBA', 'BGR', and 'BGRA'."
-            )
+        _bands_to_argb(array, bands, self._np_pixels)
         self.update_np_pixels()
 
     @overload
@@ -490,40 +613,30 @@ class PixelMixin:
         x_slice = slice(x, x + w)
         y_slice = slice(y, y + h)
 
-        if bands == "L":
-            pixels = (
-                self._np_pixels[y_slice, x_slice][:, :, 1:] @ [0.299, 0.587, 0.114]
-            ).astype(np.uint8)
-        elif bands == "ARGB":
-            pixels = self._np_pixels[y_slice, x_slice]
-        elif bands == "RGB":
-            pixels = self._np_pixels[y_slice, x_slice, 1:]
-        elif bands == "RGBA":
-            pixels = np.roll(self._np_pixels[y_slice, x_slice], -1, axis=2)
-        elif bands == "BGR":
-            pixels = self._np_pixels[y_slice, x_slice, 3:0:-1]
-        elif bands == "BGRA":
-            pixels = np.dstack(
-                [
-                    self._np_pixels[y_slice, x_slice, 3:0:-1],
-                    self._np_pixels[y_slice, x_slice, 0],
-                ]
-            )
-        else:
-            raise RuntimeError(
-                f"Unknown `bands` value '{bands}'. Supported values are 'L', 'ARGB', 'RGB', 'RGBA', 'BGR', and 'BGRA'."
+        if bands not in _BAND_COUNTS:
+            raise RuntimeError(_BANDS_ERROR_MSG.format(bands))
+
+        src = self._np_pixels[y_slice, x_slice]
+        h, w = src.shape[:2]
+        shape = (h, w) if bands == "L" else (h, w, _BAND_COUNTS[bands])
+
+        if dst is not None and dst.shape != shape:
+            raise ValueError(
+                f"Destination array has shape {dst.shape} but expected {shape}"
             )
 
-        if dst is not None:
-            if dst.shape != pixels.shape:
-                raise ValueError(
-                    f"Destination array has shape {dst.shape} but expected {pixels.shape}"
-                )
-            else:
-                dst[:] = pixels
-                return dst
-        else:
-            return pixels if pixels.base is None else pixels.copy()
+        # convert directly into dst unless numpy needs to cast to its dtype
+        out = (
+            dst
+            if dst is not None and dst.dtype == np.uint8 and dst.strides[-1] == 1
+            else np.empty(shape, dtype=np.uint8)
+        )
+        _argb_to_bands(src, bands, out)
+
+        if dst is not None and out is not dst:
+            dst[:] = out
+            return dst
+        return out
 
     @overload
     def to_pil(self) -> PIL_Image:
@@ -630,7 +743,22 @@ class PixelMixin:
         object can include the entirety of the Sketch drawing surface or a rectangular
         subsection. Use the `x`, `y`, `h`, and `w` parameters to specify the bounds of a
         rectangular subsection."""
-        return Image.fromarray(self.get_np_pixels(*args, bands="RGBA"))
+        self.load_np_pixels()
+
+        if len(args) == 4:
+            x, y, w, h = args
+        elif len(args) == 0:
+            x, y, h, w = 0, 0, *self._np_pixels.shape[:2]
+        else:
+            raise TypeError(
+                f"Received {len(args)} out of 4 positional arguments for x, y, w, and h."
+            )
+
+        return _argb_to_pil(
+            self._np_pixels,
+            self._np_pixels[y : y + h, x : x + w],
+            drop_alpha=False,
+        )
 
     def save(
         self,
@@ -699,30 +827,25 @@ class PixelMixin:
             with tempfile.TemporaryDirectory() as td:
                 temp_filename = Path(td) / "temp.png"
                 self._instance.save(temp_filename)
-                arr = np.asarray(Image.open(temp_filename))
-                if not drop_alpha:
-                    arr = np.dstack([arr, np.full(arr.shape[:2], 255, dtype=np.uint8)])
+                img = Image.open(temp_filename)
+                img = img.convert("RGB" if drop_alpha else "RGBA")
         else:
             if not isinstance(filename, BytesIO):
                 filename = Path(str(sketch_instance.savePath(str(filename))))
             self.load_np_pixels()
-            arr = (
-                self.np_pixels[:, :, 1:]
-                if drop_alpha
-                else np.roll(self.np_pixels, -1, axis=2)
-            )
+            img = _argb_to_pil(self._np_pixels, self._np_pixels, drop_alpha)
 
         if use_thread:
 
-            def _save(arr, filename, format, params):
-                Image.fromarray(arr).save(filename, format=format, **params)
+            def _save(img, filename, format, params):
+                img.save(filename, format=format, **params)
 
             t = threading.Thread(
-                target=_save, args=(arr, filename, format, params), daemon=True
+                target=_save, args=(img, filename, format, params), daemon=True
             )
             t.start()
         else:
-            Image.fromarray(arr).save(filename, format=format, **params)
+            img.save(filename, format=format, **params)
 
     # *** END METHODS ***
 
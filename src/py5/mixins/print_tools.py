@@ -66,7 +66,7 @@ class PrintlnStream:
         sep: str = " ",
         end: str = "\n",
         stderr: bool = False,
-        flush: bool = False
+        flush: bool = False,
     ) -> None:
         """Print text or other values to the screen.
 
@@ -109,6 +109,14 @@ class PrintlnStream:
         when running a Sketch through a Jupyter Notebook or an IPython terminal, but may
         be very useful if your print stream writes to a file.
 
+        When running a Sketch through a Jupyter Notebook, the printed text is collected
+        and sent to the notebook in batches several times per second. This keeps a
+        Sketch that prints text in every frame from flooding the notebook with messages
+        and slowing down the Sketch animation. If more than 100 lines are printed
+        between batches, the extra lines will be replaced with a count of the lines not
+        shown. Set the `flush` parameter to `True` to send the collected text right
+        away.
+
         Use `set_println_stream()` to customize the behavior of `println()`."""
         msg = sep.join(str(x) for x in args)
         if self._println_stream is None:
@@ -19,34 +19,74 @@
 # *****************************************************************************
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import heapq
+import itertools
+import os
+import queue
 import sys
 import threading
 import time
 from collections.abc import Iterable
-from typing import Any, Callable, Union
+from typing import Any, Callable, Coroutine, Union
 
 from .. import bridge
 
 
 class Py5Promise:
-    def __init__(self):
-        self._result = None
-        self._is_ready = False
+    def __init__(self, future: concurrent.futures.Future = None):
+        self._future = future if future is not None else concurrent.futures.Future()
 
     @property
     def is_ready(self) -> bool:
-        return self._is_ready
+        return self._future.done() and not self._future.cancelled()
 
     @property
     def result(self) -> Any:
-        return self._result
+        if not self._future.done():
+            return None
+        return self._future.result()
+
+    @property
+    def future(self) -> concurrent.futures.Future:
+        return self._future
+
+    def wait(self, timeout: float = None) -> Any:
+        return self._future.result(timeout)
+
+    def exception(self, timeout: float = None) -> Union[BaseException, None]:
+        return self._future.exception(timeout)
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def running(self) -> bool:
+        return self._future.running()
+
+    def cancel(self) -> bool:
+        return self._future.cancel()
+
+    def cancelled(self) -> bool:
+        return self._future.cancelled()
+
+    def add_done_callback(self, fn: Callable[[Py5Promise], Any]) -> None:
+        self._future.add_done_callback(lambda _: fn(self))
+
+    def _set_running(self):
+        return self._future.set_running_or_notify_cancel()
 
     def _set_result(self, result):
-        self._result = result
-        self._is_ready = True
+        self._future.set_result(result)
+
+    def _set_exception(self, exception):
+        self._future.set_exception(exception)
+
+    def __await__(self):
+        return asyncio.wrap_future(self._future).__await__()
 
     def __bool__(self) -> bool:
-        return self._is_ready
+        return self.is_ready
 
 
 class Py5Thread:
@@ -76,18 +116,61 @@ class Py5PromiseThread(Py5Thread):
         super().stop()
 
     def __call__(self):
+        if not self.promise._set_running():
+            return
         try:
-            self.promise._set_result(self.f(*self.args, **self.kwargs))
-        except Exception:
+            result = self.f(*self.args, **self.kwargs)
+        except Exception as e:
+            # the exception is passed on to the promise instead of stopping the Sketch
+            self.promise._set_exception(e)
             bridge.handle_exception(self.sketch.println, *sys.exc_info())
-            self.sketch._terminate_sketch()
+        else:
+            self.promise._set_result(result)
+
+
+class Py5PromisePool(Py5Thread):
+    def __init__(self, sketch, f, args_list, max_workers):
+        super().__init__(sketch, f, (), {})
+        self.promises = [Py5Promise() for _ in args_list]
+        self.stopped = threading.Event()
+        self._worker_threads = set()
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="py5-promise-pool"
+        )
+        self._futures = [
+            executor.submit(self._run, Py5PromiseThread(sketch, f, promise, args, {}))
+            for promise, args in zip(self.promises, args_list)
+        ]
+        # the worker threads will exit after all of the functions have been called
+        executor.shutdown(wait=False)
+
+    def stop(self):
+        super().stop()
+        self.stopped.set()
+        # functions that have not started running yet will be skipped
+        for promise in self.promises:
+            promise.cancel()
+
+    def is_alive(self):
+        return not all(f.done() for f in self._futures)
+
+    def join(self, timeout=None):
+        if threading.current_thread() in self._worker_threads:
+            # don't try to join a pool with one of its own threads
+            return
+        concurrent.futures.wait(self._futures, timeout)
+
+    def _run(self, promise_thread):
+        self._worker_threads.add(threading.current_thread())
+        promise_thread()
 
 
 class Py5RepeatingThread(Py5Thread):
-    def __init__(self, sketch, f, delay, args, kwargs):
+    def __init__(self, sketch, f, delay, fixed_rate, args, kwargs):
         super().__init__(sketch, f, args, kwargs)
         self.repeat = True
         self.delay = delay
+        self.fixed_rate = fixed_rate
         self.e = threading.Event()
 
     def stop(self):
@@ -97,20 +180,356 @@ class Py5RepeatingThread(Py5Thread):
 
     def __call__(self):
         try:
+            next_time = time.perf_counter()
             while self.repeat:
-                start_time = time.time()
+                scheduled_time = next_time
                 self.f(*self.args, **self.kwargs)
-                self.e.wait(max(0, start_time + self.delay - time.time()))
+                now = time.perf_counter()
+                if self.fixed_rate:
+                    # stay on the original schedule unless the call overran it
+                    next_time = max(scheduled_time + self.delay, now)
+                else:
+                    next_time = now + self.delay
+                self.e.wait(next_time - now)
         except Exception:
             self.stop()
             bridge.handle_exception(self.sketch.println, *sys.exc_info())
             self.sketch._terminate_sketch()
 
 
+class Py5RepeatingTask(Py5Thread):
+    def __init__(self, sketch, f, delay, fixed_rate, args, kwargs):
+        super().__init__(sketch, f, args, kwargs)
+        self.name = None
+        self.repeat = True
+        self.delay = delay
+        self.fixed_rate = fixed_rate
+        self.scheduler = None
+        self.call_count = 0
+        self.total_jitter = 0.0
+        self.max_jitter = 0.0
+        self._running_thread = None
+        self._done = threading.Event()
+
+    def stop(self):
+        super().stop()
+        self.repeat = False
+        if self.scheduler is not None:
+            self.scheduler.cancel(self)
+
+    def is_alive(self):
+        return not self._done.is_set()
+
+    def join(self, timeout=None):
+        if self._running_thread is threading.current_thread():
+            # don't try to join a task with itself
+            return
+        self._done.wait(timeout)
+
+    def _finish(self):
+        self._done.set()
+
+    def __call__(self, scheduled_time):
+        if not self.repeat:
+            self._finish()
+            return
+
+        start_time = time.perf_counter()
+        jitter = max(0.0, start_time - scheduled_time)
+        self.call_count += 1
+        self.total_jitter += jitter
+        self.max_jitter = max(self.max_jitter, jitter)
+
+        self._running_thread = threading.current_thread()
+        try:
+            self.f(*self.args, **self.kwargs)
+        except Exception:
+            self.repeat = False
+            self._finish()
+            bridge.handle_exception(self.sketch.println, *sys.exc_info())
+            self.sketch._terminate_sketch()
+            return
+        finally:
+            self._running_thread = None
+
+        if not self.repeat:
+            self._finish()
+            return
+
+        now = time.perf_counter()
+        if self.fixed_rate:
+            # stay on the original schedule unless the call overran it
+            next_time = max(scheduled_time + self.delay, now)
+        else:
+            next_time = now + self.delay
+        self.scheduler.schedule(self, next_time)
+
+
+class Py5Scheduler:
+    """Timer heap and bounded worker pool shared by a Sketch's repeating threads."""
+
+    def __init__(self, max_workers):
+        self._max_workers = max_workers
+        self._cond = threading.Condition()
+        self._heap = []
+        self._counter = itertools.count()
+        self._work_queue = queue.SimpleQueue()
+        self._workers = []
+        self._idle_workers = 0
+        self._is_shutdown = False
+        self._timer_thread = threading.Thread(
+            name="py5-scheduler", target=self._run_timer, daemon=True
+        )
+        self._timer_thread.start()
+
+    def schedule(self, task, when):
+        with self._cond:
+            if self._is_shutdown or not task.repeat:
+                task._finish()
+                return
+            task.scheduler = self
+            heapq.heappush(self._heap, (when, next(self._counter), task))
+            self._cond.notify()
+
+    def cancel(self, task):
+        with self._cond:
+            heap = [e for e in self._heap if e[2] is not task]
+            if len(heap) != len(self._heap):
+                heapq.heapify(heap)
+                self._heap = heap
+                task._finish()
+                self._cond.notify()
+
+    def shutdown(self):
+        with self._cond:
+            self._is_shutdown = True
+            for _, _, task in self._heap:
+                task._finish()
+            self._heap = []
+            self._cond.notify()
+            for _ in self._workers:
+                self._work_queue.put(None)
+
+    def stats(self):
+        with self._cond:
+            return dict(
+                scheduled_tasks=len(self._heap),
+                worker_threads=len(self._workers),
+                idle_worker_threads=self._idle_workers,
+                max_worker_threads=self._max_workers,
+            )
+
+    def _run_timer(self):
+        while True:
+            with self._cond:
+                if self._is_shutdown:
+                    return
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                when, _, task = self._heap[0]
+                wait_time = when - time.perf_counter()
+                if wait_time > 0:
+                    self._cond.wait(wait_time)
+                    continue
+                heapq.heappop(self._heap)
+                self._work_queue.put((task, when))
+                if (
+                    self._work_queue.qsize() > self._idle_workers
+                    and len(self._workers) < self._max_workers
+                ):
+                    worker = threading.Thread(
+                        name=f"py5-scheduler-worker-{len(self._workers)}",
+                        target=self._run_worker,
+                        daemon=True,
+                    )
+                    self._workers.append(worker)
+                    worker.start()
+
+    def _run_worker(self):
+        while True:
+            with self._cond:
+                self._idle_workers += 1
+            item = self._work_queue.get()
+            with self._cond:
+                self._idle_workers -= 1
+            if item is None:
+                return
+            task, scheduled_time = item
+            task(scheduled_time)
+
+
+class Py5IdleTask:
+    def __init__(self, name, f, priority, cost, repeating, max_delay, args, kwargs):
+        self.name = name
+        self.f = f
+        self.priority = priority
+        self.cost = cost
+        self.repeating = repeating
+        self.max_delay = max_delay
+        self.args = args
+        self.kwargs = kwargs
+        self.cancelled = False
+        self.waiting_since = time.perf_counter()
+        self.calls = 0
+        self.deferrals = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.mean_time = None
+
+    @property
+    def estimated_cost(self):
+        return self.cost if self.mean_time is None else self.mean_time
+
+    def is_overdue(self, now):
+        return self.max_delay is not None and now - self.waiting_since >= self.max_delay
+
+    def __call__(self):
+        start = time.perf_counter()
+        try:
+            self.f(*self.args, **self.kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.calls += 1
+            self.total_time += elapsed
+            self.max_time = max(self.max_time, elapsed)
+            # moving average so the estimate follows changes in the task's cost
+            self.mean_time = (
+                elapsed
+                if self.mean_time is None
+                else 0.8 * self.mean_time + 0.2 * elapsed
+            )
+
+
+class Py5IdleScheduler:
+    """Runs a Sketch's idle tasks after draw() in the time left before the next
+    frame is due."""
+
+    # fraction of the frame period kept free for rendering and py5's own work
+    FRAME_MARGIN = 0.1
+
+    def __init__(self, sketch):
+        self._sketch = sketch
+        self._lock = threading.Lock()
+        self._heap = []
+        self._tasks = {}
+        self._counter = itertools.count()
+        self._frame_start = None
+        self.frames = 0
+        self.total_idle_time = 0.0
+        self.total_task_time = 0.0
+
+    def schedule(self, task):
+        with self._lock:
+            if (old_task := self._tasks.get(task.name)) is not None:
+                old_task.cancelled = True
+            self._tasks[task.name] = task
+            self._push(task)
+
+    def cancel(self, name):
+        with self._lock:
+            if (task := self._tasks.pop(name, None)) is not None:
+                task.cancelled = True
+                return True
+            return False
+
+    def has_task(self, name):
+        with self._lock:
+            return name in self._tasks
+
+    def stats(self):
+        with self._lock:
+            return dict(
+                pending_tasks=len(self._tasks),
+                frames=self.frames,
+                mean_idle_time=(
+                    self.total_idle_time / self.frames if self.frames else 0.0
+                ),
+                mean_task_time=(
+                    self.total_task_time / self.frames if self.frames else 0.0
+                ),
+                tasks={
+                    name: dict(
+                        priority=task.priority,
+                        repeating=task.repeating,
+                        calls=task.calls,
+                        deferrals=task.deferrals,
+                        mean_time=task.total_time / task.calls if task.calls else 0.0,
+                        max_time=task.max_time,
+                    )
+                    for name, task in self._tasks.items()
+                },
+            )
+
+    def frame_started(self, sketch):
+        self._frame_start = time.perf_counter()
+
+    def run_tasks(self, sketch):
+        now = time.perf_counter()
+        frame_start = now if self._frame_start is None else self._frame_start
+        frame_rate = sketch._target_frame_rate
+        deadline = frame_start + (1 - self.FRAME_MARGIN) / max(frame_rate, 1e-3)
+        self.frames += 1
+        self.total_idle_time += max(0.0, deadline - now)
+
+        with self._lock:
+            tasks = [heapq.heappop(self._heap)[2] for _ in range(len(self._heap))]
+
+        # run tasks in priority order while their estimated cost fits in the time
+        # remaining. tasks that don't fit are carried over to the next frame, unless
+        # they have waited longer than their maximum delay.
+        carried_over = []
+        try:
+            while tasks:
+                task = tasks.pop(0)
+                if task.cancelled:
+                    continue
+                now = time.perf_counter()
+                if task.estimated_cost > deadline - now and not task.is_overdue(now):
+                    task.deferrals += 1
+                    carried_over.append(task)
+                    continue
+
+                try:
+                    task()
+                except Exception:
+                    # the task may have scheduled a replacement with the same name
+                    task.cancelled = True
+                    with self._lock:
+                        if self._tasks.get(task.name) is task:
+                            self._tasks.pop(task.name)
+                    raise
+                finally:
+                    self.total_task_time += time.perf_counter() - now
+
+                if task.repeating:
+                    task.waiting_since = time.perf_counter()
+                    carried_over.append(task)
+                else:
+                    with self._lock:
+                        if self._tasks.get(task.name) is task:
+                            self._tasks.pop(task.name)
+        finally:
+            with self._lock:
+                for task in carried_over + tasks:
+                    if not task.cancelled:
+                        self._push(task)
+
+    def _push(self, task):
+        # higher priorities first, then in the order the tasks were scheduled
+        heapq.heappush(self._heap, (-task.priority, next(self._counter), task))
+
+
 class ThreadsMixin:
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._py5threads = {}
+        self._py5scheduler = None
+        self._py5idle_scheduler = None
+        self._py5task_counter = itertools.count(1)
+        self._py5asyncio_loop = None
+        self._py5asyncio_thread = None
+        self._py5asyncio_callbacks = queue.SimpleQueue()
 
     def _check_param_types(self, args, kwargs):
         if not isinstance(args, Iterable) and args is not None:
@@ -135,8 +554,78 @@ class ThreadsMixin:
 
         return t.name
 
+    def _launch_py5task(self, name, py5task):
+        if self.has_thread(name):
+            self.stop_thread(name, wait=True)
+
+        if self._py5scheduler is None:
+            self._py5scheduler = Py5Scheduler(min(32, (os.cpu_count() or 1) + 4))
+
+        py5task.name = name or f"Py5RepeatingTask-{next(self._py5task_counter)}"
+        self._py5threads[py5task.name] = (py5task, py5task)
+        self._py5scheduler.schedule(py5task, time.perf_counter())
+
+        return py5task.name
+
+    def _launch_promise_pool(self, f, args_list, max_workers):
+        pool = Py5PromisePool(self, f, args_list, max_workers)
+        name = f"Py5PromisePool-{next(self._py5task_counter)}"
+        self._py5threads[name] = (pool, pool)
+
+        return pool
+
+    def _start_asyncio_loop(self):
+        loop = asyncio.new_event_loop()
+
+        def run_loop():
+            asyncio.set_event_loop(loop)
+            loop.run_forever()
+
+        self._py5asyncio_loop = loop
+        self._py5asyncio_thread = threading.Thread(
+            name="py5-asyncio", target=run_loop, daemon=True
+        )
+        self._py5asyncio_thread.start()
+        self._add_pre_hook("draw", "py5_run_async_hook", self._run_asyncio_callbacks)
+
+    def _stop_asyncio_loop(self):
+        loop = self._py5asyncio_loop
+        if loop is None or loop.is_closed():
+            return
+
+        async def cancel_tasks():
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.shutdown_asyncgens()
+
+        if threading.current_thread() is not self._py5asyncio_thread:
+            try:
+                asyncio.run_coroutine_threadsafe(cancel_tasks(), loop).result(1.0)
+            except Exception:
+                pass
+            loop.call_soon_threadsafe(loop.stop)
+            self._py5asyncio_thread.join(1.0)
+            if not loop.is_running():
+                loop.close()
+        else:
+            # called from a coroutine, so the loop can only be asked to stop
+            loop.call_soon(loop.stop)
+
+    def _run_asyncio_callbacks(self, sketch):
+        while True:
+            try:
+                callback, promise = self._py5asyncio_callbacks.get_nowait()
+            except queue.Empty:
+                break
+            callback(promise.result)
+
     def _shutdown(self):
         self.stop_all_threads(wait=False)
+        if self._py5scheduler is not None:
+            self._py5scheduler.shutdown()
+        self._stop_asyncio_loop()
         super()._shutdown()
 
     # *** BEGIN METHODS ***
@@ -242,6 +731,16 @@ class ThreadsMixin:
         `result` property contains the value function `f` returned. Before then, the
         `result` property will be `None`.
 
+        The `Py5Promise` object also supports the methods of Python's
+        `concurrent.futures.Future` class, such as `done()`, `cancel()`,
+        `exception()`, and `add_done_callback()`. Call `wait()` to block until the
+        function completes, optionally with a `timeout`. If function `f` throws an
+        exception, the error message will be printed and the exception will be re-raised
+        when the `result` property is accessed or `wait()` is called. The Sketch will
+        continue to run. A `Py5Promise` object can also be awaited in asyncio code, and
+        its `future` property can be passed to functions such as
+        `concurrent.futures.as_completed()`.
+
         The `name` parameter is optional but useful if you want to monitor the thread
         with other methods such as `has_thread()`. If the provided `name` is identical
         to an already running thread, the running thread will first be stopped with a
@@ -275,6 +774,7 @@ class ThreadsMixin:
         name: str = None,
         *,
         time_delay: float = 0,
+        fixed_rate: bool = True,
         daemon: bool = True,
         args: tuple = None,
         kwargs: dict = None,
@@ -294,6 +794,9 @@ class ThreadsMixin:
         f: Callable
             function to call in the launched thread
 
+        fixed_rate: bool = True
+            measure the time delay from the start of each call instead of the end
+
         kwargs: dict = None
             keyword arguments to pass to the given function
 
@@ -316,6 +819,20 @@ class ThreadsMixin:
         takes longer than expected to finish, py5 will wait for it to finish before
         making the next call. There will not be overlapping calls to function `f`.
 
+        By default the calls are made at a fixed rate, meaning the `time_delay` is
+        measured from the scheduled start of one call to the start of the next. The
+        schedule does not drift, even if the function's execution time varies. Set
+        `fixed_rate` to `False` to measure the `time_delay` from the end of one call to
+        the start of the next instead.
+
+        Repeating threads do not each get their own Python thread. All of a Sketch's
+        repeating threads share a single timer and a small pool of worker threads,
+        which keeps the number of threads low when there are many periodic tasks. Use
+        `repeating_thread_stats()` to monitor the scheduler. Setting `daemon` to
+        `False` will run the function in a dedicated non-daemon thread instead. That
+        thread follows the same `fixed_rate` timing but is not included in the
+        scheduler statistics.
+
         The `name` parameter is optional but useful if you want to monitor the thread
         with other methods such as `has_thread()`. If the provided `name` is identical
         to an already running thread, the running thread will first be stopped with a
@@ -337,8 +854,14 @@ class ThreadsMixin:
         The new thread is a Python thread, so all the usual caveats about the Global
         Interpreter Lock (GIL) apply here."""
         args, kwargs = self._check_param_types(args, kwargs)
-        return self._launch_py5thread(
-            name, Py5RepeatingThread(self, f, time_delay, args, kwargs), daemon
+        if not daemon:
+            return self._launch_py5thread(
+                name,
+                Py5RepeatingThread(self, f, time_delay, fixed_rate, args, kwargs),
+                daemon,
+            )
+        return self._launch_py5task(
+            name, Py5RepeatingTask(self, f, time_delay, fixed_rate, args, kwargs)
         )
 
     def _remove_dead_threads(self):
@@ -465,3 +988,250 @@ class ThreadsMixin:
         launched threads that have exited will be removed from the list."""
         self._remove_dead_threads()
         return list(self._py5threads.keys())
+
+    def run_async(
+        self, coro: Coroutine, *, callback: Callable[[Any], None] = None
+    ) -> Py5Promise:
+        """Run an asyncio coroutine in an event loop running in parallel with your
+        Sketch code.
+
+        Parameters
+        ----------
+
+        callback: Callable[[Any], None] = None
+            function to call with the coroutine's result before the next call to draw
+
+        coro: Coroutine
+            coroutine to run in the Sketch's asyncio event loop
+
+        Notes
+        -----
+
+        Run an asyncio coroutine in an event loop running in parallel with your
+        Sketch code. This makes it possible to use async libraries, such as websocket
+        clients, async http clients, or async database drivers, that would otherwise
+        slow down the animation thread and reduce the Sketch's frame rate.
+
+        The Sketch's asyncio event loop is created the first time this method is called
+        and runs in its own Python thread. All coroutines passed to `run_async()` run
+        in that same event loop, so they can share asyncio objects such as queues and
+        network connections. When the Sketch exits, any coroutines that are still
+        running will be cancelled and the event loop will be closed.
+
+        This method returns a `Py5Promise` object that will store the coroutine's
+        result when it completes. Calling the Py5Promise's `cancel()` method will
+        cancel the coroutine.
+
+        Use the `callback` parameter to receive the coroutine's result on the animation
+        thread. The callback function will be called with the result right before the
+        next call to `draw()`, making it safe to use the result to update the Sketch's
+        state or to draw to the screen. If the coroutine throws an exception, the
+        callback will not be called and the error will be printed instead.
+
+        Callbacks wait for `draw()`, so none will be called while the Sketch is paused
+        with `no_loop()`. If the Sketch does not have a `draw()` function, the callback
+        is instead called from the event loop's thread as soon as the coroutine
+        completes."""
+        if self._py5asyncio_loop is None or self._py5asyncio_loop.is_closed():
+            self._start_asyncio_loop()
+
+        promise = Py5Promise(
+            asyncio.run_coroutine_threadsafe(coro, self._py5asyncio_loop)
+        )
+
+        def done_callback(promise):
+            if promise.cancelled():
+                return
+            if (e := promise.exception()) is not None:
+                bridge.handle_exception(self.println, type(e), e, e.__traceback__)
+            elif callback is not None:
+                if self._py5_bridge is not None and not self._py5_bridge.has_function(
+                    "draw"
+                ):
+                    # a static Sketch will never call draw(), so call it right away
+                    try:
+                        callback(promise.result)
+                    except Exception:
+                        bridge.handle_exception(self.println, *sys.exc_info())
+                else:
+                    self._py5asyncio_callbacks.put((callback, promise))
+
+        promise.add_done_callback(done_callback)
+
+        return promise
+
+    def repeating_thread_stats(self) -> dict[str, Any]:
+        """Get statistics about the scheduler that runs the Sketch's repeating threads.
+
+        Notes
+        -----
+
+        Get statistics about the scheduler that runs the Sketch's repeating threads.
+        Repeating threads launched with `launch_repeating_thread()` share a single
+        timer and a bounded pool of worker threads. This method reports how many Python
+        threads that scheduler is using and how accurately it is keeping to each
+        repeating thread's schedule.
+
+        The returned dictionary contains the number of scheduled tasks, the number of
+        worker threads and idle worker threads, and the maximum allowed number of
+        worker threads. The `tasks` key maps each repeating thread's name to the number
+        of calls made so far and the mean and maximum scheduling jitter in seconds. The
+        jitter is the time between when a call was supposed to start and when it
+        actually started."""
+        self._remove_dead_threads()
+        if self._py5scheduler is None:
+            stats = dict(
+                scheduled_tasks=0,
+                worker_threads=0,
+                idle_worker_threads=0,
+                max_worker_threads=0,
+            )
+        else:
+            stats = self._py5scheduler.stats()
+        stats["tasks"] = {
+            name: dict(
+                calls=task.call_count,
+                mean_jitter=(
+                    task.total_jitter / task.call_count if task.call_count else 0.0
+                ),
+                max_jitter=task.max_jitter,
+            )
+            for name, (_, task) in self._py5threads.items()
+            if isinstance(task, Py5RepeatingTask)
+        }
+        return stats
+
+    def schedule_idle_task(
+        self,
+        f: Callable,
+        name: str = None,
+        *,
+        priority: int = 0,
+        cost: float = 0.0,
+        repeating: bool = False,
+        max_delay: float = None,
+        args: tuple = None,
+        kwargs: dict = None,
+    ) -> str:
+        """Schedule a function to be called on the animation thread after `draw()`, when
+        there is time left before the next frame is due.
+
+        Parameters
+        ----------
+
+        args: tuple = None
+            positional arguments to pass to the given function
+
+        cost: float = 0.0
+            estimated time in seconds the function takes to run
+
+        f: Callable
+            function to call when the Sketch has idle time
+
+        kwargs: dict = None
+            keyword arguments to pass to the given function
+
+        max_delay: float = None
+            maximum time in seconds the task can be postponed
+
+        name: str = None
+            name of the idle task
+
+        priority: int = 0
+            tasks with higher priorities are run first
+
+        repeating: bool = False
+            call the function again every frame that has time for it
+
+        Notes
+        -----
+
+        Schedule a function to be called on the animation thread after `draw()`, when
+        there is time left before the next frame is due. This is useful for work that
+        must happen on the animation thread but can be postponed, such as saving files,
+        logging, or maintaining caches. Running this work when the Sketch has time for
+        it instead of in `draw()` will avoid dropped frames.
+
+        The time available is based on the frame rate set with `frame_rate()`. After
+        each call to `draw()`, idle tasks are run in order of their `priority`, as long
+        as each task's estimated cost fits in the time remaining. Tasks that do not fit
+        are carried over to the next frame and the scheduler will try again. The cost
+        estimate starts with the `cost` parameter and is replaced by the measured run
+        time once the task has been called. A task with a large cost might never fit
+        in a frame, so use the `max_delay` parameter to set the longest time in
+        seconds a task can wait before it will be run regardless of the time
+        available.
+
+        By default a task is called once and then discarded. Set `repeating` to `True`
+        to call the function every frame that has time for it, until the task is
+        cancelled with `cancel_idle_task()`. Scheduling a task with the same `name` as
+        an existing task will replace the existing task. This can be used to coalesce
+        repeated requests for the same work, such as saving the Sketch's state.
+
+        Idle tasks are only run after calls to `draw()`, so they will not run if the
+        Sketch does not have a `draw()` method or if `no_loop()` was called. If a task
+        throws an exception, the Sketch will stop, just like an exception in `draw()`.
+        Use `idle_task_stats()` to see how often tasks are run and postponed."""
+        args, kwargs = self._check_param_types(args, kwargs)
+
+        if self._py5idle_scheduler is None:
+            self._py5idle_scheduler = Py5IdleScheduler(self)
+            self._add_pre_hook(
+                "draw", "py5_idle_tasks_hook", self._py5idle_scheduler.frame_started
+            )
+            self._add_post_hook(
+                "draw", "py5_idle_tasks_hook", self._py5idle_scheduler.run_tasks
+            )
+
+        name = name or f"Py5IdleTask-{next(self._py5task_counter)}"
+        self._py5idle_scheduler.schedule(
+            Py5IdleTask(name, f, priority, cost, repeating, max_delay, args, kwargs)
+        )
+
+        return name
+
+    def cancel_idle_task(self, name: str) -> bool:
+        """Cancel an idle task of a given name.
+
+        Parameters
+        ----------
+
+        name: str
+            name of the idle task
+
+        Notes
+        -----
+
+        Cancel an idle task of a given name. The task will not be called again. This
+        method returns `True` if the task was waiting to be called and `False` if there
+        is no task of that name, which is also the case for non-repeating tasks that
+        have already been called. Idle tasks are created with `schedule_idle_task()`."""
+        if self._py5idle_scheduler is None:
+            return False
+        return self._py5idle_scheduler.cancel(name)
+
+    def idle_task_stats(self) -> dict[str, Any]:
+        """Get statistics about the Sketch's idle tasks.
+
+        Notes
+        -----
+
+        Get statistics about the Sketch's idle tasks. Idle tasks are created with
+        `schedule_idle_task()` and run after `draw()` when there is time left before
+        the next frame is due.
+
+        The returned dictionary contains the number of pending tasks, the number of
+        frames the scheduler has run in, and the mean idle time and mean time spent
+        running tasks per frame, in seconds. The `tasks` key maps each pending task's
+        name to its priority, the number of calls made so far, the number of times it
+        was carried over to the next frame, and the mean and maximum time each call
+        took."""
+        if self._py5idle_scheduler is None:
+            return dict(
+                pending_tasks=0,
+                frames=0,
+                mean_idle_time=0.0,
+                mean_task_time=0.0,
+                tasks={},
+            )
+        return self._py5idle_scheduler.stats()
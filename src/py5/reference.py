@@ -263,23 +263,40 @@ METHOD_SIGNATURES_LOOKUP = dict([(('Sketch', 'alpha'), ['(rgb: int, /) -> float'
     (('Sketch', 'os_noise'), ['(x: Union[float, npt.NDArray], y: Union[float, npt.NDArray], /) -> Union[float, npt.NDArray]', '(x: Union[float, npt.NDArray], y: Union[float, npt.NDArray], z: Union[float, npt.NDArray], /, ) -> Union[float, npt.NDArray]', '(x: Union[float, npt.NDArray], y: Union[float, npt.NDArray], z: Union[float, npt.NDArray], w: Union[float, npt.NDArray], /, ) -> Union[float, npt.NDArray]']),
     (('Sketch', 'launch_thread'), ['(f: Callable, name: str = None, *, daemon: bool = True, args: tuple = None, kwargs: dict = None, ) -> str']),
     (('Sketch', 'launch_promise_thread'), ['(f: Callable, name: str = None, *, daemon: bool = True, args: tuple = None, kwargs: dict = None, ) -> Py5Promise']),
-    (('Sketch', 'launch_repeating_thread'), ['(f: Callable, name: str = None, *, time_delay: float = 0, daemon: bool = True, args: tuple = None, kwargs: dict = None, ) -> str']),
+    (('Sketch', 'launch_repeating_thread'), ['(f: Callable, name: str = None, *, time_delay: float = 0, fixed_rate: bool = True, daemon: bool = True, args: tuple = None, kwargs: dict = None, ) -> str']),
     (('Sketch', 'has_thread'), ['(name: str) -> None']),
     (('Sketch', 'join_thread'), ['(name: str, *, timeout: float = None) -> bool']),
     (('Sketch', 'stop_thread'), ['(name: str, wait: bool = False) -> None']),
     (('Sketch', 'stop_all_threads'), ['(wait: bool = False) -> None']),
     (('Sketch', 'list_threads'), ['() -> None']),
+    (('Sketch', 'run_async'), ['(coro: Coroutine, *, callback: Callable[[Any], None] = None) -> Py5Promise']),
+    (('Sketch', 'repeating_thread_stats'), ['() -> dict[str, Any]']),
+    (('Sketch', 'schedule_idle_task'), ['(f: Callable, name: str = None, *, priority: int = 0, cost: float = 0.0, repeating: bool = False, max_delay: float = None, args: tuple = None, kwargs: dict = None, ) -> str']),
+    (('Sketch', 'cancel_idle_task'), ['(name: str) -> bool']),
+    (('Sketch', 'idle_task_stats'), ['() -> dict[str, Any]']),
+    (('Sketch', 'borrow_graphics'), ['(w: int, h: int, renderer: str = None, *, clear: bool = True) -> Py5Graphics']),
+    (('Sketch', 'borrow_image'), ['(w: int, h: int, format: int = None, *, clear: bool = True) -> Py5Image']),
+    (('Sketch', 'set_buffer_pool_budget'), ['(max_bytes: int) -> None']),
+    (('Sketch', 'buffer_pool_stats'), ['() -> dict[str, Any]']),
     (('Sketch', 'set_println_stream'), ['(println_stream: Any) -> None']),
     (('Sketch', 'println'), ['(*args, sep: str = " ", end: str = "\\n", stderr: bool = False, flush: bool = False) -> None']),
+    (('Sketch', 'set_http_options'), ['(*, cache_dir: Union[str, Path] = None, ttl: float = 0.0, retries: int = 3, pool_size: int = 10, ) -> None']),
     (('Sketch', 'load_json'), ['(json_path: Union[str, Path], **kwargs: dict[str, Any]) -> Any']),
+    (('Sketch', 'request_json'), ['(json_path: Union[str, Path], **kwargs: dict[str, Any]) -> Py5Promise']),
     (('Sketch', 'save_json'), ['(json_data: Any, filename: Union[str, Path], **kwargs: dict[str, Any]) -> None']),
     (('Sketch', 'parse_json'), ['(serialized_json: Any, **kwargs: dict[str, Any]) -> Any']),
     (('Sketch', 'load_strings'), ['(string_path: Union[str, Path], **kwargs: dict[str, Any]) -> list[str]']),
+    (('Sketch', 'request_strings'), ['(string_path: Union[str, Path], **kwargs: dict[str, Any]) -> Py5Promise']),
+    (('Sketch', 'iter_strings'), ['(string_path: Union[str, Path], **kwargs: dict[str, Any]) -> Iterator[str]']),
     (('Sketch', 'save_strings'), ['(string_data: list[str], filename: Union[str, Path], *, end: str = "\\n") -> None']),
-    (('Sketch', 'load_bytes'), ['(bytes_path: Union[str, Path], **kwargs: dict[str, Any]) -> bytearray']),
+    (('Sketch', 'load_bytes'), ['(bytes_path: Union[str, Path], *, mmap: bool = False, **kwargs: dict[str, Any]) -> Union[bytearray, memoryview]']),
+    (('Sketch', 'request_bytes'), ['(bytes_path: Union[str, Path], **kwargs: dict[str, Any]) -> Py5Promise']),
+    (('Sketch', 'iter_records'), ['(bytes_path: Union[str, Path], record_size: int, *, offset: int = 0) -> Iterator[bytes]']),
     (('Sketch', 'save_bytes'), ['(bytes_data: Union[bytes, bytearray], filename: Union[str, Path]) -> None']),
+    (('Sketch', 'load_numpy'), ['(npy_path: Union[str, Path], *, mmap_mode: str = "r") -> npt.NDArray']),
     (('Sketch', 'load_pickle'), ['(pickle_path: Union[str, Path]) -> Any']),
     (('Sketch', 'save_pickle'), ['(obj: Any, filename: Union[str, Path]) -> None']),
+    (('Sketch', 'request_assets'), ['(manifest: Union[dict[str, Any], str, Path], *, max_workers: int = None) -> Py5Assets']),
     (('Sketch', 'load_np_pixels'), ['() -> None']),
     (('Sketch', 'update_np_pixels'), ['() -> None']),
     (('Sketch', 'set_np_pixels'), ['(array: npt.NDArray[np.uint8], bands: str = "ARGB") -> None']),
@@ -297,10 +314,12 @@ METHOD_SIGNATURES_LOOKUP = dict([(('Sketch', 'alpha'), ['(rgb: int, /) -> float'
     (('Sketch', 'begin_camera'), ['() -> ContextManager']),
     (('Sketch', 'sketch_path'), ['() -> Path', '(where: str, /) -> Path']),
     (('Sketch', 'hot_reload_draw'), ['(draw: Callable) -> None']),
+    (('Sketch', 'register_callback'), ['(key: str, func: Union[Callable, None], /) -> None']),
     (('Sketch', 'profile_functions'), ['(function_names: list[str]) -> None']),
     (('Sketch', 'profile_draw'), ['() -> None']),
     (('Sketch', 'print_line_profiler_stats'), ['() -> None']),
     (('Sketch', 'save_frame'), ['(filename: Union[str, Path, BytesIO], *, format: str = None, drop_alpha: bool = True, use_thread: bool = False, **params, ) -> None']),
+    (('Sketch', 'save_tiled'), ['(filename: Union[str, Path], scale: float, tile_size: int, draw_func: Callable[[Py5Graphics], None], *, renderer: str = None, format: str = None, drop_alpha: bool = True, ) -> None']),
     (('Sketch', 'select_folder'), ['(prompt: str, callback: Callable, default_folder: str = None) -> None']),
     (('Sketch', 'select_input'), ['(prompt: str, callback: Callable, default_file: str = None) -> None']),
     (('Sketch', 'select_output'), ['(prompt: str, callback: Callable, default_file: str = None) -> None']),
@@ -311,6 +330,7 @@ METHOD_SIGNATURES_LOOKUP = dict([(('Sketch', 'alpha'), ['(rgb: int, /) -> float'
     (('Sketch', 'convert_cached_shape'), ['(obj: Any, force_conversion: bool = False, **kwargs: Any) -> Py5Shape']),
     (('Sketch', 'load_image'), ['(image_path: Union[str, Path], *, dst: Py5Image = None) -> Py5Image']),
     (('Sketch', 'request_image'), ['(image_path: Union[str, Path]) -> Py5Promise']),
+    (('Sketch', 'request_images'), ['(image_paths: Sequence[Union[str, Path]], *, max_workers: int = None) -> list[Py5Promise]']),
     (('Sketch', 'color_mode'), ['(mode: int, /) -> None', '(mode: int, max1: float, max2: float, max3: float, /) -> None', '(mode: int, max1: float, max2: float, max3: float, max_a: float, /) -> None', '(mode: int, max: float, /) -> None', '(colormap_mode: int, color_map: str, /) -> None', '(colormap_mode: int, color_map_instance: Colormap, /) -> None', '(colormap_mode: int, color_map: str, max_map: float, /) -> None', '(colormap_mode: int, color_map_instance: Colormap, max_map: float, /) -> None', '(colormap_mode: int, color_map: str, max_map: float, max_a: float, /) -> None', '(colormap_mode: int, color_map_instance: Colormap, max_map: float, max_a: float, /, ) -> None']),
     (('Sketch', 'color'), ['(fgray: float, /) -> int', '(fgray: float, falpha: float, /) -> int', '(gray: int, /) -> int', '(gray: int, alpha: int, /) -> int', '(v1: float, v2: float, v3: float, /) -> int', '(v1: float, v2: float, v3: float, alpha: float, /) -> int', '(v1: int, v2: int, v3: int, /) -> int', '(v1: int, v2: int, v3: int, alpha: int, /) -> int', '(cmap_input: float, /) -> int', '(cmap_input: float, alpha: int, /) -> int', '(hex_code: str, /) -> int', '(hex_code: str, alpha: int, /) -> int']),
     (('Py5Shader', 'set'), ['(name: str, x: bool, /) -> None', '(name: str, x: bool, y: bool, /) -> None', '(name: str, x: bool, y: bool, z: bool, /) -> None', '(name: str, x: bool, y: bool, z: bool, w: bool, /) -> None', '(name: str, vec: Sequence[bool], /) -> None', '(name: str, boolvec: Sequence[bool], ncoords: int, /) -> None', '(name: str, x: float, /) -> None', '(name: str, x: float, y: float, /) -> None', '(name: str, x: float, y: float, z: float, /) -> None', '(name: str, x: float, y: float, z: float, w: float, /) -> None', '(name: str, vec: Sequence[float], /) -> None', '(name: str, vec: Sequence[float], ncoords: int, /) -> None', '(name: str, x: int, /) -> None', '(name: str, x: int, y: int, /) -> None', '(name: str, x: int, y: int, z: int, /) -> None', '(name: str, x: int, y: int, z: int, w: int, /) -> None', '(name: str, vec: Sequence[int], /) -> None', '(name: str, vec: Sequence[int], ncoords: int, /) -> None', '(name: str, tex: Py5Image, /) -> None', '(name: str, mat: npt.NDArray[np.floating], /) -> None', '(name: str, mat: npt.NDArray[np.floating], use3x3: bool, /) -> None', '(name: str, vec: Py5Vector, /) -> None']),
@@ -321,6 +341,7 @@ METHOD_SIGNATURES_LOOKUP = dict([(('Sketch', 'alpha'), ['(rgb: int, /) -> float'
     (('Py5Shape', 'bezier_vertex'), ['(x2: float, y2: float, x3: float, y3: float, x4: float, y4: float, /) -> None', '(x2: float, y2: float, z2: float, x3: float, y3: float, z3: float, x4: float, y4: float, z4: float, /) -> None']),
     (('Py5Shape', 'color_mode'), ['(mode: int, /) -> None', '(mode: int, max: float, /) -> None', '(mode: int, max_x: float, max_y: float, max_z: float, /) -> None', '(mode: int, max_x: float, max_y: float, max_z: float, max_a: float, /) -> None']),
     (('Py5Shape', 'contains'), ['(x: float, y: float, /) -> bool']),
+    (('Py5Shape', 'contains_points'), ['(points: npt.NDArray[np.floating], /) -> npt.NDArray[np.bool_]']),
     (('Py5Shape', 'curve_detail'), ['(detail: int, /) -> None']),
     (('Py5Shape', 'curve_tightness'), ['(tightness: float, /) -> None']),
     (('Py5Shape', 'curve_vertex'), ['(x: float, y: float, /) -> None', '(x: float, y: float, z: float, /) -> None']),
@@ -634,6 +655,13 @@ METHOD_SIGNATURES_LOOKUP = dict([(('Sketch', 'alpha'), ['(rgb: int, /) -> float'
     (('Py5Shape', 'bezier_vertices'), ['(coordinates: Sequence[Sequence[float]], /) -> None']),
     (('Py5Shape', 'curve_vertices'), ['(coordinates: Sequence[Sequence[float]], /) -> None']),
     (('Py5Shape', 'quadratic_vertices'), ['(coordinates: Sequence[Sequence[float]], /) -> None']),
+    (('Py5Shape', 'get_vertices'), ['(*, dst: npt.NDArray[np.floating] = None) -> npt.NDArray[np.floating]']),
+    (('Py5Shape', 'set_vertices'), ['(coordinates: npt.NDArray[np.floating], /) -> None']),
+    (('Py5Shape', 'get_fills'), ['(*, dst: npt.NDArray[np.integer] = None) -> npt.NDArray[np.integer]']),
+    (('Py5Shape', 'get_normals'), ['(*, dst: npt.NDArray[np.floating] = None) -> npt.NDArray[np.floating]']),
+    (('Py5Shape', 'set_normals'), ['(normals: npt.NDArray[np.floating], /) -> None']),
+    (('Py5Shape', 'get_texture_uvs'), ['(*, dst: npt.NDArray[np.floating] = None) -> npt.NDArray[np.floating]']),
+    (('Py5Shape', 'set_texture_uvs'), ['(uvs: npt.NDArray[np.floating], /) -> None']),
     (('Sketch', 'run_sketch'), ['(block: bool = None, *, py5_options: list[str] = None, sketch_args: list[str] = None, sketch_functions: dict[str, Callable] = None, jclassname: str = None, jclass_params: tuple[Any] = ()) -> None']),
     (('Py5Functions', 'create_font_file'), ['(font_name: str, font_size: int, filename: str = None, characters: str = None, pause: bool = True) -> None']),
     (('Py5Functions', 'get_current_sketch'), ['() -> Sketch']),
@@ -647,6 +675,8 @@ METHOD_SIGNATURES_LOOKUP = dict([(('Sketch', 'alpha'), ['(rgb: int, /) -> float'
     (('Py5Functions', 'register_image_conversion'), ['(precondition: Callable, convert_function: Callable) -> None']),
     (('Py5Functions', 'register_shape_conversion'), ['(precondition: Callable, convert_function: Callable) -> None']),
     (('Py5Tools', 'is_jvm_running'), ['() -> bool']),
+    (('Py5Tools', 'set_headless_mode'), ['(headless: bool = True) -> None']),
+    (('Py5Tools', 'is_headless_mode'), ['() -> bool']),
     (('Py5Tools', 'add_options'), ['(*options: list[str]) -> None']),
     (('Py5Tools', 'get_classpath'), ['() -> str']),
     (('Py5Tools', 'add_classpath'), ['(classpath: Union[Path, str]) -> None']),
@@ -658,6 +688,7 @@ METHOD_SIGNATURES_LOOKUP = dict([(('Sketch', 'alpha'), ['(rgb: int, /) -> float'
     (('Py5Tools', 'animated_gif'), ['(filename: str, *, count: int = 0, period: float = 0.0, frame_numbers: Iterable = None, duration: float = 0.0, loop: int = 0, optimize: bool = True, sketch: Sketch = None, hook_post_draw: bool = False, block: bool = False) -> None']),
     (('Py5Tools', 'offline_frame_processing'), ['(func: Callable[[npt.NDArray[np.uint8]], None], *, limit: int = 0, period: float = 0.0, batch_size: int = 1, complete_func: Callable[[], None] = None, stop_processing_func: Callable[[], bool] = None, sketch: Sketch = None, hook_post_draw: bool = False, queue_limit: int = None, block: bool = False, display_progress: bool = True) -> None']),
     (('Py5Tools', 'capture_frames'), ['(*, count: float = 0, period: float = 0.0, frame_numbers: Iterable = None, sketch: Sketch = None, hook_post_draw: bool = False, block: bool = False) -> list[PIL_Image]']),
+    (('Py5Tools', 'stream_frames'), ['(*, host: str = "127.0.0.1", port: int = 0, frame_rate: float = 15.0, scale: float = 1.0, quality: int = 75, time_limit: float = 0.0, sketch: Sketch = None, hook_post_draw: bool = False) -> FrameStreamServer']),
     (('Py5Tools', 'sketch_portal'), ['(*, time_limit: float = 0.0, throttle_frame_rate: float = 30, scale: float = 1.0, quality: int = 75, portal_widget: Py5SketchPortal = None, sketch: Sketch = None, hook_post_draw: bool = False) -> None']),
     (('Py5Tools', 'live_coding_screenshot'), ['(screenshot_name: str = None) -> None']),
     (('Py5Tools', 'live_coding_copy_code'), ['(copy_name: str = None) -> None']),
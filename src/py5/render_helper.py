@@ -24,6 +24,7 @@ import sys
 from typing import Callable
 
 import numpy as np
+import py5_tools
 from PIL import Image
 from PIL.Image import Image as PIL_Image
 
@@ -135,15 +136,20 @@ def _check_allowed_renderer(renderer):
         Sketch.P2D: "P2D",
         Sketch.P3D: "P3D",
     }.get(renderer, renderer)
-    renderers = (
-        [Sketch.HIDDEN, Sketch.JAVA2D, Sketch.FX2D]
-        if sys.platform == "darwin"
-        else [Sketch.HIDDEN, Sketch.JAVA2D, Sketch.FX2D, Sketch.P2D, Sketch.P3D]
-    )
+    if py5_tools.is_headless_mode():
+        renderers = [Sketch.HIDDEN, Sketch.JAVA2D]
+    elif sys.platform == "darwin":
+        renderers = [Sketch.HIDDEN, Sketch.JAVA2D, Sketch.FX2D]
+    else:
+        renderers = [Sketch.HIDDEN, Sketch.JAVA2D, Sketch.FX2D, Sketch.P2D, Sketch.P3D]
     if renderer not in renderers:
         return (
             f"Sorry, the render helper tools do not support the {renderer_name} renderer"
-            + (" on macOS." if sys.platform == "darwin" else ".")
+            + (
+                " in headless mode."
+                if py5_tools.is_headless_mode()
+                else " on macOS." if sys.platform == "darwin" else "."
+            )
         )
     else:
         return None
@@ -20,6 +20,7 @@
 from __future__ import annotations
 
 import functools
+import sys
 import types
 import weakref
 from pathlib import Path
@@ -113,7 +114,137 @@ def _return_numpy_array(f):
     return decorated
 
 
+def _declared_field(cls, name):
+    field = cls.class_.getDeclaredField(name)
+    field.setAccessible(True)
+    return field
+
+
 _Py5ShapeHelper = JClass("py5.core.Py5ShapeHelper")
+_PShape = JClass("processing.core.PShape")
+
+# PShape.contains() uses the shape's matrix, which has no public getter
+_PSHAPE_MATRIX_FIELD = _declared_field(_PShape, "matrix")
+
+# limits the size of the temporary (points, edges) arrays for hit testing
+_HIT_TEST_CHUNK_SIZE = 2**20
+
+
+# P2D and P3D shapes keep their vertex data in flat arrays that can be copied in one
+# call. Processing's per-vertex getters and setters read and write the same arrays.
+_PShapeOpenGL = JClass("processing.opengl.PShapeOpenGL")
+_PSHAPE_FAMILY_FIELD = _declared_field(_PShape, "family")
+_PSHAPE_OPEN_SHAPE_FIELD = _declared_field(_PShape, "openShape")
+_PSHAPE_TEXTURE_MODE_FIELD = _declared_field(_PShape, "textureMode")
+_PSHAPE_IMAGE_FIELD = _declared_field(_PShape, "image")
+_PSHAPE_OPENGL_ROOT_FIELD = _declared_field(_PShapeOpenGL, "root")
+_PSHAPE_OPENGL_TESS_UPDATE_FIELD = _declared_field(_PShapeOpenGL, "tessUpdate")
+_PSHAPE_OPENGL_IN_GEO_FIELD = _declared_field(_PShapeOpenGL, "inGeo")
+_PSHAPE_OPENGL_MARK_FOR_TESSELLATION = _PShapeOpenGL.class_.getDeclaredMethod(
+    "markForTessellation"
+)
+_PSHAPE_OPENGL_MARK_FOR_TESSELLATION.setAccessible(True)
+_IN_GEOMETRY_FIELDS = {
+    name: _declared_field(JClass(_PSHAPE_OPENGL_IN_GEO_FIELD.getType()), name)
+    for name in ["vertices", "colors", "normals", "texcoords"]
+}
+_TEXTURE_MODE_IMAGE = 2
+
+
+def _get_in_geometry_array(pshape, name, count, stride, setting=False):
+    # the flat array for one kind of vertex data, or None if the shape's getters and
+    # setters don't use it. this is the case for shapes made with other renderers,
+    # GROUP shapes, shapes being tessellated, and for setters, open shapes and the
+    # coordinates of PATH shapes.
+    if not isinstance(pshape, _PShapeOpenGL):
+        return None
+    family = _PSHAPE_FAMILY_FIELD.getInt(pshape)
+    root = _PSHAPE_OPENGL_ROOT_FIELD.get(pshape)
+    if family == Py5Shape.GROUP or _PSHAPE_OPENGL_TESS_UPDATE_FIELD.getBoolean(root):
+        return None
+    if setting and (
+        _PSHAPE_OPEN_SHAPE_FIELD.getBoolean(pshape)
+        or (name == "vertices" and family == Py5Shape.PATH)
+    ):
+        return None
+    in_geo = _PSHAPE_OPENGL_IN_GEO_FIELD.get(pshape)
+    array = _IN_GEOMETRY_FIELDS[name].get(in_geo)
+    if array is None or len(array) < count * stride:
+        return None
+    return array
+
+
+def _native_to_java_argb(colors):
+    # the same conversion as PGL.nativeToJavaARGB()
+    colors = colors.view(np.uint32)
+    if sys.byteorder == "little":
+        rb = colors & 0x00FF00FF
+        colors = (colors & 0xFF00FF00) | (rb << 16) | (rb >> 16)
+    else:
+        colors = (colors >> 8) | (colors << 24)
+    return colors.view(np.int32)
+
+
+def _get_path_data(pshape):
+    count = pshape.getVertexCount()
+    get_x, get_y = pshape.getVertexX, pshape.getVertexY
+    vertices = np.empty((count, 2), dtype=np.float64)
+    vertices[:, 0] = [get_x(i) for i in range(count)]
+    vertices[:, 1] = [get_y(i) for i in range(count)]
+
+    matrix = _PSHAPE_MATRIX_FIELD.get(pshape)
+    if matrix is not None:
+        matrix = np.array(matrix.get(None), dtype=np.float64)
+        if len(matrix) == 6:
+            matrix = matrix.reshape(2, 3)
+        else:
+            matrix = matrix.reshape(4, 4)[:2, [0, 1, 3]]
+
+    return vertices, matrix
+
+
+def _iter_path_data(pshape, method):
+    # GROUP shapes contain a point if any of their children do
+    family = pshape.getFamily()
+    if family == Py5Shape.GROUP:
+        for i in range(pshape.getChildCount()):
+            yield from _iter_path_data(pshape.getChild(i), method)
+    elif family in [Py5Shape.PATH, Py5Shape.GEOMETRY]:
+        yield _get_path_data(pshape)
+    else:
+        raise RuntimeError(f"The {method}() method is only implemented for paths.")
+
+
+def _points_in_path(points, vertices, matrix):
+    # this is the same even-odd test as PShape.contains(), which transforms the
+    # point with the shape's matrix but interpolates with the untransformed y value
+    result = np.zeros(len(points), dtype=bool)
+    if len(vertices) == 0 or len(points) == 0:
+        return result
+
+    raw_y = points[:, 1]
+    if matrix is not None:
+        points = points @ matrix[:, :2].T + matrix[:, 2]
+    x_i, y_i = vertices[:, 0], vertices[:, 1]
+    x_j, y_j = np.roll(x_i, 1), np.roll(y_i, 1)
+    slope = np.divide(x_j - x_i, y_j - y_i, out=np.zeros_like(x_i), where=y_j != y_i)
+
+    chunk = max(1, _HIT_TEST_CHUNK_SIZE // len(vertices))
+    for start in range(0, len(points), chunk):
+        px = points[start : start + chunk, 0, None]
+        py = points[start : start + chunk, 1, None]
+        ry = raw_y[start : start + chunk, None]
+        crossings = ((y_i > py) != (y_j > py)) & (px < slope * (ry - y_i) + x_i)
+        result[start : start + chunk] = np.logical_xor.reduce(crossings, axis=1)
+
+    return result
+
+
+def _as_points_array(points, method):
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim != 2 or points.shape[1] != 2:
+        raise ValueError(f"{method}() points must be an array with shape (n, 2)")
+    return points
 
 
 class Py5Shape:
@@ -667,6 +798,294 @@ class Py5Shape:
             coordinates = list(coordinates)
         _Py5ShapeHelper.quadraticVertices(self._instance, coordinates)
 
+    def _vertex_data_dst(self, dst, columns, dtype, method):
+        count = self._instance.getVertexCount()
+        if dst is None:
+            return np.empty((count, columns[0]), dtype=dtype)
+        if (
+            not isinstance(dst, np.ndarray)
+            or dst.ndim != 2
+            or dst.shape[0] != count
+            or dst.shape[1] not in columns
+        ):
+            raise ValueError(
+                f"{method}() dst parameter must be a numpy array with shape "
+                + " or ".join(f"({count}, {c})" for c in columns)
+            )
+        return dst
+
+    def _get_vertex_data(self, dst, name, stride, getters):
+        count, columns = dst.shape[0], min(dst.shape[1], len(getters))
+        array = _get_in_geometry_array(self._instance, name, count, stride)
+        if array is not None:
+            data = np.asarray(array[: count * stride]).reshape(count, stride)
+            dst[:, :columns] = data[:, :columns]
+        else:
+            for c in range(columns):
+                dst[:, c] = [getters[c](i) for i in range(count)]
+        return dst
+
+    def _set_vertex_data(self, data, columns, setter, method, name, stride, divisor=1):
+        data = np.asarray(data)
+        count = self._instance.getVertexCount()
+        if data.ndim != 2 or data.shape[0] != count or data.shape[1] not in columns:
+            raise ValueError(
+                f"{method}() parameter must be an array with shape "
+                + " or ".join(f"({count}, {c})" for c in columns)
+            )
+        array = _get_in_geometry_array(self._instance, name, count, stride, True)
+        if array is not None:
+            # write all of the values at once, with zeros for missing columns, and
+            # then do what the setter does after writing a vertex's values
+            values = np.zeros((count, stride), dtype=np.float32)
+            values[:, : data.shape[1]] = data
+            values /= divisor
+            array[: count * stride] = values.ravel()
+            _PSHAPE_OPENGL_MARK_FOR_TESSELLATION.invoke(self._instance)
+        else:
+            # one call per vertex. every call has the same argument types, so JPype
+            # reuses the overload it matched for the first call.
+            for i, row in enumerate(data.tolist()):
+                setter(i, *row)
+
+    def get_vertices(
+        self, *, dst: npt.NDArray[np.floating] = None
+    ) -> npt.NDArray[np.floating]:
+        """Get the coordinates of all of the vertices of a `Py5Shape` as a numpy array.
+
+        Parameters
+        ----------
+
+        dst: npt.NDArray[np.floating] = None
+            existing array to write the coordinates to
+
+        Notes
+        -----
+
+        Get the coordinates of all of the vertices of a `Py5Shape` as a numpy array.
+        The array will have one row for each vertex and two or three columns for 2D or
+        3D shapes, respectively. This method exists to provide an alternative to
+        repeatedly calling `Py5Shape.get_vertex()` in a loop, which creates a new
+        `Py5Vector` object for every vertex. The coordinates of `P2D` and `P3D` shapes
+        are copied all at once. Other shapes are read one coordinate at a time, which
+        is slower but still avoids the overhead of creating the `Py5Vector` objects.
+
+        Use the `dst` parameter to write the coordinates to an existing array instead
+        of allocating a new one. Its first dimension must equal the number of vertices
+        and it may have two or three columns, regardless of the shape's
+        dimensionality. The z coordinates of a 2D shape are zero. Reusing an array is
+        recommended when the vertices are read every frame.
+
+        This method can only be used for a complete `Py5Shape` object, and never within
+        a `Py5Shape.begin_shape()` and `Py5Shape.end_shape()` pair."""
+        is_3d = self._instance.is3D()
+        dst = self._vertex_data_dst(
+            dst, (3, 2) if is_3d else (2, 3), np.float32, "get_vertices"
+        )
+        getters = [self._instance.getVertexX, self._instance.getVertexY]
+        if is_3d:
+            getters.append(self._instance.getVertexZ)
+        elif dst.shape[1] == 3:
+            dst[:, 2] = 0
+        return self._get_vertex_data(dst, "vertices", 3, getters)
+
+    def set_vertices(self, coordinates: npt.NDArray[np.floating], /) -> None:
+        """Set the coordinates of all of the vertices of a `Py5Shape`.
+
+        Parameters
+        ----------
+
+        coordinates: npt.NDArray[np.floating]
+            2D array of vertex coordinates
+
+        Notes
+        -----
+
+        Set the coordinates of all of the vertices of a `Py5Shape`. The `coordinates`
+        parameter should be a numpy array with one row for each vertex in the shape and
+        two or three columns for 2D or 3D points, respectively. This method exists to
+        provide an alternative to repeatedly calling `Py5Shape.set_vertex()` in a loop.
+        Use it together with `Py5Shape.get_vertices()` to deform or morph a shape.
+        The coordinates of `P2D` and `P3D` shapes are copied all at once. Other shapes
+        are set one vertex at a time.
+
+        This method can only be used for a complete `Py5Shape` object, and never within
+        a `Py5Shape.begin_shape()` and `Py5Shape.end_shape()` pair."""
+        self._set_vertex_data(
+            coordinates,
+            (2, 3),
+            self._instance.setVertex,
+            "set_vertices",
+            "vertices",
+            3,
+        )
+
+    def get_fills(
+        self, *, dst: npt.NDArray[np.integer] = None
+    ) -> npt.NDArray[np.integer]:
+        """Get the fill color of each of the individual vertices of a `Py5Shape`.
+
+        Parameters
+        ----------
+
+        dst: npt.NDArray[np.integer] = None
+            existing array to write the fill colors to
+
+        Notes
+        -----
+
+        Get the fill color of each of the individual vertices of a `Py5Shape` as a
+        numpy array. This method exists to provide an alternative to repeatedly calling
+        `Py5Shape.get_fill()` in a loop. The colors can be modified and passed to
+        `Py5Shape.set_fills()`.
+
+        The colors are stored as signed 32 bit integers (`np.int32`), the same values
+        Processing uses. Unlike `Py5Shape.get_fill()`, they are not `Py5Color`
+        objects, so printing a value shows a number instead of a hex color code.
+
+        Use the `dst` parameter to write the fill colors to an existing array instead
+        of allocating a new one. It must be a 1D array with one element for each
+        vertex.
+
+        This method can only be used for a complete `Py5Shape` object, and never within
+        a `Py5Shape.begin_shape()` and `Py5Shape.end_shape()` pair."""
+        count = self._instance.getVertexCount()
+        if dst is None:
+            dst = np.empty(count, dtype=np.int32)
+        elif not isinstance(dst, np.ndarray) or dst.shape != (count,):
+            raise ValueError(
+                f"get_fills() dst parameter must be a numpy array with shape ({count},)"
+            )
+        array = _get_in_geometry_array(self._instance, "colors", count, 1)
+        if array is None:
+            get_fill = self._instance.getFill
+            dst[:] = [get_fill(i) for i in range(count)]
+        elif _PSHAPE_IMAGE_FIELD.get(self._instance) is not None:
+            # getFill() returns 0 for textured shapes
+            dst[:] = 0
+        else:
+            dst[:] = _native_to_java_argb(np.asarray(array[:count]))
+        return dst
+
+    def get_normals(
+        self, *, dst: npt.NDArray[np.floating] = None
+    ) -> npt.NDArray[np.floating]:
+        """Get the normal vectors of all of the vertices of a `Py5Shape`.
+
+        Parameters
+        ----------
+
+        dst: npt.NDArray[np.floating] = None
+            existing array to write the normal vectors to
+
+        Notes
+        -----
+
+        Get the normal vectors of all of the vertices of a `Py5Shape` as a numpy array
+        with one row for each vertex and three columns. This method exists to provide
+        an alternative to repeatedly calling `Py5Shape.get_normal()` in a loop, which
+        creates a new `Py5Vector` object for every vertex.
+
+        Use the `dst` parameter to write the normal vectors to an existing array
+        instead of allocating a new one.
+
+        This method can only be used for a complete `Py5Shape` object, and never within
+        a `Py5Shape.begin_shape()` and `Py5Shape.end_shape()` pair."""
+        dst = self._vertex_data_dst(dst, (3,), np.float32, "get_normals")
+        getters = [
+            self._instance.getNormalX,
+            self._instance.getNormalY,
+            self._instance.getNormalZ,
+        ]
+        return self._get_vertex_data(dst, "normals", 3, getters)
+
+    def set_normals(self, normals: npt.NDArray[np.floating], /) -> None:
+        """Set the normal vectors of all of the vertices of a `Py5Shape`.
+
+        Parameters
+        ----------
+
+        normals: npt.NDArray[np.floating]
+            2D array of normal vectors
+
+        Notes
+        -----
+
+        Set the normal vectors of all of the vertices of a `Py5Shape`. The `normals`
+        parameter should be a numpy array with one row for each vertex in the shape and
+        three columns. Normal vectors are only used by the `P3D` renderer.
+
+        This method can only be used for a complete `Py5Shape` object, and never within
+        a `Py5Shape.begin_shape()` and `Py5Shape.end_shape()` pair."""
+        self._set_vertex_data(
+            normals, (3,), self._instance.setNormal, "set_normals", "normals", 3
+        )
+
+    def get_texture_uvs(
+        self, *, dst: npt.NDArray[np.floating] = None
+    ) -> npt.NDArray[np.floating]:
+        """Get the UV texture mapping values of all of the vertices of a `Py5Shape`.
+
+        Parameters
+        ----------
+
+        dst: npt.NDArray[np.floating] = None
+            existing array to write the texture mapping values to
+
+        Notes
+        -----
+
+        Get the UV texture mapping values of all of the vertices of a `Py5Shape` as a
+        numpy array with one row for each vertex and two columns. This method exists to
+        provide an alternative to repeatedly calling `Py5Shape.get_texture_u()` and
+        `Py5Shape.get_texture_v()` in a loop.
+
+        Use the `dst` parameter to write the texture mapping values to an existing
+        array instead of allocating a new one.
+
+        This method can only be used for a complete `Py5Shape` object, and never within
+        a `Py5Shape.begin_shape()` and `Py5Shape.end_shape()` pair."""
+        dst = self._vertex_data_dst(dst, (2,), np.float32, "get_texture_uvs")
+        getters = [self._instance.getTextureU, self._instance.getTextureV]
+        return self._get_vertex_data(dst, "texcoords", 2, getters)
+
+    def set_texture_uvs(self, uvs: npt.NDArray[np.floating], /) -> None:
+        """Set the UV texture mapping values of all of the vertices of a `Py5Shape`.
+
+        Parameters
+        ----------
+
+        uvs: npt.NDArray[np.floating]
+            2D array of UV texture mapping values
+
+        Notes
+        -----
+
+        Set the UV texture mapping values of all of the vertices of a `Py5Shape`. The
+        `uvs` parameter should be a numpy array with one row for each vertex in the
+        shape and two columns. This method exists to provide an alternative to
+        repeatedly calling `Py5Shape.set_texture_uv()` in a loop.
+
+        This method can only be used for a complete `Py5Shape` object, and never within
+        a `Py5Shape.begin_shape()` and `Py5Shape.end_shape()` pair."""
+        # setTextureUV() converts IMAGE mode values to the normalized values it stores
+        divisor = 1
+        image = _PSHAPE_IMAGE_FIELD.get(self._instance)
+        if (
+            image is not None
+            and _PSHAPE_TEXTURE_MODE_FIELD.getInt(self._instance) == _TEXTURE_MODE_IMAGE
+        ):
+            divisor = np.array([image.width, image.height], dtype=np.float32)
+        self._set_vertex_data(
+            uvs,
+            (2,),
+            self._instance.setTextureUV,
+            "set_texture_uvs",
+            "texcoords",
+            2,
+            divisor,
+        )
+
     ARC = 32
     BEVEL = 32
     BEZIER_VERTEX = 1
@@ -1897,6 +2316,41 @@ class Py5Shape:
         """
         return self._instance.colorMode(*args)
 
+    def contains_points(
+        self, points: npt.NDArray[np.floating], /
+    ) -> npt.NDArray[np.bool_]:
+        """Test many points at once to see if they are contained within the `Py5Shape`
+        object.
+
+        Parameters
+        ----------
+
+        points: npt.NDArray[np.floating]
+            2D array of point coordinates with one row for each point
+
+        Notes
+        -----
+
+        Test many points at once to see if they are contained within the `Py5Shape`
+        object. The `points` parameter should be a numpy array with one row for each
+        point and two columns. The returned value is a boolean numpy array with one
+        element for each point. The result is the same as calling `Py5Shape.contains()`
+        for each point, but the shape's vertices are only read once and the test is
+        done with numpy instead of one Java call per point.
+
+        Like `Py5Shape.contains()`, this method will only work for a `Py5Shape` object
+        that is a `PATH` shape or a `GROUP` of `PATH` shapes, and it uses a coordinate
+        system that is unique to the shape and how the paths were created.
+
+        To test points against the children of a large `GROUP` shape, use
+        `Py5ShapeIndex` to find which child shapes contain each point."""
+        points = _as_points_array(points, "contains_points")
+        result = np.zeros(len(points), dtype=bool)
+        for vertices, matrix in _iter_path_data(self._instance, "contains_points"):
+            remaining = np.flatnonzero(~result)
+            result[remaining] = _points_in_path(points[remaining], vertices, matrix)
+        return result
+
     def contains(self, x: float, y: float, /) -> bool:
         """Boolean value reflecting if the given coordinates are or are not contained
         within the `Py5Shape` object.
@@ -8214,3 +8668,183 @@ class Py5Shape:
         `texture_mode()` method before the shape is created.
         """
         return self._instance.vertex(*args)
+
+
+class Py5ShapeIndex:
+    """Spatial index for hit testing points against the children of a `GROUP`
+    `Py5Shape` object.
+
+    Parameters
+    ----------
+
+    cell_size: float = None
+        size of the grid cells used to index the child shapes
+
+    shape: Py5Shape
+        `GROUP` shape with the child shapes to index
+
+    Notes
+    -----
+
+    Spatial index for hit testing points against the children of a `GROUP`
+    `Py5Shape` object. Use the index's `query()` method to find the indices of the
+    child shapes that contain each point. For example, an interactive map can find
+    the region under the mouse with one query per frame instead of calling
+    `Py5Shape.contains()` for every child shape.
+
+    The child shapes' bounding boxes are stored in a uniform grid so only the child
+    shapes near each point are tested. Set the size of the grid cells with the
+    `cell_size` parameter. By default it is the median size of the child shapes'
+    bounding boxes.
+
+    The index reads the child shapes' vertices when it is created. Create a new
+    index after changing the vertices or transformations of the child shapes. Hit
+    testing works the same way as `Py5Shape.contains_points()`."""
+
+    def __init__(self, shape: Py5Shape, *, cell_size: float = None):
+        pshape = shape._instance
+        if pshape.getFamily() != Py5Shape.GROUP:
+            raise ValueError("Py5ShapeIndex can only index GROUP shapes")
+
+        self._child_count = pshape.getChildCount()
+        paths, owners = [], []
+        for child in range(self._child_count):
+            for vertices, matrix in _iter_path_data(
+                pshape.getChild(child), "Py5ShapeIndex"
+            ):
+                if len(vertices):
+                    paths.append((vertices, matrix))
+                    owners.append(child)
+        self._paths = paths
+        self._owners = np.array(owners, dtype=np.intp)
+
+        # a transformed path is always tested because its bounding box is not known
+        # in the query coordinate system
+        is_bounded = np.array([matrix is None for _, matrix in paths], dtype=bool)
+        self._unbounded = np.flatnonzero(~is_bounded)
+        self._bounded = np.flatnonzero(is_bounded)
+        self._bounds = np.zeros((len(paths), 4))
+        for i in self._bounded:
+            vertices = paths[i][0]
+            self._bounds[i, :2] = vertices.min(axis=0)
+            self._bounds[i, 2:] = vertices.max(axis=0)
+
+        bounds = self._bounds[self._bounded]
+        if len(bounds):
+            self._origin = bounds[:, :2].min(axis=0)
+            extent = bounds[:, 2:].max(axis=0) - self._origin
+            if cell_size is None:
+                cell_size = np.median((bounds[:, 2:] - bounds[:, :2]).max(axis=1))
+            # keep the number of grid cells reasonable
+            cell_size = max(cell_size, extent.max() / 1024, 1e-9)
+        else:
+            self._origin = np.zeros(2)
+            extent = np.zeros(2)
+            cell_size = 1.0
+        self._cell_size = cell_size
+        self._grid_shape = (extent // cell_size).astype(np.intp) + 1
+
+        # store the bounded paths overlapping each grid cell in one sorted array
+        low = ((bounds[:, :2] - self._origin) // cell_size).astype(np.intp)
+        high = ((bounds[:, 2:] - self._origin) // cell_size).astype(np.intp)
+        cols, rows = (high - low + 1).T
+        counts = cols * rows
+        entries = np.repeat(np.arange(len(bounds)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        cell_x = low[entries, 0] + offsets % cols[entries]
+        cell_y = low[entries, 1] + offsets // cols[entries]
+        cells = cell_y * self._grid_shape[0] + cell_x
+        order = np.argsort(cells, kind="stable")
+        self._cell_paths = self._bounded[entries[order]]
+        self._cell_starts = np.searchsorted(
+            cells[order], np.arange(self._grid_shape.prod() + 1)
+        )
+
+    def _get_child_count(self) -> int:
+        return self._child_count
+
+    child_count: int = property(
+        fget=_get_child_count,
+        doc="""Number of child shapes in the indexed `GROUP` shape.""",
+    )
+
+    def query(self, points: npt.NDArray[np.floating], /) -> npt.NDArray[np.integer]:
+        """Find the child shapes that contain each point.
+
+        Parameters
+        ----------
+
+        points: npt.NDArray[np.floating]
+            point coordinates, either one point or a 2D array with one row for each point
+
+        Notes
+        -----
+
+        Find the child shapes that contain each point. If `points` is a single point,
+        such as `[mouse_x, mouse_y]`, the returned value is a numpy array of the indices
+        of the child shapes that contain that point. If `points` is a 2D array with one
+        row for each point, the returned value is a numpy array with two rows. The
+        first row has point indices and the second row has the indices of the child
+        shapes that contain those points. A point contained by several child shapes
+        appears once for each of them."""
+        points = np.asarray(points, dtype=np.float64)
+        single_point = points.shape == (2,)
+        points = _as_points_array(
+            points.reshape(1, 2) if single_point else points, "query"
+        )
+
+        # find the candidate paths in the grid cells of the points
+        cells = ((points - self._origin) // self._cell_size).astype(np.intp)
+        in_grid = np.flatnonzero(
+            ((cells >= 0) & (cells < self._grid_shape)).all(axis=1)
+        )
+        cells = cells[in_grid, 1] * self._grid_shape[0] + cells[in_grid, 0]
+        starts = self._cell_starts[cells]
+        counts = self._cell_starts[cells + 1] - starts
+        offsets = np.arange(counts.sum()) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        point_ids = np.repeat(in_grid, counts)
+        path_ids = self._cell_paths[np.repeat(starts, counts) + offsets]
+
+        bounds = self._bounds[path_ids]
+        candidate_points = points[point_ids]
+        in_bounds = (
+            (candidate_points >= bounds[:, :2]) & (candidate_points <= bounds[:, 2:])
+        ).all(axis=1)
+        point_ids = np.concatenate(
+            [
+                point_ids[in_bounds],
+                np.tile(np.arange(len(points)), len(self._unbounded)),
+            ]
+        )
+        path_ids = np.concatenate(
+            [path_ids[in_bounds], np.repeat(self._unbounded, len(points))]
+        )
+
+        # test the candidates one path at a time
+        order = np.argsort(path_ids, kind="stable")
+        point_ids, path_ids = point_ids[order], path_ids[order]
+        hits = np.zeros(len(point_ids), dtype=bool)
+        boundaries = np.flatnonzero(np.diff(path_ids)) + 1
+        for start, stop in zip(
+            np.concatenate([[0], boundaries]),
+            np.concatenate([boundaries, [len(path_ids)]]),
+        ):
+            if start == stop:
+                continue
+            vertices, matrix = self._paths[path_ids[start]]
+            hits[start:stop] = _points_in_path(
+                points[point_ids[start:stop]], vertices, matrix
+            )
+
+        # a child shape contains a point if any of its paths do
+        keys = np.unique(
+            point_ids[hits] * max(self._child_count, 1) + self._owners[path_ids[hits]]
+        )
+        point_ids, child_ids = np.divmod(keys, max(self._child_count, 1))
+        if single_point:
+            return child_ids
+        return np.vstack([point_ids, child_ids])
@@ -79,96 +79,190 @@ def register_shape_conversion(
 
 
 try:
+    import shapely
     from shapely import affinity
-    from shapely.geometry import (
-        GeometryCollection,
-        LinearRing,
-        LineString,
-        MultiLineString,
-        MultiPoint,
-        MultiPolygon,
-        Point,
-        Polygon,
-    )
+    from shapely.geometry import MultiPolygon, Polygon
+    from shapely.geometry.base import BaseGeometry
+
+    try:
+        from geopandas import GeoSeries
+        from geopandas.array import GeometryArray
+
+        _shapely_array_types = (GeoSeries, GeometryArray)
+    except ImportError:
+        _shapely_array_types = ()
+
+    _POINT, _LINESTRING, _LINEARRING, _POLYGON, _MULTIPOINT = 0, 1, 2, 3, 4
+    _COLLECTION_TYPES = [5, 6, 7]  # MultiLineString, MultiPolygon, GeometryCollection
 
     def shapely_to_py5shape_precondition(obj):
-        return isinstance(
-            obj,
-            (
-                GeometryCollection,
-                LinearRing,
-                LineString,
-                MultiLineString,
-                MultiPoint,
-                MultiPolygon,
-                Point,
-                Polygon,
-            ),
+        if isinstance(obj, BaseGeometry):
+            return True
+        if isinstance(obj, _shapely_array_types):
+            return True
+        return (
+            isinstance(obj, np.ndarray)
+            and obj.dtype == object
+            and obj.size > 0
+            and bool(np.all(shapely.is_geometry(obj) | shapely.is_missing(obj)))
         )
 
-    def shapely_to_py5shape_converter(sketch, obj, _first_call=True, **kwargs):
-        if _first_call and kwargs.get("flip_y_axis", False):
-            obj = affinity.scale(obj, yfact=-1, origin="center")
+    def _flatten_shapely_geometries(geoms):
+        # Break the geometry collections down into a flat list of nodes, level by
+        # level, remembering each node's parent. Each collection becomes a GROUP shape
+        # and everything else is a leaf shape. Parts of a collection stay in order.
+        nodes = np.empty(0, dtype=object)
+        parents = np.empty(0, dtype=np.int64)
+        level, level_parents = geoms, np.full(len(geoms), -1)
+        while len(level):
+            type_ids = shapely.get_type_id(level)
+            # skip missing geometries and empty geometries that have no shape
+            keep = (type_ids >= 0) & ~(
+                shapely.is_empty(level)
+                & np.isin(type_ids, [_POINT, _LINEARRING, _MULTIPOINT])
+            )
+            level, level_parents, type_ids = (
+                level[keep],
+                level_parents[keep],
+                type_ids[keep],
+            )
+            offset = len(nodes)
+            nodes = np.concatenate([nodes, level])
+            parents = np.concatenate([parents, level_parents])
+
+            collections = np.flatnonzero(np.isin(type_ids, _COLLECTION_TYPES))
+            level, part_index = shapely.get_parts(level[collections], return_index=True)
+            level_parents = offset + collections[part_index]
+
+        return nodes, parents
+
+    def _split(coords, index, count):
+        # split a coordinate array into one array for each geometry
+        lengths = np.bincount(index, minlength=count)
+        return np.split(coords, np.cumsum(lengths)[:-1]) if count else []
+
+    def _shapely_to_pshape(sketch, nodes, parents, lines_allow_fill, flip_y_axis):
+        from .shape import _Py5ShapeHelper
+
+        type_ids = shapely.get_type_id(nodes)
+        include_z = bool(np.any(shapely.has_z(nodes)))
+        leaves = np.flatnonzero(~np.isin(type_ids, _COLLECTION_TYPES))
+        polygons = leaves[type_ids[leaves] == _POLYGON]
+        others = leaves[type_ids[leaves] != _POLYGON]
+        rings, ring_index = shapely.get_rings(nodes[polygons], return_index=True)
+
+        # get all of the coordinates with two calls and flip the y-axis in one step
+        other_coords, other_index = shapely.get_coordinates(
+            nodes[others], include_z=include_z, return_index=True
+        )
+        ring_coords, ring_coord_index = shapely.get_coordinates(
+            rings, include_z=include_z, return_index=True
+        )
+        coords = np.concatenate([other_coords, ring_coords]).astype(np.float32)
+        if include_z:
+            coords = np.nan_to_num(coords)
+        if flip_y_axis:
+            ymin, ymax = shapely.total_bounds(nodes[parents == -1])[[1, 3]]
+            coords[:, 1] = (ymin + ymax) - coords[:, 1]
+
+        leaf_vertices = dict(
+            zip(others, _split(coords[: len(other_coords)], other_index, len(others)))
+        )
 
-        if isinstance(obj, Polygon):
-            shape = sketch.create_shape()
-            with shape.begin_closed_shape():
-                if obj.exterior.coords:
-                    coords = (
-                        np.array(obj.exterior.coords)
-                        if obj.exterior.is_ccw
-                        else np.array(obj.exterior.coords[::-1])
-                    )
-                    shape.vertices(coords[:-1])
-                for hole in obj.interiors:
-                    with shape.begin_contour():
-                        coords = (
-                            np.array(hole.coords[::-1])
-                            if hole.is_ccw
-                            else np.array(hole.coords)
-                        )
-                        shape.vertices(coords[:-1])
-            return shape
-        elif isinstance(obj, LinearRing):
-            shape = sketch.create_shape()
-            with shape.begin_closed_shape():
-                if not kwargs.get("lines_allow_fill", False):
-                    shape.no_fill()
-                coords = np.array(obj.coords)
-                shape.vertices(coords[:-1])
-            return shape
-        elif isinstance(obj, LineString):
-            coords = np.array(obj.coords)
-            shape = sketch.create_shape()
-            if coords.shape[0] == 2:
-                with shape.begin_shape(sketch.LINES):
-                    shape.vertices(coords)
-            elif coords.shape[0] > 2:
-                with shape.begin_shape():
-                    if not kwargs.get("lines_allow_fill", False):
-                        shape.no_fill()
-                    shape.vertices(coords)
-            return shape
-        elif isinstance(obj, MultiPoint):
-            shape = sketch.create_shape()
-            with shape.begin_shape(sketch.POINTS):
-                coords = np.array([p.coords for p in obj.geoms]).squeeze()
-                shape.vertices(coords)
-            return shape
-        elif isinstance(obj, Point):
-            shape = sketch.create_shape(sketch.POINT, obj.x, obj.y)
-            return shape
-        elif isinstance(obj, (GeometryCollection, MultiPolygon, MultiLineString)):
-            shape = sketch.create_shape(sketch.GROUP)
-            for p in obj.geoms:
-                shape.add_child(
-                    shapely_to_py5shape_converter(
-                        sketch, p, _first_call=False, **kwargs
-                    )
+        # exteriors must be counterclockwise and holes clockwise. flipping the y-axis
+        # reverses the orientation of every ring.
+        is_exterior = np.concatenate([[True], ring_index[1:] != ring_index[:-1]])[
+            : len(rings)
+        ]
+        reverse = (shapely.is_ccw(rings) != flip_y_axis) != is_exterior
+        polygon_rings = {p: [] for p in polygons}
+        for i, ring in enumerate(
+            _split(coords[len(other_coords) :], ring_coord_index, len(rings))
+        ):
+            # the last coordinate repeats the first and is not needed
+            if reverse[i]:
+                ring = ring[::-1]
+            polygon_rings[polygons[ring_index[i]]].append(ring[:-1])
+        leaf_vertices.update(polygon_rings)
+
+        # build the Java objects directly. creating Py5Shape objects for every child
+        # would be much slower.
+        pshapes = []
+        for node, type_id in enumerate(type_ids):
+            if type_id in _COLLECTION_TYPES:
+                pshape = sketch._instance.createShape(sketch.GROUP)
+            elif type_id == _POINT:
+                pshape = sketch._instance.createShape(
+                    sketch.POINT, leaf_vertices[node][0, :2]
                 )
-            return shape
+            else:
+                vertices = leaf_vertices[node]
+                pshape = sketch._instance.createShape()
+                if type_id == _POLYGON:
+                    pshape.beginShape()
+                    if vertices:
+                        _Py5ShapeHelper.vertices(pshape, vertices[0])
+                    for hole in vertices[1:]:
+                        pshape.beginContour()
+                        _Py5ShapeHelper.vertices(pshape, hole)
+                        pshape.endContour()
+                    pshape.endShape(sketch.CLOSE)
+                elif type_id == _LINEARRING:
+                    pshape.beginShape()
+                    if not lines_allow_fill:
+                        pshape.noFill()
+                    _Py5ShapeHelper.vertices(pshape, vertices[:-1])
+                    pshape.endShape(sketch.CLOSE)
+                elif type_id == _LINESTRING and len(vertices) == 2:
+                    pshape.beginShape(sketch.LINES)
+                    _Py5ShapeHelper.vertices(pshape, vertices)
+                    pshape.endShape()
+                elif type_id == _LINESTRING and len(vertices) > 2:
+                    pshape.beginShape()
+                    if not lines_allow_fill:
+                        pshape.noFill()
+                    _Py5ShapeHelper.vertices(pshape, vertices)
+                    pshape.endShape()
+                elif type_id == _MULTIPOINT:
+                    pshape.beginShape(sketch.POINTS)
+                    _Py5ShapeHelper.vertices(pshape, vertices)
+                    pshape.endShape()
+            pshapes.append(pshape)
+            if parents[node] >= 0:
+                pshapes[parents[node]].addChild(pshape)
+
+        return [pshape for pshape, parent in zip(pshapes, parents) if parent == -1]
+
+    def shapely_to_py5shape_converter(sketch, obj, **kwargs):
+        from .shape import Py5Shape
+
+        is_array = not isinstance(obj, BaseGeometry)
+        if is_array:
+            geoms = np.asarray(obj, dtype=object).ravel()
         else:
+            geoms = np.empty(1, dtype=object)
+            geoms[0] = obj
+
+        nodes, parents = _flatten_shapely_geometries(geoms)
+        if not is_array and not len(nodes):
             raise RuntimeError(f"Py5 Converter is not able to convert {str(obj)}")
+        top_level = _shapely_to_pshape(
+            sketch,
+            nodes,
+            parents,
+            kwargs.get("lines_allow_fill", False),
+            kwargs.get("flip_y_axis", False),
+        )
+
+        if is_array:
+            # arrays of geometries become a GROUP shape with one child for each
+            # geometry that isn't missing
+            group = sketch._instance.createShape(sketch.GROUP)
+            for pshape in top_level:
+                group.addChild(pshape)
+            return Py5Shape(group)
+        else:
+            return Py5Shape(top_level[0])
 
     register_shape_conversion(
         shapely_to_py5shape_precondition, shapely_to_py5shape_converter
@@ -229,10 +323,7 @@ try:
 
         def textpath_to_py5shape_converter(sketch, obj: TextPath, **kwargs):
             return shapely_to_py5shape_converter(
-                sketch,
-                textpath_to_shapely_converter(obj, **kwargs),
-                _first_call=True,
-                **kwargs,
+                sketch, textpath_to_shapely_converter(obj, **kwargs), **kwargs
             )
 
         register_shape_conversion(
@@ -344,70 +435,127 @@ try:
 
     # Facet support functions
 
-    def _get_facet_boundaries(obj: Trimesh, min_angle: float = 0.0):
-        boundaries = []
-
-        # first, get the boundaries of the facets
-        for facet_boundary in obj.facets_boundary:
-            # each facet_boundary is an (n, 2) array of vertex indices
-            facet_boundary_edges = {tuple(edge) for edge in facet_boundary.tolist()}
-
-            while facet_boundary_edges:
-                # start a new boundary chain
-                edge = facet_boundary_edges.pop()
-                boundary = [edge[0], edge[1]]
-
-                while boundary[0] != boundary[-1]:
-                    # find the next edge to continue the boundary chain, stopping
-                    # if a loop is formed or no connecting edge is found
-                    for next_edge in facet_boundary_edges:
-                        if next_edge[0] == boundary[-1]:
-                            boundary.append(next_edge[1])
-                            facet_boundary_edges.remove(next_edge)
-                            # found it
-                            break
-                        elif next_edge[1] == boundary[-1]:
-                            boundary.append(next_edge[0])
-                            facet_boundary_edges.remove(next_edge)
-                            # found it
-                            break
-                    else:
-                        # didn't find a connecting edge, move on to the next facet
-                        break
-
-                # note that boundary[0] == boundary[-1], forming a closed loop
-                boundaries.append(boundary)
+    def _chain_edges(edges, groups):
+        # chain the (n, 2) edges into boundaries. edges only connect to edges in
+        # the same group. the edges touching each (group, vertex) pair are found
+        # with a sorted index so every edge is visited a constant number of times.
+        if len(edges) == 0:
+            return []
+
+        ends = edges.ravel()
+        end_groups = np.repeat(groups, 2)
+        order = np.lexsort((ends, end_groups))
+        new_node = np.empty(len(order), dtype=bool)
+        new_node[0] = True
+        new_node[1:] = (ends[order][1:] != ends[order][:-1]) | (
+            end_groups[order][1:] != end_groups[order][:-1]
+        )
+        node_starts = np.append(np.flatnonzero(new_node), len(order)).tolist()
+        nodes = np.empty(len(order), dtype=np.int64)
+        nodes[order] = np.cumsum(new_node) - 1
 
-        # faces with no adjacent and coplanar faces are not part of any facet
-        # need to identify the non-facet faces and add their edges as boundaries
+        ends = ends.tolist()
+        nodes = nodes.tolist()
+        order = order.tolist()
+        # position of the next candidate edge end for each node
+        cursors = node_starts[:-1]
+        used = [False] * len(edges)
 
-        # first, find all faces that are part of facets
-        facet_faces = set()
-        for facet in obj.facets:
-            facet_faces.update(facet.tolist())
+        boundaries = []
+        for e in range(len(edges)):
+            if used[e]:
+                continue
+            # start a new boundary chain
+            used[e] = True
+            boundary = [ends[2 * e], ends[2 * e + 1]]
+            node = nodes[2 * e + 1]
+
+            while boundary[0] != boundary[-1]:
+                # find the next edge to continue the boundary chain, stopping if a
+                # loop is formed or no connecting edge is found
+                i, stop = cursors[node], node_starts[node + 1]
+                while i < stop and used[order[i] >> 1]:
+                    i += 1
+                cursors[node] = i
+                if i == stop:
+                    break
+                end = order[i]
+                used[end >> 1] = True
+                other = end ^ 1
+                boundary.append(ends[other])
+                node = nodes[other]
+
+            # note that boundary[0] == boundary[-1] for a closed loop
+            boundaries.append(boundary)
+
+        return boundaries
 
-        # subtract from the set of all faces to get the non-facet faces
-        all_faces = set(np.arange(len(obj.faces)).tolist())
-        non_facet_faces = all_faces - facet_faces
+    def _get_facet_boundaries(obj: Trimesh, min_angle: float = 0.0):
+        faces = obj.faces
+        facets = obj.facets
+
+        # the boundary edges of a facet are the edges that appear once in that facet
+        face_facet = np.full(len(faces), -1, dtype=np.int64)
+        if len(facets):
+            facet_faces = np.concatenate(facets)
+            face_facet[facet_faces] = np.repeat(
+                np.arange(len(facets)), [len(f) for f in facets]
+            )
+            edges = obj.edges_sorted.reshape((-1, 3, 2))[facet_faces].reshape((-1, 2))
+            edge_facets = np.repeat(face_facet[facet_faces], 3)
+            order = np.lexsort((edges[:, 1], edges[:, 0], edge_facets))
+            keys = np.column_stack([edge_facets, edges])[order]
+            new_key = np.ones(len(keys) + 1, dtype=bool)
+            new_key[1:-1] = (keys[1:] != keys[:-1]).any(axis=1)
+            starts = np.flatnonzero(new_key)
+            single = starts[:-1][np.diff(starts) == 1]
+            boundary_edges = order[single]
+            boundaries = _chain_edges(
+                edges[boundary_edges], edge_facets[boundary_edges]
+            )
+        else:
+            boundaries = []
 
-        # now add the edges of the non-facet faces as boundaries
-        for face in obj.faces[list(non_facet_faces)].tolist():
-            # the face + [face[0]] bit is so that boundary[0] == boundary[-1]
-            boundaries.append(face + [face[0]])
+        # faces with no adjacent and coplanar faces are not part of any facet and
+        # their edges are boundaries. face[0] is repeated to close the loop.
+        non_facet_faces = faces[face_facet == -1]
+        boundaries.extend(
+            np.column_stack([non_facet_faces, non_facet_faces[:, 0]]).tolist()
+        )
 
         # now filter the boundaries to remove edges with angles below min_angle
-        exclude_edges = set()
-        for edge in obj.face_adjacency_edges[obj.face_adjacency_angles < min_angle]:
-            exclude_edges.add((int(edge[0]), int(edge[1])))
-            exclude_edges.add((int(edge[1]), int(edge[0])))
+        exclude = obj.face_adjacency_edges[obj.face_adjacency_angles < min_angle]
+        if len(exclude) == 0 or not boundaries:
+            return boundaries
+
+        # find the boundaries that have at least one excluded edge
+        num_vertices = len(obj.vertices)
+        exclude = np.sort(exclude, axis=1).astype(np.int64)
+        exclude_keys = exclude[:, 0] * num_vertices + exclude[:, 1]
+        lengths = np.array([len(b) for b in boundaries])
+        flat = np.fromiter(
+            (v for b in boundaries for v in b), dtype=np.int64, count=lengths.sum()
+        )
+        pairs = np.sort(np.column_stack([flat[:-1], flat[1:]]), axis=1)
+        is_excluded = np.isin(pairs[:, 0] * num_vertices + pairs[:, 1], exclude_keys)
+        # pairs that span two boundaries are not edges
+        is_excluded[np.cumsum(lengths)[:-1] - 1] = False
+        touched = np.add.reduceat(
+            np.append(is_excluded, False), np.cumsum(lengths) - lengths
+        )
+        exclude_edges = {tuple(edge) for edge in exclude.tolist()}
 
         filtered_boundaries = []
-        for boundary in boundaries:
+        for boundary, is_touched in zip(boundaries, touched.tolist()):
+            if not is_touched:
+                filtered_boundaries.append(boundary)
+                continue
+
             filtered_boundary = []
             boundary_segment = []
 
             for a, b in pairwise(boundary):
-                if (a, b) in exclude_edges:
+                if (min(a, b), max(a, b)) in exclude_edges:
                     if boundary_segment:
                         # save segment and start a new one
                         filtered_boundary.append(boundary_segment)
@@ -439,6 +587,8 @@ try:
         return filtered_boundaries
 
     def _trimesh_facet_conversion(sketch, obj: Trimesh, min_angle: float):
+        from .shape import _Py5ShapeHelper
+
         boundaries = _get_facet_boundaries(obj, min_angle)
 
         shape = sketch.create_shape(sketch.GROUP)
@@ -450,29 +600,42 @@ try:
             base_shape.vertices(obj.vertices[obj.faces.flatten()])
         shape.add_child(base_shape)
 
-        # now add the boundary lines
-        for boundary in boundaries:
-            # each boundary will be its own child shape
-            boundary_shape = sketch.create_shape()
+        # now add the boundary lines. each boundary will be its own child shape.
+        # the vertices are gathered with one indexing operation and the children
+        # are built directly on the Java objects, which is much faster than
+        # creating a Py5Shape object for every boundary.
+        if not boundaries:
+            return shape
+        lengths = [len(b) for b in boundaries]
+        boundary_vertices = np.split(
+            obj.vertices[np.concatenate(boundaries)].astype(np.float32),
+            np.cumsum(lengths)[:-1],
+        )
+
+        pshape = shape._instance
+        for boundary, vertices in zip(boundaries, boundary_vertices):
+            boundary_shape = sketch._instance.createShape()
 
             if boundary[0] == boundary[-1]:
                 # indicates a closed loop / closed shape
-                with boundary_shape.begin_closed_shape():
-                    boundary_shape.no_fill()
-                    boundary_shape.vertices(obj.vertices[boundary])
+                boundary_shape.beginShape()
+                boundary_shape.noFill()
+                _Py5ShapeHelper.vertices(boundary_shape, vertices)
+                boundary_shape.endShape(sketch.CLOSE)
+            elif len(boundary) == 2:
+                # two vertices means no tesselation, need to draw a line
+                # see https://github.com/py5coding/py5generator/issues/659
+                boundary_shape.beginShape(sketch.LINES)
+                _Py5ShapeHelper.vertices(boundary_shape, vertices)
+                boundary_shape.endShape()
             else:
-                if len(boundary) == 2:
-                    # two vertices means no tesselation, need to draw a line
-                    # see https://github.com/py5coding/py5generator/issues/659
-                    with boundary_shape.begin_shape(sketch.LINES):
-                        boundary_shape.vertices(obj.vertices[boundary])
-                else:
-                    # open shape with more than three or more vertices
-                    with boundary_shape.begin_shape():
-                        boundary_shape.no_fill()
-                        boundary_shape.vertices(obj.vertices[boundary])
+                # open shape with more than three or more vertices
+                boundary_shape.beginShape()
+                boundary_shape.noFill()
+                _Py5ShapeHelper.vertices(boundary_shape, vertices)
+                boundary_shape.endShape()
 
-            shape.add_child(boundary_shape)
+            pshape.addChild(boundary_shape)
 
         return shape
 
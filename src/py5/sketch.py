@@ -37,7 +37,11 @@ import numpy as np
 import numpy.typing as npt
 import py5_tools
 from jpype.types import JArray, JClass, JException, JInt  # noqa
-from py5_tools.printstreams import _DefaultPrintlnStream, _DisplayPubPrintlnStream
+from py5_tools.printstreams import (
+    _CoalescingPrintlnStream,
+    _DefaultPrintlnStream,
+    _DisplayPubPrintlnStream,
+)
 
 from . import image_conversion, reference, shape_conversion, spelling
 from .base import Py5Base
@@ -54,13 +58,22 @@ from .font import Py5Font, _load_py5font, _return_list_str, _return_py5font  # n
 from .graphics import Py5Graphics, _return_py5graphics  # noqa
 from .image import Py5Image, _return_py5image  # noqa
 from .keyevent import Py5KeyEvent, _convert_jchar_to_chr, _convert_jint_to_int  # noqa
-from .mixins import DataMixin, MathMixin, PixelMixin, PrintlnStream, ThreadsMixin
+from .mixins import (
+    BufferPoolMixin,
+    DataMixin,
+    MathMixin,
+    PixelMixin,
+    PrintlnStream,
+    ThreadsMixin,
+)
+from .mixins.data import Py5Assets  # noqa
 from .mixins.threads import Py5Promise  # noqa
 from .mouseevent import Py5MouseEvent  # noqa
 from .pmath import _get_matrix_wrapper  # noqa
 from .shader import Py5Shader, _load_py5shader, _return_py5shader  # noqa
-from .shape import Py5Shape, _load_py5shape, _return_py5shape  # noqa
+from .shape import Py5Shape, Py5ShapeIndex, _load_py5shape, _return_py5shape  # noqa
 from .surface import Py5Surface, _return_py5surface  # noqa
+from .tiled_export import save_tiled as _save_tiled
 from .utilities import Py5Utilities
 
 try:
@@ -156,7 +169,44 @@ def _settings_only(name):
     return _decorator
 
 
-class Sketch(MathMixin, DataMixin, ThreadsMixin, PixelMixin, PrintlnStream, Py5Base):
+_HEADLESS_UNSUPPORTED_RENDERERS = {
+    "processing.opengl.PGraphics2D": "P2D",
+    "processing.opengl.PGraphics3D": "P3D",
+    "processing.javafx.PGraphicsFX2D": "FX2D",
+}
+
+
+def _headless_renderer_check(primary_surface):
+    def _decorator(f):
+        @functools.wraps(f)
+        def decorated(self_, *args):
+            if py5_tools.is_headless_mode() and len(args) >= 2:
+                renderer = args[2] if len(args) > 2 else None
+                if renderer in _HEADLESS_UNSUPPORTED_RENDERERS:
+                    raise RuntimeError(
+                        "The "
+                        + _HEADLESS_UNSUPPORTED_RENDERERS[renderer]
+                        + " renderer cannot be used in headless mode. Use the JAVA2D, SVG, PDF, or DXF renderers instead."
+                    )
+                if primary_surface and renderer in [None, Sketch.JAVA2D]:
+                    # the JAVA2D renderer needs a window, HIDDEN does not
+                    args = (*args[:2], Sketch.HIDDEN, *args[3:])
+            return f(self_, *args)
+
+        return decorated
+
+    return _decorator
+
+
+class Sketch(
+    MathMixin,
+    DataMixin,
+    ThreadsMixin,
+    BufferPoolMixin,
+    PixelMixin,
+    PrintlnStream,
+    Py5Base,
+):
     """Core py5 class for leveraging py5's functionality.
 
     Underlying Processing class: PApplet.PApplet
@@ -242,6 +292,7 @@ class Sketch(MathMixin, DataMixin, ThreadsMixin, PixelMixin, PrintlnStream, Py5B
         self._methods_to_profile = []
         self._pre_hooks_to_add = []
         self._post_hooks_to_add = []
+        self._callbacks = dict()
         # must always keep the _py5_bridge reference count from hitting zero.
         # otherwise, it will be garbage collected and lead to segmentation faults!
         self._py5_bridge = None
@@ -257,6 +308,7 @@ class Sketch(MathMixin, DataMixin, ThreadsMixin, PixelMixin, PrintlnStream, Py5B
         Sketch._cls.setJOGLProperties(str(Path(__file__).parent))
         self.utils = Py5Utilities(self)
         self._sync_draw = None
+        self._target_frame_rate = 60.0
 
         self._py5_convert_image_cache = dict()
         self._py5_convert_shape_cache = dict()
@@ -415,13 +467,19 @@ class Sketch(MathMixin, DataMixin, ThreadsMixin, PixelMixin, PrintlnStream, Py5B
     ) -> None:
         self._environ = py5_tools.environ.Environment()
         self.set_println_stream(
-            _DisplayPubPrintlnStream()
+            _CoalescingPrintlnStream(_DisplayPubPrintlnStream())
             if self._environ.in_jupyter_zmq_shell
             else _DefaultPrintlnStream()
         )
 
+        if py5_tools.is_headless_mode() and "settings" not in methods:
+            # Processing's default renderer needs a window
+            methods = {**methods, "settings": lambda: self.size(100, 100)}
+            method_param_counts = {**method_param_counts, "settings": 0}
+
         self._py5_bridge = Py5Bridge(self)
         self._py5_bridge.set_caller_locals_globals(_caller_locals, _caller_globals)
+        self._py5_bridge.set_callbacks(self._callbacks)
         self._py5_bridge.add_functions(methods, method_param_counts)
         self._py5_bridge.profile_functions(self._methods_to_profile)
         self._py5_bridge.add_pre_hooks(self._pre_hooks_to_add)
@@ -511,6 +569,9 @@ class Sketch(MathMixin, DataMixin, ThreadsMixin, PixelMixin, PrintlnStream, Py5B
                 while not surface.is_stopped() and not hasattr(
                     self, "_shutdown_initiated"
                 ):
+                    if self.is_dead_from_error and py5_tools.is_headless_mode():
+                        # there is no window to keep open after an error
+                        break
                     time.sleep(0.25)
 
             # Wait no more than 1 second for any shutdown tasks to complete.
@@ -1588,6 +1649,37 @@ class Sketch(MathMixin, DataMixin, ThreadsMixin, PixelMixin, PrintlnStream, Py5B
         else:
             self.println("The new draw() function must take no parameters")
 
+    def register_callback(self, key: str, func: Union[Callable, None], /) -> None:
+        """Register a callable for Processing Mode's `callPython()` method.
+
+        Parameters
+        ----------
+
+        func: Union[Callable, None]
+            callable to link to key, or None to remove the key
+
+        key: str
+            key used from Processing Mode callPython() method
+
+        Notes
+        -----
+
+        Register a callable for Processing Mode's `callPython()` method. When Java code
+        calls `callPython()` with the `key`, py5 calls `func` right away, without
+        looking up the key in the keys registered with
+        `py5_tools.register_processing_mode_key()` or in the namespace the Sketch was
+        run from. Use this for callables that Java code calls many times per frame.
+        The key can contain dots ("`.`"), but it is matched as a whole.
+
+        Registered callables belong to the Sketch, so this method can be called before
+        or after `run_sketch()`. Pass `None` for `func` to remove a key."""
+        if func is None:
+            self._callbacks.pop(key, None)
+        elif callable(func):
+            self._callbacks[key] = func
+        else:
+            raise RuntimeError(f"callback for key {key} must be callable")
+
     def profile_functions(self, function_names: list[str]) -> None:
         """Profile the execution times of the Sketch's functions with a line profiler.
 
@@ -1734,6 +1826,85 @@ class Sketch(MathMixin, DataMixin, ThreadsMixin, PixelMixin, PrintlnStream, Py5B
             **params,
         )
 
+    def save_tiled(
+        self,
+        filename: Union[str, Path],
+        scale: float,
+        tile_size: int,
+        draw_func: Callable[[Py5Graphics], None],
+        *,
+        renderer: str = None,
+        format: str = None,
+        drop_alpha: bool = True,
+    ) -> None:
+        """Save a high resolution image of a scene by drawing it one tile at a time.
+
+        Parameters
+        ----------
+
+        draw_func: Callable[[Py5Graphics], None]
+            function that draws the scene to the Py5Graphics object it is passed
+
+        drop_alpha: bool = True
+            remove the alpha channel when saving the image
+
+        filename: Union[str, Path]
+            output filename
+
+        format: str = None
+            image format, if not determined from filename extension
+
+        renderer: str = None
+            renderer used to draw each tile
+
+        scale: float
+            ratio of the saved image's size to the Sketch's size
+
+        tile_size: int
+            width and height of each tile in pixels
+
+        Notes
+        -----
+
+        Save a high resolution image of a scene by drawing it one tile at a time. The
+        saved image will be `scale` times the size of the Sketch. This makes it possible
+        to save images that are much larger than the Sketch window or any `Py5Graphics`
+        object that would fit in memory, such as print resolution posters.
+
+        The `draw_func` function is called once for each tile with a `Py5Graphics`
+        object as its only parameter. It should draw the whole scene to that object
+        using the Sketch's coordinates, as if the `Py5Graphics` object was the same size
+        as the Sketch. The transformations needed to draw each part of the scene to the
+        right tile at the right scale are set up before each call, so all of the tiles
+        can be drawn by the same code. The function is called many times, so it must
+        draw the same scene each time, including the background. Any drawing styles set
+        in `draw_func` will be reset before the next tile is drawn.
+
+        Rows of tiles are written to the file while the next row of tiles is drawn. At
+        most three rows of tiles are in memory at once: one being drawn, one waiting to
+        be written, and one being written. Memory use depends on the image's width and
+        the tile size, not on the image's height. If `draw_func` or writing the file
+        raises an exception, the partially written file is deleted. Only PNG and TIFF
+        files are supported. TIFF files are not compressed and are limited to 4 GB.
+
+        By default the tiles are drawn with the default renderer. Use the `renderer`
+        parameter to draw the tiles with a different renderer, such as `P3D`. For 3D
+        scenes each tile gets its part of the Sketch's default perspective projection,
+        so the scene should not change the camera or the projection.
+
+        Use the `drop_alpha` parameter to drop the alpha channel from the image. This
+        defaults to `True`."""
+        _save_tiled(
+            self,
+            filename,
+            scale,
+            tile_size,
+            draw_func,
+            renderer=renderer,
+            format=format,
+            drop_alpha=drop_alpha,
+        )
+
     def select_folder(
         self, prompt: str, callback: Callable, default_folder: str = None
     ) -> None:
@@ -2285,9 +2456,55 @@ class Sketch(MathMixin, DataMixin, ThreadsMixin, PixelMixin, PrintlnStream, Py5B
 
         The returned Py5Promise object has an `is_ready` property that will be `True`
         when the `result` property contains the value function `f` returned. Before
-        then, the `result` property will be `None`."""
+        then, the `result` property will be `None`.
+
+        To load many images at once, use `request_images()` to load them in parallel
+        with a pool of threads."""
         return self.launch_promise_thread(self.load_image, args=(image_path,))
 
+    def request_images(
+        self, image_paths: Sequence[Union[str, Path]], *, max_workers: int = None
+    ) -> list[Py5Promise]:
+        """Use a pool of threads to load many images into variables of type `Py5Image`.
+
+        Parameters
+        ----------
+
+        image_paths: Sequence[Union[str, Path]]
+            urls or file paths for image files
+
+        max_workers: int = None
+            maximum number of threads to load images with
+
+        Notes
+        -----
+
+        Use a pool of threads to load many images into variables of type `Py5Image`.
+        This method returns a list of Py5Promise objects, one for each of the paths in
+        `image_paths`, in the same order. The images are loaded in parallel by a bounded
+        pool of threads, which is much faster than calling `load_image()` or
+        `request_image()` for each image one at a time.
+
+        Use the `max_workers` parameter to set the maximum number of threads used to
+        load the images. By default this is based on the number of CPUs your computer
+        has.
+
+        Each Py5Promise object has an `is_ready` property that will be `True` when its
+        `result` property contains the loaded image. Call a Py5Promise's `wait()`
+        method to block until that image is loaded, or pass the Py5Promise objects'
+        `future` properties to `concurrent.futures.wait()` to wait for all of them. An
+        image that has not started loading yet can be skipped by calling its
+        Py5Promise's `cancel()` method.
+
+        The pool of threads is listed by `list_threads()` until all of the images have
+        been loaded. Calling `stop_all_threads()` or exiting the Sketch cancels the
+        images that have not started loading yet."""
+        return self._launch_promise_pool(
+            self.load_image,
+            [(image_path,) for image_path in image_paths],
+            max_workers or min(32, (os.cpu_count() or 1) + 4),
+        ).promises
+
     @overload
     def color_mode(self, mode: int, /) -> None:
         """Changes the way py5 interprets color data.
@@ -9352,6 +9569,7 @@ class Sketch(MathMixin, DataMixin, ThreadsMixin, PixelMixin, PrintlnStream, Py5B
         pass
 
     @_return_py5graphics
+    @_headless_renderer_check(False)
     def create_graphics(self, *args):
         """Creates and returns a new `Py5Graphics` object.
 
@@ -11765,6 +11983,7 @@ class Sketch(MathMixin, DataMixin, ThreadsMixin, PixelMixin, PrintlnStream, Py5B
         not be achieved. Setting the frame rate within `setup()` is recommended. The
         default rate is 60 frames per second.
         """
+        self._target_frame_rate = fps
         return self._instance.frameRate(fps)
 
     def frustum(
@@ -12095,6 +12314,10 @@ class Sketch(MathMixin, DataMixin, ThreadsMixin, PixelMixin, PrintlnStream, Py5B
         parameter can be used in place of a screen number to draw the Sketch as a full-
         screen window across all of the attached displays if there are more than one.
         """
+        if py5_tools.is_headless_mode():
+            raise RuntimeError(
+                "full_screen() cannot be used in headless mode. Use size() instead."
+            )
         return self._instance.fullScreen(*args)
 
     @overload
@@ -17125,6 +17348,7 @@ class Sketch(MathMixin, DataMixin, ThreadsMixin, PixelMixin, PrintlnStream, Py5B
         pass
 
     @_settings_only("size")
+    @_headless_renderer_check(True)
     def size(self, *args):
         """Defines the dimension of the display window width and height in units of pixels.
 
@@ -18,9 +18,14 @@
 #
 # *****************************************************************************
 import string
+import weakref
 
 # many thanks to Peter Norvig for his spelling corrector tutorial:
 # http://norvig.com/spell-correct.html
+# and to Wolf Garbe for the symmetric delete idea used by SymSpell:
+# https://github.com/wolfgarbe/SymSpell
+
+MAX_EDIT_DISTANCE = 2
 
 
 def edits1(word):
@@ -45,6 +50,73 @@ def known(words, dictionary):
     return list(set(w for w in words if w in dictionary))
 
 
+def deletes(word, max_distance=MAX_EDIT_DISTANCE):
+    result = frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1 :] for w in frontier for i in range(len(w))}
+        result = result | frontier
+    return result
+
+
+def edit_distance(a, b):
+    # optimal string alignment distance: insertions, deletions, replacements, and
+    # transpositions of adjacent characters
+    prev2, prev = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            current[j] = min(
+                prev[j] + 1,
+                current[j - 1] + 1,
+                prev[j - 1] + (a[i - 1] != b[j - 1]),
+            )
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], prev2[j - 2] + 1)
+        prev2, prev = prev, current
+    return prev[-1]
+
+
+class SuggestionIndex:
+    """Symmetric delete index for finding the words within two edits of a
+    misspelled word without generating every possible edit."""
+
+    def __init__(self, words):
+        self.words = frozenset(words)
+        self._deletes = {}
+        for word in self.words:
+            for d in deletes(word):
+                self._deletes.setdefault(d, []).append(word)
+
+    def candidates(self, word, extra_words=()):
+        if word in self.words or word in extra_words:
+            return {word}
+
+        # words within two edits share a string with at most two deletions
+        found = {w for d in deletes(word) for w in self._deletes.get(d, ())}
+        found.update(w for w in extra_words if abs(len(w) - len(word)) <= 2)
+
+        distances = {w: edit_distance(word, w) for w in found}
+        for distance in range(1, MAX_EDIT_DISTANCE + 1):
+            # two edits are only considered for shorter words
+            if distance > 1 and len(word) > 10:
+                break
+            if result := {w for w, d in distances.items() if d == distance}:
+                return result
+        return set()
+
+
+_indexes = weakref.WeakKeyDictionary()
+
+
+def _get_index(obj):
+    # index the names of the object's class. names added to the instance or the
+    # class after the index was built are checked separately.
+    cls = obj if isinstance(obj, type) else type(obj)
+    if (index := _indexes.get(cls)) is None:
+        index = _indexes[cls] = SuggestionIndex(dir(cls))
+    return index
+
+
 def candidates(word, dictionary):
     if word in dictionary:
         return set([word])
@@ -58,6 +130,10 @@ def candidates(word, dictionary):
 
 def suggestions(word, word_list):
     words = ['"' + w + '"' for w in sorted(candidates(word, word_list))]
+    return _format_suggestions(words)
+
+
+def _format_suggestions(words):
     if len(words) == 0:
         return None
     elif len(words) == 1:
@@ -68,7 +144,44 @@ def suggestions(word, word_list):
         return ", ".join(words[:-1]) + ", or " + words[-1]
 
 
-def error_msg(obj_name, word, obj, module=False):
+def _object_suggestions(word, obj):
+    index = _get_index(obj)
+    if type(obj).__dir__ is object.__dir__ and hasattr(obj, "__dict__"):
+        # same as dir(obj) but much faster for classes with many attributes
+        extra_words = vars(obj).keys() - index.words
+        found = index.candidates(word, extra_words=extra_words)
+    else:
+        names = set(dir(obj))
+        found = index.candidates(word, extra_words=names - index.words) & names
+    return _format_suggestions(['"' + w + '"' for w in sorted(found)])
+
+
+class ErrorMsg:
+    """Error message that looks for spelling suggestions the first time it is
+    converted to a string.
+
+    Exceptions raised by `__getattr__()` are often caught without ever being
+    displayed, such as by `hasattr()`, so the suggestions should not be computed
+    in advance."""
+
+    def __init__(self, obj_name, word, obj, module=False):
+        self._obj_name = obj_name
+        self._word = word
+        self._obj = obj
+        self._module = module
+        self._msg = None
+
+    def __str__(self):
+        if self._msg is None:
+            self._msg = _error_msg(self._obj_name, self._word, self._obj, self._module)
+            self._obj = None
+        return self._msg
+
+    def __repr__(self):
+        return repr(str(self))
+
+
+def _error_msg(obj_name, word, obj, module=False):
     msg = (
         "py5 has no field or function"
         if module
@@ -76,11 +189,11 @@ def error_msg(obj_name, word, obj, module=False):
     )
     msg += ' named "' + word + '"'
 
-    if (
-        word
-        and word[0] != "_"
-        and (suggestion_list := suggestions(word, set(dir(obj))))
-    ):
+    if word and word[0] != "_" and (suggestion_list := _object_suggestions(word, obj)):
         msg += ". Did you mean " + suggestion_list + "?"
 
     return msg
+
+
+def error_msg(obj_name, word, obj, module=False):
+    return ErrorMsg(obj_name, word, obj, module=module)
@@ -17,6 +17,7 @@
 #   along with this library. If not, see <https://www.gnu.org/licenses/>.
 #
 # *****************************************************************************
+import time
 from pathlib import Path
 
 from .sketch import Sketch
@@ -109,3 +110,1368 @@ def test_interactivity_p2d():
 def test_interactivity_p3d():
     test = TestInteractivity(Sketch.P3D, "P3D")
     test.run_sketch()
+
+
+class HeadlessTest(Sketch):
+
+    def __init__(self, renderer, output_dir):
+        super().__init__()
+        self.renderer = renderer
+        self.output_dir = Path(output_dir)
+
+    def settings(self):
+        if self.renderer in [Sketch.SVG, Sketch.PDF]:
+            extension = "svg" if self.renderer == Sketch.SVG else "pdf"
+            path = self.output_dir / f"test.{extension}"
+            self.size(150, 150, self.renderer, str(path))
+        else:
+            self.size(150, 150, self.renderer)
+
+    def setup(self):
+        self.g2 = self.create_graphics(50, 50)
+
+    def draw(self):
+        self.background(240)
+        with self.g2.begin_draw():
+            self.g2.background(255, 0, 0)
+        if self.renderer in [Sketch.SVG, Sketch.PDF]:
+            # vector renderers cannot draw JAVA2D offscreen buffers
+            self.rect(50, 50, 50, 50)
+        else:
+            self.image(self.g2, 50, 50)
+
+        if self.renderer not in [Sketch.SVG, Sketch.PDF]:
+            self.save_frame(self.output_dir / "frame_###.png")
+
+        if self.frame_count == 10:
+            self.exit_sketch()
+
+
+def _run_headless_test(renderer):
+    import tempfile
+
+    _skip_unless_headless_mode()
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        test = HeadlessTest(renderer, tempdir)
+        test.run_sketch(block=True)
+        assert not test.is_dead_from_error
+        return sorted(p.name for p in Path(tempdir).iterdir())
+
+
+def test_headless_java2d():
+    filenames = _run_headless_test(Sketch.JAVA2D)
+    assert filenames == [f"frame_{i:03}.png" for i in range(1, 11)]
+
+
+def test_headless_svg():
+    assert _run_headless_test(Sketch.SVG) == ["test.svg"]
+
+
+def test_headless_pdf():
+    assert _run_headless_test(Sketch.PDF) == ["test.pdf"]
+
+
+def _skip_unless_headless_mode():
+    import py5_tools
+    import pytest
+
+    if not py5_tools.is_headless_mode():
+        pytest.skip("headless mode must be enabled before py5 is imported")
+
+
+def test_headless_render_frame():
+    from .render_helper import render_frame
+
+    _skip_unless_headless_mode()
+
+    def draw(s):
+        s.background(255, 0, 0)
+
+    img = render_frame(draw, 100, 100, Sketch.JAVA2D)
+    assert img.size == (100, 100)
+    assert img.getpixel((50, 50)) == (255, 0, 0)
+
+
+def test_headless_frame_hooks():
+    import py5_tools
+
+    _skip_unless_headless_mode()
+    test = RendererTest(Sketch.JAVA2D, "JAVA2D")
+    frames = py5_tools.capture_frames(count=5, sketch=test)
+    test.run_sketch(block=True)
+    assert not test.is_dead_from_error
+    time.sleep(1)
+    assert len(frames) == 5
+    assert frames[0].size == (150, 150)
+
+
+def test_repeating_thread_scheduler():
+    from .mixins.threads import Py5RepeatingTask, Py5Scheduler
+
+    test = Sketch()
+    calls = []
+    scheduler = Py5Scheduler(1)
+    try:
+        # the long delay keeps each task from being called a second time
+        tasks = {
+            name: Py5RepeatingTask(test, calls.append, 60, True, (name,), {})
+            for name in "abc"
+        }
+        now = time.perf_counter()
+        scheduler.schedule(tasks["a"], now + 0.2)
+        scheduler.schedule(tasks["b"], now + 0.1)
+        scheduler.schedule(tasks["c"], now + 0.3)
+        assert scheduler.stats()["scheduled_tasks"] == 3
+
+        tasks["c"].stop()
+        assert not tasks["c"].is_alive()
+        time.sleep(0.6)
+        assert calls == ["b", "a"]
+        assert scheduler.stats()["scheduled_tasks"] == 2
+    finally:
+        scheduler.shutdown()
+    assert not any(task.is_alive() for task in tasks.values())
+
+
+def test_repeating_thread_fixed_rate():
+    test = Sketch()
+
+    def run(daemon, fixed_rate):
+        starts = []
+
+        def f():
+            starts.append(time.perf_counter())
+            time.sleep(0.05)
+
+        test.launch_repeating_thread(
+            f, "repeat", time_delay=0.1, fixed_rate=fixed_rate, daemon=daemon
+        )
+        time.sleep(0.75)
+        test.stop_thread("repeat", wait=True)
+        return (starts[-1] - starts[0]) / (len(starts) - 1)
+
+    try:
+        for daemon in [True, False]:
+            assert 0.09 < run(daemon, True) < 0.13
+            assert 0.14 < run(daemon, False) < 0.19
+    finally:
+        test.stop_all_threads(wait=True)
+        if test._py5scheduler is not None:
+            test._py5scheduler.shutdown()
+
+
+class RequestImagesTest(Sketch):
+
+    def __init__(self, image_paths):
+        super().__init__()
+        self.image_paths = image_paths
+
+    def settings(self):
+        self.size(100, 100, self.HIDDEN)
+
+    def setup(self):
+        self.promises = self.request_images(self.image_paths)
+        for promise in self.promises:
+            promise.exception(5)
+        self.exit_sketch()
+
+
+def test_request_images():
+    import tempfile
+
+    from PIL import Image
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        image_path = Path(tempdir) / "image.png"
+        Image.new("RGB", (20, 10), (255, 0, 0)).save(image_path)
+        test = RequestImagesTest([image_path, Path(tempdir) / "missing.png"])
+        test.run_sketch(block=True)
+
+    loaded, missing = test.promises
+    assert loaded.is_ready and loaded.result.width == 20
+    assert missing.done() and missing.exception() is not None
+    assert not test.list_threads()
+
+
+def test_promise_pool_stop():
+    import threading
+
+    test = Sketch()
+    release = threading.Event()
+
+    def f(x):
+        release.wait(5)
+        return x
+
+    promises = test._launch_promise_pool(f, [(1,), (2,)], 1).promises
+    (name,) = test.list_threads()
+    time.sleep(0.1)
+    test.stop_all_threads()
+    release.set()
+    assert test.join_thread(name, timeout=5)
+    assert promises[0].wait() == 1
+    assert promises[1].cancelled()
+
+
+class RunAsyncTest(Sketch):
+
+    def __init__(self):
+        import threading
+
+        super().__init__()
+        self.results = []
+        self.setup_done = threading.Event()
+
+    def settings(self):
+        self.size(100, 100, self.HIDDEN)
+
+    def setup(self):
+        import asyncio
+        import threading
+
+        async def add(a, b):
+            await asyncio.sleep(0.01)
+            return a + b
+
+        def callback(result):
+            self.results.append((result, threading.current_thread().name))
+
+        self.promise = self.run_async(add(1, 2), callback=callback)
+        self.setup_done.set()
+
+
+class RunAsyncDrawTest(RunAsyncTest):
+    def draw(self):
+        if self.results:
+            self.exit_sketch()
+
+
+def test_run_async():
+    test = RunAsyncDrawTest()
+    test.run_sketch(block=True)
+    assert test.promise.wait(5) == 3
+    assert test.results and test.results[0][0] == 3
+    assert test.results[0][1] != "py5-asyncio"
+
+    # a Sketch without draw() gets the result on the event loop's thread
+    test = RunAsyncTest()
+    test.run_sketch(block=False)
+    try:
+        assert test.setup_done.wait(5)
+        assert test.promise.wait(5) == 3
+        time.sleep(0.5)
+        assert test.results == [(3, "py5-asyncio")]
+    finally:
+        test.exit_sketch()
+
+
+def test_http_cache():
+    import http.server
+    import tempfile
+    import threading
+
+    requests_received = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests_received.append(self.headers.get("If-None-Match"))
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            if self.path == "/text.txt":
+                body = "caf\u00e9 na\u00efve".encode("latin-1")
+                content_type = "text/plain; charset=latin-1"
+            else:
+                body = b'{"value": 42}'
+                content_type = "application/json"
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", '"v1"')
+            if self.path.startswith("/no-"):
+                self.send_header("Cache-Control", self.path.split("/")[1])
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/data.json"
+
+    try:
+        with tempfile.TemporaryDirectory() as tempdir:
+            test = Sketch()
+
+            # the second request is a conditional request answered with a 304
+            test.set_http_options(cache_dir=tempdir)
+            assert test.load_json(url) == {"value": 42}
+            assert test.load_json(url) == {"value": 42}
+            assert requests_received == [None, '"v1"']
+
+            # the cached data is fresh so the server is not contacted
+            test.set_http_options(cache_dir=tempdir, ttl=60)
+            assert test.load_strings(url) == ['{"value": 42}']
+            assert test.load_bytes(url) == bytearray(b'{"value": 42}')
+            assert test.request_json(url).wait(5) == {"value": 42}
+            assert len(requests_received) == 2
+
+            # no-cache responses are revalidated and no-store responses are not stored
+            base_url = f"http://127.0.0.1:{server.server_port}"
+            requests_received.clear()
+            for _ in range(2):
+                test.load_json(base_url + "/no-cache/data.json")
+                test.load_json(base_url + "/no-store/data.json")
+            assert requests_received == [None, None, '"v1"', None]
+
+            # text is decoded with the encoding given by the server
+            assert test.load_strings(base_url + "/text.txt") == ["caf\u00e9 na\u00efve"]
+    finally:
+        server.shutdown()
+
+
+def test_streaming_data():
+    import struct
+    import tempfile
+
+    import numpy as np
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        test = Sketch()
+        tempdir = Path(tempdir)
+
+        test.save_strings(["a,1", "b,2", "c,3"], tempdir / "data.csv")
+        assert list(test.iter_strings(tempdir / "data.csv")) == ["a,1", "b,2", "c,3"]
+
+        records = b"".join(struct.pack("<if", i, i / 2) for i in range(1000))
+        test.save_bytes(b"HEADER" + records + b"xx", tempdir / "data.bin")
+        unpacked = [
+            struct.unpack("<if", r)
+            for r in test.iter_records(tempdir / "data.bin", 8, offset=6)
+        ]
+        assert unpacked == [(i, i / 2) for i in range(1000)]
+
+        data = test.load_bytes(tempdir / "data.bin", mmap=True)
+        assert isinstance(data, memoryview) and data.readonly
+        assert data[6:14].tobytes() == records[:8]
+        del data
+
+        np.save(tempdir / "array.npy", np.arange(12).reshape(3, 4))
+        arr = test.load_numpy(tempdir / "array.npy")
+        assert isinstance(arr, np.memmap) and arr[2, 3] == 11
+        del arr
+
+
+class AssetsTest(Sketch):
+    def __init__(self, manifest):
+        super().__init__()
+        self.manifest = manifest
+        self.assets = None
+        self.progress = []
+
+    def settings(self):
+        self.size(100, 100, self.HIDDEN)
+
+    def setup(self):
+        if self.assets is None:
+            self.assets = self.request_assets(self.manifest, max_workers=2)
+
+    def draw(self):
+        self.progress.append(self.assets.progress)
+        if self.assets.is_ready:
+            self.exit_sketch()
+
+
+def test_request_assets():
+    import tempfile
+
+    import numpy as np
+    from PIL import Image
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        tempdir = Path(tempdir)
+        Image.new("RGB", (20, 10), (255, 0, 0)).save(tempdir / "red.png")
+        Image.new("RGB", (10, 20), (0, 0, 255)).save(tempdir / "blue.bmp")
+        (tempdir / "config.json").write_text('{"speed": 3}')
+        (tempdir / "points.csv").write_text("1,2\n3,4")
+        np.save(tempdir / "grid.npy", np.ones((4, 4)))
+        (tempdir / "assets.toml").write_text(
+            "[assets]\n"
+            'red = "red.png"\n'
+            'blue = "blue.bmp"\n'
+            'config = "config.json"\n'
+            'points = "points.csv"\n'
+            'grid = { path = "grid.npy", mmap_mode = "c" }\n'
+        )
+
+        # assets can be requested in setup() or before the Sketch is run
+        for early in [False, True]:
+            test = AssetsTest(tempdir / "assets.toml")
+            if early:
+                test.assets = test.request_assets(test.manifest)
+            test.run_sketch(block=True)
+            assert not test.is_dead_from_error
+
+            assets = test.assets
+            assert assets.errors == {}
+            assert test.progress[-1] == 1.0
+            assert assets.loaded_bytes == assets.total_bytes > 0
+            assert assets.image("red").width == 20
+            assert assets.image("blue").get_pixels(5, 5) == test.color(0, 0, 255)
+            assert assets["config"] == {"speed": 3}
+            assert assets["points"] == ["1,2", "3,4"]
+            assert assets["grid"].sum() == 16
+            del assets, test
+
+        # Processing loads wait for the Sketch to run and stop with the threads
+        test = Sketch()
+        assets = test.request_assets(
+            {"red": tempdir / "red.png", "config": tempdir / "config.json"}
+        )
+        assert assets.promise("config").wait(5) == {"speed": 3}
+        assert assets["red"] is None
+        test.stop_all_threads(wait=True)
+        assets.wait(5)
+        assert assets.is_ready and list(assets.errors) == ["red"]
+
+
+def test_coalescing_println_stream():
+    from py5_tools.printstreams import _CoalescingPrintlnStream
+
+    class ListStream:
+        def __init__(self):
+            self.messages = []
+            self.is_shutdown = False
+
+        def print(self, text, end="\n", stderr=False, flush=False):
+            self.messages.append((text + end, stderr))
+
+        def shutdown(self):
+            self.is_shutdown = True
+
+    stream = ListStream()
+    coalescing = _CoalescingPrintlnStream(stream, interval=60, max_lines=5)
+    for i in range(3):
+        coalescing.print(f"line {i}")
+    coalescing.print("oops", stderr=True)
+    for i in range(3, 10):
+        coalescing.print(f"line {i}")
+    assert stream.messages == []
+
+    coalescing.shutdown()
+    assert stream.messages == [
+        ("line 0\nline 1\nline 2\n", False),
+        ("oops\n", True),
+        ("line 3\n", False),
+        ("[6 more lines of println() output not shown]\n", True),
+    ]
+    assert stream.is_shutdown
+
+    coalescing.print("after shutdown")
+    assert stream.messages[-1] == ("after shutdown\n", False)
+
+    # flush=True sends the batch right away and max_lines counts lines, not calls
+    stream = ListStream()
+    coalescing = _CoalescingPrintlnStream(stream, interval=60, max_lines=3)
+    coalescing.print("a\nb")
+    coalescing.print("c\nd\ne", flush=True)
+    assert stream.messages == [
+        ("a\nb\nc\n", False),
+        ("[2 more lines of println() output not shown]\n", True),
+    ]
+
+    # text printed while shutting down comes after the buffered text
+    stream.messages.clear()
+    coalescing.print("buffered")
+    coalescing._stop_event.set()
+    coalescing.print("late")
+    assert stream.messages == [("buffered\n", False), ("late\n", False)]
+    coalescing.shutdown()
+
+
+class StreamTest(Sketch):
+    def settings(self):
+        self.size(120, 80, self.HIDDEN)
+
+    def draw(self):
+        self.background(self.frame_count % 256, 0, 0)
+
+
+def test_stream_frames():
+    import base64
+    import io
+    import os
+    import socket
+    import urllib.request
+
+    from PIL import Image
+
+    import py5_tools
+
+    test = StreamTest()
+    test.run_sketch(block=False)
+    try:
+        server = py5_tools.stream_frames(sketch=test, frame_rate=30, scale=0.5)
+
+        with urllib.request.urlopen(server.url + "frame.jpg", timeout=5) as response:
+            assert response.headers["Content-Type"] == "image/jpeg"
+            assert Image.open(io.BytesIO(response.read())).size == (60, 40)
+
+        with urllib.request.urlopen(server.url + "stream.mjpg", timeout=5) as response:
+            assert response.headers["Content-Type"].startswith(
+                "multipart/x-mixed-replace"
+            )
+            assert response.readline() == b"--py5frame\r\n"
+
+        host, port = server.url[7:-1].split(":")
+        with socket.create_connection((host, int(port)), timeout=5) as sock:
+            key = base64.b64encode(os.urandom(16)).decode("ascii")
+            sock.sendall(
+                f"GET /ws HTTP/1.1\r\nHost: {host}\r\nUpgrade: websocket\r\n"
+                f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\n"
+                "Sec-WebSocket-Version: 13\r\n\r\n".encode("ascii")
+            )
+            f = sock.makefile("rb")
+            assert f.readline().startswith(b"HTTP/1.1 101")
+            while f.readline() != b"\r\n":
+                pass
+
+            def read_frame():
+                opcode, length = f.read(2)
+                if length == 126:
+                    length = int.from_bytes(f.read(2), "big")
+                elif length == 127:
+                    length = int.from_bytes(f.read(8), "big")
+                return opcode, f.read(length)
+
+            opcode, jpeg = read_frame()
+            assert opcode == 0x82 and jpeg.startswith(b"\xff\xd8")
+
+            # client frames are masked. pings are answered and close ends the stream.
+            mask = os.urandom(4)
+            sock.sendall(
+                b"\x89\x82" + mask + bytes(b ^ mask[i] for i, b in enumerate(b"hi"))
+            )
+            while (frame := read_frame())[0] == 0x82:
+                pass
+            assert frame == (0x8A, b"hi")
+            sock.sendall(b"\x88\x80" + mask)
+            while (frame := read_frame())[0] == 0x82:
+                pass
+            assert frame[0] == 0x88
+
+        assert server.frames_encoded > 0
+
+        # a second stream replaces the first
+        server2 = py5_tools.stream_frames(sketch=test)
+        assert server.is_stopped and not server2.is_stopped
+    finally:
+        test.exit_sketch()
+    time.sleep(0.5)
+    assert server2.is_stopped
+
+
+class ShapelyConversionTest(Sketch):
+    def settings(self):
+        self.size(100, 100, self.HIDDEN)
+
+    def setup(self):
+        import numpy as np
+        import shapely
+        from shapely.geometry import MultiPolygon, Polygon
+
+        square = Polygon(
+            [(0, 0), (0, 10), (10, 10), (10, 0)], [[(2, 2), (4, 2), (4, 4), (2, 4)]]
+        )
+        self.square = self.convert_shape(square)
+        self.multi = self.convert_shape(
+            MultiPolygon([square, Polygon([(20, 20), (30, 20), (30, 30)])])
+        )
+        points = shapely.points(np.arange(20).reshape(10, 2))
+        self.array = self.convert_shape(
+            np.array(list(shapely.buffer(points, 1)) + [None], dtype=object)
+        )
+        self.exit_sketch()
+
+
+def test_shapely_conversion():
+    test = ShapelyConversionTest()
+    test.run_sketch(block=True)
+    assert not test.is_dead_from_error
+
+    # exteriors are counterclockwise, holes are clockwise, closing vertex is dropped
+    assert test.square.get_vertex_count() == 8
+    assert test.square.get_vertex(1).tolist() == [10, 0, 0]
+    assert test.square.get_vertex(5).tolist() == [2, 4, 0]
+    assert test.multi.get_child_count() == 2
+    assert test.multi.get_child(1).get_vertex_count() == 3
+    assert test.array.get_child_count() == 10
+
+
+def test_facet_boundaries():
+    from collections import Counter
+
+    import trimesh
+
+    from .shape_conversion import _get_facet_boundaries
+
+    cylinder = trimesh.creation.cylinder(1, 2, sections=32)
+    boundaries = _get_facet_boundaries(cylinder)
+    # two caps and a quad for every section, all closed loops
+    assert Counter(len(b) for b in boundaries) == {33: 2, 5: 32}
+    assert all(b[0] == b[-1] for b in boundaries)
+    assert all(len(set(b)) == len(b) - 1 for b in boundaries)
+
+    # the shallow edges between the quads are removed, leaving open segments
+    boundaries = _get_facet_boundaries(cylinder, min_angle=0.3)
+    assert Counter(len(b) for b in boundaries) == {33: 2, 2: 64}
+
+
+class VertexDataTest(Sketch):
+    def settings(self):
+        self.size(100, 100, self.HIDDEN)
+
+    def setup(self):
+        import numpy as np
+
+        self.coords = np.arange(20, dtype=np.float32).reshape(10, 2)
+        self.shape = self.create_shape()
+        with self.shape.begin_shape(self.POINTS):
+            self.shape.vertices(self.coords)
+
+        self.before = self.shape.get_vertices()
+        self.shape.set_vertices(self.coords * 2)
+        self.dst = np.ones((10, 3), dtype=np.float32)
+        self.after = self.shape.get_vertices(dst=self.dst)
+        self.exit_sketch()
+
+
+def test_vertex_data():
+    import numpy as np
+
+    test = VertexDataTest()
+    test.run_sketch(block=True)
+    assert not test.is_dead_from_error
+
+    assert np.array_equal(test.before, test.coords)
+    assert test.after is test.dst
+    assert np.array_equal(test.after[:, :2], test.coords * 2)
+    assert not test.after[:, 2].any()
+
+
+def test_vertex_data_opengl():
+    import numpy as np
+    from jpype import JClass
+
+    from .shape import Py5Shape
+
+    # a P3D shape doesn't need an OpenGL context until it is drawn
+    pshape = JClass("processing.opengl.PGraphics3D")().createShape()
+    pshape.beginShape(Py5Shape.TRIANGLES)
+    for i in range(12):
+        pshape.fill(20 * i, 255 - 20 * i, 10 * i)
+        pshape.normal(0, 0, 1)
+        pshape.vertex(i, 2 * i, 3 * i, i / 12, 1 - i / 12)
+    pshape.endShape()
+    shape = Py5Shape(pshape)
+
+    def per_vertex(*getters):
+        return np.array([[g(i) for g in getters] for i in range(12)], dtype=np.float32)
+
+    rng = np.random.default_rng(0)
+    assert np.array_equal(
+        shape.get_vertices(),
+        per_vertex(pshape.getVertexX, pshape.getVertexY, pshape.getVertexZ),
+    )
+    assert shape.get_fills().tolist() == [pshape.getFill(i) for i in range(12)]
+
+    shape.set_vertices(coords := rng.random((12, 3)))
+    shape.set_normals(normals := rng.random((12, 3)))
+    shape.set_texture_uvs(uvs := rng.random((12, 2)))
+    assert np.array_equal(
+        per_vertex(pshape.getVertexX, pshape.getVertexY, pshape.getVertexZ),
+        coords.astype(np.float32),
+    )
+    assert np.array_equal(
+        per_vertex(pshape.getNormalX, pshape.getNormalY, pshape.getNormalZ),
+        normals.astype(np.float32),
+    )
+    assert np.array_equal(
+        per_vertex(pshape.getTextureU, pshape.getTextureV), uvs.astype(np.float32)
+    )
+    assert np.array_equal(shape.get_normals(), normals.astype(np.float32))
+    assert np.array_equal(shape.get_texture_uvs(), uvs.astype(np.float32))
+
+    # 2D coordinates get a z coordinate of 0, like setVertex() does
+    shape.set_vertices(coords[:, :2])
+    assert not shape.get_vertices()[:, 2].any()
+
+
+class HitTestingTest(Sketch):
+    def settings(self):
+        self.size(100, 100, self.HIDDEN)
+
+    def setup(self):
+        import numpy as np
+
+        from .shape import Py5ShapeIndex
+
+        self.group = self.create_shape(self.GROUP)
+        for x in range(0, 100, 10):
+            square = self.create_shape()
+            with square.begin_closed_shape():
+                square.vertices([[x, 0], [x + 10, 0], [x + 10, 10], [x, 10]])
+            self.group.add_child(square)
+
+        self.points = np.array([[5, 5], [15, 5], [15, 50], [95, 1]])
+        self.mask = self.group.get_child(1).contains_points(self.points)
+        self.expected = [
+            [self.group.get_child(i).contains(x, y) for i in range(10)]
+            for x, y in self.points.tolist()
+        ]
+        self.index = Py5ShapeIndex(self.group)
+        self.exit_sketch()
+
+
+def test_hit_testing():
+    test = HitTestingTest()
+    test.run_sketch(block=True)
+    assert not test.is_dead_from_error
+
+    assert test.mask.tolist() == [False, True, False, False]
+    assert test.index.query(test.points).tolist() == [[0, 1, 3], [0, 1, 9]]
+    assert test.index.query([15, 5]).tolist() == [1]
+    assert test.index.query([500, 500]).tolist() == []
+    for point, expected in enumerate(test.expected):
+        assert test.index.query(test.points[point]).tolist() == [
+            i for i, contained in enumerate(expected) if contained
+        ]
+
+
+def test_spelling_suggestions():
+    from . import spelling
+
+    index = spelling.SuggestionIndex(["rect", "rect_mode", "ellipse", "fill"])
+    assert index.candidates("rect") == {"rect"}
+    assert index.candidates("rectt") == {"rect"}
+    assert index.candidates("elipes") == {"ellipse"}
+    assert index.candidates("nothing_like_it") == set()
+
+    class Thing:
+        def __init__(self):
+            self.stroke_weight = 1
+
+        def rect(self):
+            pass
+
+    thing = Thing()
+    msg = spelling.error_msg("Thing", "strok_weight", thing)
+    # suggestions are only found when the message is used
+    assert msg._msg is None
+    assert str(msg) == (
+        'Thing objects have no fields or methods named "strok_weight". '
+        'Did you mean "stroke_weight"?'
+    )
+    assert str(AttributeError(spelling.error_msg("Thing", "rec", thing))).endswith(
+        'Did you mean "rect"?'
+    )
+
+
+class CallbackTest(Sketch):
+    def settings(self):
+        self.size(100, 100, self.HIDDEN)
+
+    def setup(self):
+        from jpype import JArray, JObject
+
+        import py5_tools
+
+        class Counter:
+            def __init__(self, step):
+                self.step = step
+
+            def increment(self, n):
+                return n + self.step
+
+        params = JArray(JObject)([JObject(1, "java.lang.Integer")])
+        py5_tools.register_processing_mode_key("counter", Counter(1))
+        self.results = [int(self._instance.callPython("counter.increment", params))]
+        # the key is looked up again after it is registered again
+        py5_tools.register_processing_mode_key("counter", Counter(10))
+        self.results.append(int(self._instance.callPython("counter.increment", params)))
+
+        # registered callbacks come first, and removing one restores the lookup
+        py5_tools.register_processing_mode_key("fast", {"double": lambda n: n + 5})
+        self.register_callback("fast.double", lambda n: 2 * n)
+        for key in ["early.triple", "fast.double"]:
+            self.results.append(int(self._instance.callPython(key, params)))
+        self.register_callback("fast.double", None)
+        self.results.append(int(self._instance.callPython("fast.double", params)))
+
+        # rebinding an attribute or dict item after the first call is noticed
+        counter = Counter(1)
+        state = {"callback": lambda n: n + 1000}
+        py5_tools.register_processing_mode_key("counter", counter)
+        py5_tools.register_processing_mode_key("state", state)
+        for key in ["counter.increment", "state.callback"]:
+            self.results.append(int(self._instance.callPython(key, params)))
+        counter.increment = lambda n: n + 100
+        state["callback"] = lambda n: n + 2000
+        for key in ["counter.increment", "state.callback"]:
+            self.results.append(int(self._instance.callPython(key, params)))
+
+        py5_tools.config._PY5_PROCESSING_MODE_KEYS.pop("counter")
+        py5_tools.config._PY5_PROCESSING_MODE_KEYS.pop("state")
+        py5_tools.config._PY5_PROCESSING_MODE_KEYS.pop("fast")
+        self.exit_sketch()
+
+
+def test_processing_mode_callbacks():
+    test = CallbackTest()
+    # registered before run_sketch() creates the Sketch's bridge
+    test.register_callback("early.triple", lambda n: 3 * n)
+    test.run_sketch(block=True)
+    assert not test.is_dead_from_error
+    assert test.results == [2, 11, 3, 2, 6, 2, 1001, 101, 2001]
+
+
+def test_incremental_reload():
+    import ast
+    import tempfile
+
+    from py5_tools.live_coding import syncing
+
+    code1 = """
+log = []
+log.append("init")
+data = [1, 2, 3]
+total = sum(data)
+
+def setup():
+    pass
+
+def draw():
+    return total
+
+def mouse_pressed():
+    pass
+"""
+    code2 = """
+log = []
+log.append("init")
+data = [4, 5]
+total = sum(data)
+
+def setup():
+    pass
+
+def draw():
+    return 2 * total
+"""
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        filename = Path(tempdir) / "sketch.py"
+        filename.write_text(code1)
+        sketch, namespace = Sketch(), {}
+        functions, _, _ = syncing.exec_user_code(
+            sketch, filename, namespace, None, False
+        )
+        assert functions["draw"].f() == 6 and "mouse_pressed" in functions
+
+        filename.write_text(code2)
+        functions, _, _ = syncing.exec_changed_user_code(
+            sketch, filename, namespace, ast.parse(code1), ast.parse(code2), False
+        )
+        # unchanged module level code is not executed again
+        assert namespace["log"] == ["init"]
+        assert functions["draw"].f() == 18 and "mouse_pressed" not in functions
+
+
+def test_code_cache():
+    import sys
+    import tempfile
+
+    from py5_tools import code_cache
+
+    dont_write_bytecode, cache_dir = sys.dont_write_bytecode, code_cache.CACHE_DIR
+    try:
+        with tempfile.TemporaryDirectory() as tempdir:
+            sys.dont_write_bytecode = False
+            code_cache.CACHE_DIR = Path(tempdir)
+
+            source = "x = 1 + 1"
+            assert code_cache.load("module", "sketch.py", source) is None
+            code_cache.store(
+                "module", "sketch.py", source, compile(source, "sketch.py", "exec")
+            )
+            exec(code_cache.load("module", "sketch.py", source), ns := {})
+            assert ns["x"] == 2
+            # changed source code does not use the cached result
+            assert code_cache.load("module", "sketch.py", "x = 3") is None
+
+            # static mode code generated in different directories for the same
+            # Sketch shares a cache entry but reports the file it was loaded from
+            from py5_tools import imported
+
+            code_objs = []
+            for name in ["run1", "run2"]:
+                (generated := Path(tempdir) / name).mkdir()
+                (filename := generated / "_PY5_STATIC_SETUP_CODE_.py").write_text(
+                    "def f():\n    return 1\n"
+                )
+                code_objs.append(
+                    imported._compile_static_code(
+                        filename.as_posix(), "sketch.py", "static-setup"
+                    )
+                )
+                exec(code_objs[-1], ns := {})
+                assert ns["f"].__code__.co_filename == filename.as_posix()
+            assert code_objs[0].co_code == code_objs[1].co_code
+    finally:
+        sys.dont_write_bytecode, code_cache.CACHE_DIR = dont_write_bytecode, cache_dir
+
+
+def test_magic_result_cache():
+    import tempfile
+    from argparse import Namespace
+
+    from py5_tools.magics import drawing
+
+    def args(cache=True, cache_key="", clear_cache=False, refresh_cache=False):
+        return Namespace(
+            cache=cache,
+            cache_key=cache_key,
+            clear_cache=clear_cache,
+            refresh_cache=refresh_cache,
+        )
+
+    key = ("PNG", "rect(10, 10, 50, 50)", 100, 100, "")
+    for changed in [
+        ("PNG", "rect(10, 10, 50, 60)", 100, 100, ""),
+        ("PNG", "rect(10, 10, 50, 50)", 100, 200, ""),
+        ("SVG", "rect(10, 10, 50, 50)", 100, 100, ""),
+        ("PNG", "rect(10, 10, 50, 50)", 100, 100, "data v2"),
+    ]:
+        assert drawing._result_cache_path(*changed) != drawing._result_cache_path(*key)
+
+    calls = []
+    results = iter([b"first", b"second", None, "<svg/>", b"uncached"])
+
+    def run_sketch(renderer, code, width, height, user_ns, safe_exec):
+        calls.append(code)
+        return next(results)
+
+    def run(code, renderer="PNG", safe_exec=True, **kwargs):
+        return drawing._run_sketch_cached(
+            renderer, code, 100, 100, {}, safe_exec, args(**kwargs)
+        )
+
+    run_sketch_func, cache_dir = drawing._run_sketch, drawing.RESULT_CACHE_DIR
+    try:
+        with tempfile.TemporaryDirectory() as tempdir:
+            drawing._run_sketch = run_sketch
+            drawing.RESULT_CACHE_DIR = Path(tempdir) / "results"
+
+            # a hit returns the stored bytes without running the code
+            assert run("a") == b"first"
+            assert run("a") == b"first"
+            assert calls == ["a"]
+            assert run("a", refresh_cache=True) == b"second"
+            assert run("a") == b"second"
+            assert calls == ["a", "a"]
+
+            # a failed run is not stored, and --unsafe is refused
+            assert run("b") is None
+            assert not drawing._result_cache_path("PNG", "b", 100, 100, "").exists()
+            assert run("b", safe_exec=False) is None
+            assert calls == ["a", "a", "b"]
+
+            # text output is stored as bytes and decoded
+            assert run("c", renderer="SVG") == "<svg/>"
+            assert run("c", renderer="SVG") == "<svg/>"
+            assert len(list(drawing.RESULT_CACHE_DIR.iterdir())) == 2
+
+            assert run("d", cache=False, clear_cache=True) == b"uncached"
+            assert not any(drawing.RESULT_CACHE_DIR.iterdir())
+    finally:
+        drawing._run_sketch, drawing.RESULT_CACHE_DIR = run_sketch_func, cache_dir
+
+
+def test_imported_mode_finder():
+    import os
+    import tempfile
+
+    from py5_tools.import_hook import Py5ImportedModeFinder
+
+    finder = Py5ImportedModeFinder()
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tempdir:
+        try:
+            os.chdir(tempdir)
+            Path("plain_module.py").write_text("x = 1\n")
+            Path("imported_module.py").write_text("# PY5 IMPORTED MODE CODE\n")
+            Path("namespace_package").mkdir()
+            assert finder.find_spec("numpy", None) is None
+            assert finder.find_spec("plain_module", None) is None
+            assert finder.find_spec("imported_module", None) is not None
+            assert finder.find_spec("namespace_package", None) is None
+
+            # new files and changed files are noticed without invalidate_caches().
+            # move the modification times forward in case the filesystem's
+            # timestamps are too coarse to see the change.
+            def touch_later(path):
+                mtime_ns = os.stat(path).st_mtime_ns + 2_000_000_000
+                os.utime(path, ns=(mtime_ns, mtime_ns))
+
+            Path("plain_module.py").write_text("# PY5 IMPORTED MODE CODE\nx = 1\n")
+            Path("new_module.py").write_text("# PY5 IMPORTED MODE CODE\n")
+            touch_later("plain_module.py")
+            touch_later(tempdir)
+            assert finder.find_spec("plain_module", None) is not None
+            assert finder.find_spec("new_module", None) is not None
+        finally:
+            os.chdir(cwd)
+
+
+def test_translate_dir():
+    import contextlib
+    import io
+    import tempfile
+
+    from py5_tools import translators
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        src, dest = Path(tempdir) / "src", Path(tempdir) / "dest"
+        (src / "sub").mkdir(parents=True)
+        (src / "a.pyde").write_text("def setup():\n    strokeWeight(2)\n")
+        (src / "sub" / "b.pyde").write_text("def draw():\n    rectMode(CENTER)\n")
+
+        def translate():
+            with contextlib.redirect_stdout(out := io.StringIO()):
+                translators.processingpy2imported.translate_dir(
+                    src, dest, jobs=2, autopep8_mode="none"
+                )
+            return out.getvalue()
+
+        assert "translated 2 files" in translate()
+        assert (dest / "sub" / "b.py").read_text() == (
+            "def draw():\n    rect_mode(CENTER)\n"
+        )
+
+        # unchanged files are skipped
+        (src / "a.pyde").write_text("def setup():\n    noStroke()\n")
+        output = translate()
+        assert "translated 1 files" in output and "skipped 1 unchanged" in output
+        assert (dest / "a.py").read_text() == "def setup():\n    no_stroke()\n"
+
+
+def test_bench_compare():
+    import io
+
+    from py5_tools import bench
+
+    result = bench.time_function(lambda: None, repeat=3, min_time=0.001)
+    assert result["repeat"] == 3 and result["min"] <= result["median"]
+
+    def results(t):
+        return dict(metadata={}, results={"a": dict(min=t), "b": dict(min=1.0)})
+
+    out = io.StringIO()
+    assert bench.compare_results(results(1.0), results(1.5), file=out) == ["a"]
+    assert "REGRESSION" in out.getvalue()
+    assert bench.compare_results(results(1.0), results(0.5), file=out) == []
+
+
+class IdleTasksTest(Sketch):
+    def settings(self):
+        self.size(100, 100, self.HIDDEN)
+
+    def setup(self):
+        self.frame_rate(20)
+        self.calls = []
+        self.schedule_idle_task(lambda: self.calls.append("low"), priority=-1)
+        self.schedule_idle_task(lambda: self.calls.append("high"), priority=1)
+        # never fits in a 50ms frame, so it waits for max_delay
+        self.schedule_idle_task(
+            lambda: self.calls.append("big"), "big", cost=1, max_delay=0.2
+        )
+        self.schedule_idle_task(
+            lambda: self.calls.append("repeat"), "repeat", repeating=True
+        )
+
+    def draw(self):
+        time.sleep(0.02)
+        if self.frame_count == 10:
+            self.stats = self.idle_task_stats()
+            self.cancel_idle_task("repeat")
+            self.exit_sketch()
+
+
+def test_idle_tasks():
+    test = IdleTasksTest()
+    test.run_sketch(block=True)
+    assert not test.is_dead_from_error
+
+    assert test.calls[:3] == ["high", "repeat", "low"]
+    assert test.calls.index("big") > 3
+    assert test.stats["tasks"]["repeat"]["calls"] >= 5
+    assert "big" not in test.stats["tasks"]
+
+
+def test_idle_task_replaced_before_error():
+    from types import SimpleNamespace
+
+    import pytest
+
+    from py5.mixins.threads import Py5IdleScheduler, Py5IdleTask
+
+    scheduler = Py5IdleScheduler(None)
+    replacement = Py5IdleTask("task", lambda: None, 0, 0, False, None, (), {})
+
+    def replace_then_fail():
+        scheduler.schedule(replacement)
+        raise RuntimeError("task failed")
+
+    scheduler.schedule(
+        Py5IdleTask("task", replace_then_fail, 0, 0, False, None, (), {})
+    )
+    with pytest.raises(RuntimeError):
+        scheduler.run_tasks(SimpleNamespace(_target_frame_rate=60))
+    # the failed task does not remove the task that replaced it
+    assert scheduler.has_task("task") and not replacement.cancelled
+
+
+class TiledExportTest(Sketch):
+    def settings(self):
+        self.size(100, 80, self.HIDDEN)
+
+    def setup(self):
+        import tempfile
+
+        import numpy as np
+        from PIL import Image
+
+        def draw_scene(g):
+            g.background(255, 255, 0)
+            g.no_stroke()
+            g.fill(255, 0, 0)
+            g.rect(10, 10, 50, 30)
+            g.fill(0, 0, 255, 128)
+            g.rect(40, 20, 50, 50)
+
+        g = self.create_graphics(300, 240)
+        g.begin_draw()
+        g.scale(3)
+        draw_scene(g)
+        g.end_draw()
+        expected = g.get_np_pixels(bands="RGB")
+
+        self.results = []
+        with tempfile.TemporaryDirectory() as tempdir:
+            for filename in ["tiled.png", "tiled.tiff"]:
+                filename = Path(tempdir) / filename
+                self.save_tiled(filename, 3, 64, draw_scene)
+                with Image.open(filename) as img:
+                    self.results.append(np.array_equal(np.asarray(img), expected))
+
+            # a failed export doesn't leave a partial file behind
+            tiles_drawn = []
+
+            def draw_failing_scene(g):
+                if len(tiles_drawn) == 3:
+                    raise RuntimeError("drawing failed")
+                tiles_drawn.append(True)
+                draw_scene(g)
+
+            filename = Path(tempdir) / "failed.png"
+            try:
+                self.save_tiled(filename, 3, 64, draw_failing_scene)
+            except RuntimeError:
+                self.results.append(not filename.exists())
+        self.exit_sketch()
+
+
+def test_save_tiled():
+    test = TiledExportTest()
+    test.run_sketch(block=True)
+    assert not test.is_dead_from_error
+    assert test.results == [True, True, True]
+
+
+class TiledExport3DTest(Sketch):
+    def settings(self):
+        self.size(100, 80, self.HIDDEN)
+
+    def setup(self):
+        import tempfile
+
+        import numpy as np
+        from PIL import Image
+
+        # nothing is symmetric, so tiles in the wrong place change the image
+        def draw_scene(g):
+            g.background(255, 255, 0)
+            g.no_stroke()
+            g.fill(255, 0, 0)
+            g.rect(10, 10, 50, 30)
+            g.fill(0, 0, 255)
+            g.rect(40, 20, 50, 50)
+
+        # with the default camera, a scaled scene looks the same from farther away
+        g = self.create_graphics(300, 240, self.P3D)
+        g.begin_draw()
+        g.scale(3)
+        draw_scene(g)
+        g.end_draw()
+        expected = g.get_np_pixels(bands="RGB").astype(int)
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = Path(tempdir) / "tiled.png"
+            self.save_tiled(filename, 3, 64, draw_scene, renderer=self.P3D)
+            with Image.open(filename) as img:
+                actual = np.asarray(img).astype(int)
+
+        # allow for small differences where shape edges are rasterized
+        self.mismatched = (np.abs(actual - expected).max(axis=2) > 32).mean()
+        self.exit_sketch()
+
+
+def test_save_tiled_3d():
+    import py5_tools
+    import pytest
+
+    if py5_tools.is_headless_mode():
+        pytest.skip("the P3D renderer cannot be used in headless mode")
+
+    test = TiledExport3DTest()
+    test.run_sketch(block=True)
+    assert not test.is_dead_from_error
+    assert test.mismatched < 0.01
+
+
+class BufferPoolTest(Sketch):
+    def settings(self):
+        self.size(100, 100, self.HIDDEN)
+
+    def setup(self):
+        self.graphics = []
+        self.pixels_cleared = []
+
+    def draw(self):
+        with self.borrow_graphics(50, 50) as g:
+            self.pixels_cleared.append(g.get_np_pixels().max() == 0)
+            g.begin_draw()
+            g.fill(255, 0, 0)
+            g.rect(0, 0, 50, 50)
+            g.end_draw()
+            g.load_np_pixels()
+            self.graphics.append(id(g))
+        with self.borrow_image(20, 20, self.ARGB) as img1:
+            with self.borrow_image(20, 20, self.ARGB) as img2:
+                assert img1 is not img2
+
+        if self.frame_count == 5:
+            self.stats = self.buffer_pool_stats()
+            self.set_buffer_pool_budget(0)
+            self.trimmed_stats = self.buffer_pool_stats()
+            self.exit_sketch()
+
+
+def test_buffer_pool():
+    test = BufferPoolTest()
+    test.run_sketch(block=True)
+    assert not test.is_dead_from_error
+
+    assert len(set(test.graphics)) == 1
+    assert all(test.pixels_cleared)
+    assert test.stats["allocations"] == 3 and test.stats["reuses"] == 12
+    assert test.stats["idle_buffers"] == 3
+    assert test.stats["idle_bytes"] == 50 * 50 * 4 * 2 + 2 * 20 * 20 * 4
+    assert test.trimmed_stats["idle_buffers"] == 0
+
+
+class BandsTest(Sketch):
+    def settings(self):
+        self.size(64, 48, self.HIDDEN)
+
+    def setup(self):
+        import numpy as np
+
+        argb = np.random.default_rng(42).integers(0, 256, (48, 64, 4), dtype=np.uint8)
+        expected = dict(
+            ARGB=argb,
+            RGB=argb[:, :, 1:],
+            RGBA=argb[:, :, [1, 2, 3, 0]],
+            BGR=argb[:, :, [3, 2, 1]],
+            BGRA=argb[:, :, [3, 2, 1, 0]],
+        )
+
+        g = self.create_graphics(64, 48)
+        g.begin_draw()
+        g.end_draw()
+        g.set_np_pixels(argb)
+
+        self.results = []
+        for bands, array in expected.items():
+            self.results.append(np.array_equal(g.get_np_pixels(bands=bands), array))
+            region = g.get_np_pixels(5, 7, 20, 30, bands=bands)
+            self.results.append(np.array_equal(region, array[7:37, 5:25]))
+            g.set_np_pixels(np.ascontiguousarray(array), bands)
+            self.results.append(
+                np.array_equal(g.get_np_pixels(bands=bands), array)
+                and (len(bands) == 4 or (g.get_np_pixels()[:, :, 0] == 255).all())
+            )
+            g.set_np_pixels(argb)
+
+        self.results.append(
+            np.array_equal(
+                np.asarray(g.to_pil(50, 40, 14, 8)), expected["RGBA"][40:, 50:]
+            )
+        )
+
+        luma = (argb[:, :, 1:] @ [0.299, 0.587, 0.114]).astype(np.uint8)
+        dst = np.empty((48, 64), dtype=np.uint8)
+        g.get_np_pixels(bands="L", dst=dst)
+        self.results.append(np.abs(dst.astype(int) - luma).max() <= 1)
+        g.set_np_pixels(luma, "L")
+        self.results.append(np.array_equal(g.get_np_pixels(bands="RGB")[:, :, 2], luma))
+
+        # conversions of different sizes can run on several threads at once
+        from concurrent.futures import ThreadPoolExecutor
+
+        g.set_np_pixels(argb)
+
+        # conversions done in blocks of rows match at the block boundaries,
+        # including a partial last block
+        from .mixins import pixels
+
+        full = {bands: g.get_np_pixels(bands=bands) for bands in ["L", "BGR"]}
+        block_size, pixels._BANDS_BLOCK_SIZE = pixels._BANDS_BLOCK_SIZE, 7 * 20
+        try:
+            for bands, array in full.items():
+                region = g.get_np_pixels(5, 7, 20, 30, bands=bands)
+                self.results.append(np.array_equal(region, array[7:37, 5:25]))
+        finally:
+            pixels._BANDS_BLOCK_SIZE = block_size
+
+        def convert(w):
+            return all(
+                np.array_equal(
+                    g.get_np_pixels(0, 0, w, 48, bands="BGR"), expected["BGR"][:, :w]
+                )
+                for _ in range(20)
+            )
+
+        with ThreadPoolExecutor(4) as pool:
+            self.results.append(all(pool.map(convert, [16, 32, 48, 64])))
+        self.exit_sketch()
+
+
+def test_bands():
+    test = BandsTest()
+    test.run_sketch(block=True)
+    assert not test.is_dead_from_error
+    assert all(test.results)
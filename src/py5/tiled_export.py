@@ -0,0 +1,270 @@
+# *****************************************************************************
+#
+#   Part of the py5 library
+#   Copyright (C) 2020-2026 Jim Schmitz
+#
+#   This library is free software: you can redistribute it and/or modify it
+#   under the terms of the GNU Lesser General Public License as published by
+#   the Free Software Foundation, either version 2.1 of the License, or (at
+#   your option) any later version.
+#
+#   This library is distributed in the hope that it will be useful, but
+#   WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser
+#   General Public License for more details.
+#
+#   You should have received a copy of the GNU Lesser General Public License
+#   along with this library. If not, see <https://www.gnu.org/licenses/>.
+#
+# *****************************************************************************
+from __future__ import annotations
+
+import math
+import queue
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import Callable, Union
+
+import numpy as np
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_TIFF_MAX_SIZE = 2**32 - 1
+
+
+class _PNGWriter:
+    """Write a PNG image one band of rows at a time."""
+
+    def __init__(self, f, width, height, channels, compress_level=6):
+        self._f = f
+        self._width = width
+        self._channels = channels
+        self._compressor = zlib.compressobj(compress_level)
+
+        f.write(_PNG_SIGNATURE)
+        color_type = 6 if channels == 4 else 2
+        self._write_chunk(
+            b"IHDR", struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0)
+        )
+
+    def _write_chunk(self, chunk_type, data):
+        self._f.write(struct.pack(">I", len(data)))
+        self._f.write(chunk_type)
+        self._f.write(data)
+        self._f.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(chunk_type))))
+
+    def write_rows(self, rows):
+        # each scanline uses the Sub filter, the difference from the pixel to the
+        # left, which compresses much better than unfiltered scanlines
+        h = rows.shape[0]
+        rows = rows.reshape(h, -1)
+        scanlines = np.empty((h, rows.shape[1] + 1), dtype=np.uint8)
+        scanlines[:, 0] = 1
+        scanlines[:, 1 : self._channels + 1] = rows[:, : self._channels]
+        np.subtract(
+            rows[:, self._channels :],
+            rows[:, : -self._channels],
+            out=scanlines[:, self._channels + 1 :],
+        )
+        if data := self._compressor.compress(scanlines.data):
+            self._write_chunk(b"IDAT", data)
+
+    def close(self):
+        self._write_chunk(b"IDAT", self._compressor.flush())
+        self._write_chunk(b"IEND", b"")
+
+
+class _TIFFWriter:
+    """Write an uncompressed TIFF image one strip of rows at a time."""
+
+    def __init__(self, f, width, height, channels, rows_per_strip):
+        if width * height * channels + 1024 > _TIFF_MAX_SIZE:
+            raise RuntimeError(
+                "image is too large for a TIFF file, save it as a PNG file instead"
+            )
+        self._f = f
+        self._width = width
+        self._height = height
+        self._channels = channels
+        self._rows_per_strip = rows_per_strip
+        self._strip_offsets = []
+        self._strip_byte_counts = []
+
+        # the offset to the image file directory is filled in by close()
+        f.write(b"II*\x00\x00\x00\x00\x00")
+
+    def write_rows(self, rows):
+        self._strip_offsets.append(self._f.tell())
+        self._strip_byte_counts.append(rows.nbytes)
+        self._f.write(np.ascontiguousarray(rows).data)
+
+    def close(self):
+        f = self._f
+        num_strips = len(self._strip_offsets)
+
+        # arrays that don't fit in a tag's 4 byte value are written before the IFD
+        def write_array(fmt, values):
+            if struct.calcsize(f"<{len(values)}{fmt}") <= 4:
+                return struct.pack(f"<{len(values)}{fmt}", *values).ljust(4, b"\x00")
+            offset = f.tell()
+            f.write(struct.pack(f"<{len(values)}{fmt}", *values))
+            if f.tell() % 2:
+                f.write(b"\x00")
+            return struct.pack("<I", offset)
+
+        SHORT, LONG = 3, 4
+        tags = [
+            (256, LONG, 1, struct.pack("<I", self._width)),
+            (257, LONG, 1, struct.pack("<I", self._height)),
+            (258, SHORT, self._channels, write_array("H", [8] * self._channels)),
+            (259, SHORT, 1, struct.pack("<HH", 1, 0)),
+            (262, SHORT, 1, struct.pack("<HH", 2, 0)),
+            (273, LONG, num_strips, write_array("I", self._strip_offsets)),
+            (277, SHORT, 1, struct.pack("<HH", self._channels, 0)),
+            (278, LONG, 1, struct.pack("<I", self._rows_per_strip)),
+            (279, LONG, num_strips, write_array("I", self._strip_byte_counts)),
+            (284, SHORT, 1, struct.pack("<HH", 1, 0)),
+        ]
+        if self._channels == 4:
+            # unassociated alpha
+            tags.append((338, SHORT, 1, struct.pack("<HH", 2, 0)))
+
+        ifd_offset = f.tell()
+        f.write(struct.pack("<H", len(tags)))
+        for tag, field_type, count, value in tags:
+            f.write(struct.pack("<HHI", tag, field_type, count) + value)
+        f.write(struct.pack("<I", 0))
+
+        f.seek(4)
+        f.write(struct.pack("<I", ifd_offset))
+
+
+_WRITERS = {
+    "png": lambda f, width, height, channels, tile_size: _PNGWriter(
+        f, width, height, channels
+    ),
+    "tif": _TIFFWriter,
+    "tiff": _TIFFWriter,
+}
+
+
+def _write_bands(writer, bands, errors):
+    # runs in a separate thread so that compressing and writing one band of tiles
+    # overlaps with rendering the next
+    while (rows := bands.get()) is not None:
+        if errors:
+            continue
+        try:
+            writer.write_rows(rows)
+        except Exception as e:
+            errors.append(e)
+
+
+def save_tiled(
+    sketch,
+    filename: Union[str, Path],
+    scale: float,
+    tile_size: int,
+    draw_func: Callable,
+    *,
+    renderer: str = None,
+    format: str = None,
+    drop_alpha: bool = True,
+) -> None:
+    width = max(1, round(sketch.width * scale))
+    height = max(1, round(sketch.height * scale))
+    tile_size = min(tile_size, width, height)
+    channels = 3 if drop_alpha else 4
+    bands = "RGB" if drop_alpha else "RGBA"
+    filename = Path(str(filename))
+    format = (format or filename.suffix[1:]).lower()
+    if format not in _WRITERS:
+        raise RuntimeError(
+            f"save_tiled() can only write PNG and TIFF files, not '{format}' files"
+        )
+    is_3d = renderer in [sketch.P3D, "P3D"]
+
+    if is_3d:
+        # the frustum of the Sketch's default perspective projection
+        fov = math.pi / 3
+        camera_z = (sketch.height / 2) / math.tan(fov / 2)
+        near, far = camera_z / 10, camera_z * 10
+        y_max = near * math.tan(fov / 2)
+        x_max = y_max * sketch.width / sketch.height
+
+    g = (
+        sketch.create_graphics(tile_size, tile_size, renderer)
+        if renderer
+        else sketch.create_graphics(tile_size, tile_size)
+    )
+
+    def draw_tile(tx, ty):
+        g.begin_draw()
+        try:
+            g.push_matrix()
+            g.push_style()
+            if is_3d:
+                # this tile's part of the full scene's frustum. frustum() shows
+                # eye space y values from -top to -bottom, top of the tile first,
+                # so the first row of tiles has top = y_max.
+                g.camera(
+                    sketch.width / 2,
+                    sketch.height / 2,
+                    camera_z,
+                    sketch.width / 2,
+                    sketch.height / 2,
+                    0,
+                    0,
+                    1,
+                    0,
+                )
+                g.frustum(
+                    -x_max + 2 * x_max * tx / width,
+                    -x_max + 2 * x_max * (tx + tile_size) / width,
+                    y_max - 2 * y_max * (ty + tile_size) / height,
+                    y_max - 2 * y_max * ty / height,
+                    near,
+                    far,
+                )
+            else:
+                g.translate(-tx, -ty)
+                g.scale(scale)
+            draw_func(g)
+            g.pop_style()
+            g.pop_matrix()
+        finally:
+            g.end_draw()
+
+    queued_bands = queue.Queue(maxsize=1)
+    errors = []
+
+    f = open(filename, "wb")
+    try:
+        with f:
+            writer = _WRITERS[format](f, width, height, channels, tile_size)
+            writer_thread = threading.Thread(
+                name="py5-save-tiled",
+                target=_write_bands,
+                args=(writer, queued_bands, errors),
+            )
+            writer_thread.start()
+            try:
+                for ty in range(0, height, tile_size):
+                    th = min(tile_size, height - ty)
+                    band = np.empty((th, width, channels), dtype=np.uint8)
+                    for tx in range(0, width, tile_size):
+                        tw = min(tile_size, width - tx)
+                        draw_tile(tx, ty)
+                        band[:, tx : tx + tw] = g.get_np_pixels(bands=bands)[:th, :tw]
+                    queued_bands.put(band)
+            finally:
+                queued_bands.put(None)
+                writer_thread.join()
+            if errors:
+                raise errors[0]
+            writer.close()
+    except BaseException:
+        # don't leave a partial image behind
+        filename.unlink(missing_ok=True)
+        raise
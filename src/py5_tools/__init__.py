@@ -38,6 +38,7 @@ __all__ = [
     "capture_frames",
     "get_classpath",
     "get_jvm_debug_info",
+    "is_headless_mode",
     "is_jvm_running",
     "live_coding",
     "offline_frame_processing",
@@ -45,7 +46,9 @@ __all__ = [
     "register_processing_mode_key",
     "save_frames",
     "screenshot",
+    "set_headless_mode",
     "sketch_portal",
+    "stream_frames",
     "translators",
 ]
 
@@ -30,6 +30,7 @@ TOOLS_MAP = {
     "run-sketch": "run_sketch",
     "live-coding": "live_coding",
     "install-jdk": "install_jdk",
+    "bench": "bench",
 }
 
 
@@ -77,7 +78,7 @@ def main():
     parsed_args = module.parser.parse_args(remaining_args)
 
     if hasattr(module, "main"):
-        module.main(parsed_args)
+        sys.exit(module.main(parsed_args))
     else:
         print(
             f"Error: {full_module_name} does not have a 'main' function.",
@@ -0,0 +1,692 @@
+# *****************************************************************************
+#
+#   Part of the py5 library
+#   Copyright (C) 2020-2026 Jim Schmitz
+#
+#   This library is free software: you can redistribute it and/or modify it
+#   under the terms of the GNU Lesser General Public License as published by
+#   the Free Software Foundation, either version 2.1 of the License, or (at
+#   your option) any later version.
+#
+#   This library is distributed in the hope that it will be useful, but
+#   WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser
+#   General Public License for more details.
+#
+#   You should have received a copy of the GNU Lesser General Public License
+#   along with this library. If not, see <https://www.gnu.org/licenses/>.
+#
+# *****************************************************************************
+"""
+Performance benchmarks for py5's hot paths.
+
+Run the suite with `python -m py5_tools.bench`, save the results with
+`--output results.json`, and compare two result files with
+`python -m py5_tools.bench --compare old.json new.json`.
+"""
+
+import argparse
+import datetime as dt
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .constants import VERSION
+
+######################################################################
+# BENCHMARK REGISTRY
+######################################################################
+
+_BENCHMARKS = []
+
+
+def _benchmark(group, kind="micro"):
+    """Register a benchmark group.
+
+    The decorated function receives the running Sketch and yields
+    `(name, func, ops)` tuples, where `func` runs the benchmarked code once and
+    `ops` is the number of items it processes, or None."""
+
+    def decorator(func):
+        _BENCHMARKS.append((group, kind, func))
+        return func
+
+    return decorator
+
+
+######################################################################
+# TIMING
+######################################################################
+
+
+def _time_number(func, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - start
+
+
+def time_function(func, *, repeat=5, min_time=0.1, number=None):
+    """Time a function, calibrating the number of calls so that each of the
+    `repeat` measurements lasts at least `min_time` seconds."""
+    func()  # warm up
+
+    if number is None:
+        number = 1
+        while (elapsed := _time_number(func, number)) < min_time and number < 10**7:
+            number *= max(2, min(10, int(min_time / max(elapsed, 1e-9))))
+
+    times = [_time_number(func, number) / number for _ in range(repeat)]
+
+    return _summarize(times, number)
+
+
+def _summarize(times, number):
+    return dict(
+        min=min(times),
+        median=statistics.median(times),
+        mean=statistics.mean(times),
+        stdev=statistics.stdev(times) if len(times) > 1 else 0.0,
+        repeat=len(times),
+        number=number,
+    )
+
+
+######################################################################
+# MICROBENCHMARKS
+######################################################################
+
+
+@_benchmark("bridge")
+def _bridge_benchmarks(s):
+    from jpype import JArray, JObject
+
+    # Java to Python callback through the Processing Mode callPython() method
+    s.register_callback("py5bench.noop", lambda n: n)
+    params = JArray(JObject)([JObject(1, "java.lang.Integer")])
+    yield "bridge.call_python", lambda: s._instance.callPython(
+        "py5bench.noop", params
+    ), None
+
+    # Python to Java calls
+    yield "bridge.millis", s.millis, None
+    yield "bridge.width", lambda: s.width, None
+
+
+@_benchmark("pixels")
+def _pixels_benchmarks(s):
+    for w, h in [(256, 256), (1024, 768), (1920, 1080)]:
+        g = s.create_graphics(w, h)
+        g.begin_draw()
+        g.background(128)
+        g.end_draw()
+
+        yield f"pixels.load_np_pixels[{w}x{h}]", g.load_np_pixels, w * h
+        yield f"pixels.update_np_pixels[{w}x{h}]", g.update_np_pixels, w * h
+        yield f"pixels.get_np_pixels[{w}x{h}]", g.get_np_pixels, w * h
+
+
+@_benchmark("bands")
+def _bands_benchmarks(s):
+    import numpy as np
+
+    for w, h in [(1920, 1080), (3840, 2160)]:
+        g = s.create_graphics(w, h)
+        g.begin_draw()
+        g.background(128)
+        g.end_draw()
+
+        for bands in ["L", "ARGB", "RGB", "RGBA", "BGR", "BGRA"]:
+            dst = g.get_np_pixels(bands=bands)
+            yield (
+                f"bands.get_np_pixels[{bands},{w}x{h}]",
+                lambda g=g, bands=bands, dst=dst: g.get_np_pixels(bands=bands, dst=dst),
+                w * h,
+            )
+            yield (
+                f"bands.set_np_pixels[{bands},{w}x{h}]",
+                lambda g=g, bands=bands, array=dst.copy(): g.set_np_pixels(
+                    array, bands
+                ),
+                w * h,
+            )
+        yield f"bands.to_pil[{w}x{h}]", g.to_pil, w * h
+        del g, dst
+
+
+@_benchmark("drawing")
+def _drawing_benchmarks(s):
+    import numpy as np
+
+    rng = np.random.default_rng(42)
+    n = 10_000
+    coords = rng.uniform(0, 500, size=(n, 4)).astype(np.float32)
+
+    g = s.create_graphics(500, 500)
+    g.begin_draw()
+
+    def vertices():
+        g.begin_shape(g.POINTS)
+        g.vertices(coords[:, :2])
+        g.end_shape()
+
+    try:
+        yield "drawing.points[10000]", lambda: g.points(coords[:, :2]), n
+        yield "drawing.lines[10000]", lambda: g.lines(coords), n
+        yield "drawing.vertices[10000]", vertices, n
+        yield "drawing.rect", lambda: g.rect(10, 10, 20, 20), None
+    finally:
+        g.end_draw()
+
+
+@_benchmark("noise")
+def _noise_benchmarks(s):
+    import numpy as np
+
+    n = 100_000
+    x, y, z = np.random.default_rng(42).uniform(0, 10, size=(3, n))
+
+    yield "noise.noise_1d[100000]", lambda: s.noise(x), n
+    yield "noise.noise_2d[100000]", lambda: s.noise(x, y), n
+    yield "noise.noise_3d[100000]", lambda: s.noise(x, y, z), n
+    yield "noise.os_noise_2d[100000]", lambda: s.os_noise(x, y), n
+    yield "noise.noise_scalar", lambda: s.noise(0.5, 0.25), None
+
+
+@_benchmark("vector")
+def _vector_benchmarks(s):
+    from py5 import Py5Vector
+
+    v1 = Py5Vector(1.0, 2.0, 3.0)
+    v2 = Py5Vector(4.0, 5.0, 6.0)
+
+    yield "vector.create", lambda: Py5Vector(1.0, 2.0, 3.0), None
+    yield "vector.add", lambda: v1 + v2, None
+    yield "vector.mul_scalar", lambda: v1 * 2.5, None
+    yield "vector.dot", lambda: v1.dot(v2), None
+    yield "vector.cross", lambda: v1.cross(v2), None
+    yield "vector.normalize", lambda: v1.copy.normalize(), None
+    yield "vector.mag", lambda: v1.mag, None
+
+
+@_benchmark("color")
+def _color_benchmarks(s):
+    c1, c2 = s.color(255, 0, 0), s.color(0, 0, 255)
+
+    yield "color.rgb", lambda: s.color(255, 128, 0), None
+    yield "color.gray_float", lambda: s.color(0.5), None
+    yield "color.hex_string", lambda: s.color("#FF8000"), None
+    yield "color.lerp_color", lambda: s.lerp_color(c1, c2, 0.5), None
+    yield "color.red", lambda: s.red(c1), None
+
+
+def _image_samples(tempdir):
+    import numpy as np
+    import PIL.Image
+
+    from py5.image_conversion import NumpyImageArray
+
+    array = np.random.default_rng(42).integers(0, 255, (512, 512, 3), dtype=np.uint8)
+    yield "NumpyImageArray", lambda: NumpyImageArray(array, "RGB")
+    yield "PIL.Image", lambda: PIL.Image.fromarray(array)
+
+    svg_file = Path(tempdir) / "py5bench.svg"
+    svg_file.write_text(
+        '<svg xmlns="http://www.w3.org/2000/svg" width="512" height="512">'
+        '<circle cx="256" cy="256" r="200" fill="red"/></svg>'
+    )
+    yield "svg file", lambda: svg_file
+
+    try:
+        import cairocffi
+
+        yield "cairocffi.ImageSurface", lambda: cairocffi.ImageSurface(
+            cairocffi.FORMAT_ARGB32, 512, 512
+        )
+    except ImportError:
+        pass
+
+    try:
+        import cairo
+
+        yield "cairo.ImageSurface", lambda: cairo.ImageSurface(
+            cairo.FORMAT_ARGB32, 512, 512
+        )
+    except ImportError:
+        pass
+
+    try:
+        from matplotlib.figure import Figure
+
+        def figure():
+            fig = Figure(figsize=(4, 4))
+            fig.add_subplot().plot(range(10))
+            return fig
+
+        yield "matplotlib.Figure", figure
+    except ImportError:
+        pass
+
+
+def _shape_samples(tempdir):
+    try:
+        import shapely
+
+        yield "shapely", lambda: shapely.MultiPolygon(
+            [
+                shapely.Point(x, y).buffer(4)
+                for x in range(0, 400, 20)
+                for y in range(0, 400, 20)
+            ]
+        )
+    except ImportError:
+        pass
+
+    try:
+        from matplotlib.textpath import TextPath
+
+        yield "matplotlib.TextPath", lambda: TextPath((0, 0), "py5 benchmark", size=40)
+    except ImportError:
+        pass
+
+    try:
+        import trimesh
+
+        yield "trimesh.Trimesh", lambda: trimesh.creation.icosphere(subdivisions=3)
+        yield "trimesh.PointCloud", lambda: trimesh.PointCloud(
+            trimesh.creation.icosphere(subdivisions=3).vertices
+        )
+        yield "trimesh.Path3D", lambda: trimesh.load_path(
+            [[[0, 0, 0], [1, 0, 0]], [[1, 0, 0], [1, 1, 1]]]
+        )
+        yield "trimesh.Scene", lambda: trimesh.Scene(
+            [trimesh.creation.box(), trimesh.creation.cylinder(1, 2, sections=32)]
+        )
+    except ImportError:
+        pass
+
+
+def _conversion_benchmarks(s, functions, samples, convert, prefix):
+    # one benchmark for each registered converter that has a sample object
+    with tempfile.TemporaryDirectory() as tempdir:
+        for sample_name, make_sample in samples(tempdir):
+            try:
+                sample = make_sample()
+            except Exception:
+                continue
+            for precondition, convert_function in functions:
+                if precondition(sample):
+                    name = f"{prefix}.{convert_function.__name__}[{sample_name}]"
+                    yield name, lambda sample=sample: convert(sample), None
+                    break
+
+
+@_benchmark("convert_image")
+def _convert_image_benchmarks(s):
+    from py5 import image_conversion
+
+    yield from _conversion_benchmarks(
+        s,
+        image_conversion.pimage_functions,
+        _image_samples,
+        s.convert_image,
+        "convert_image",
+    )
+
+
+@_benchmark("convert_shape")
+def _convert_shape_benchmarks(s):
+    from py5 import shape_conversion
+
+    yield from _conversion_benchmarks(
+        s,
+        shape_conversion.pshape_functions,
+        _shape_samples,
+        s.convert_shape,
+        "convert_shape",
+    )
+
+
+@_benchmark("wrapper_cache")
+def _wrapper_cache_benchmarks(s):
+    from py5 import Py5Image, Py5Shape
+
+    for count in [10, 1000]:
+        images = [s.create_image(4, 4, s.RGB) for _ in range(count)]
+        pimage = images[0]._instance
+        yield f"wrapper_cache.py5image[{count}]", lambda: Py5Image(pimage), None
+        del images
+
+    shapes = [s.create_shape() for _ in range(100)]
+    pshape = shapes[0]._instance
+    yield "wrapper_cache.py5shape[100]", lambda: Py5Shape(pshape), None
+
+
+@_benchmark("spelling")
+def _spelling_benchmarks(s):
+    yield "spelling.hasattr_miss", lambda: hasattr(s, "strok_weight"), None
+
+
+######################################################################
+# MACROBENCHMARKS
+######################################################################
+
+
+@_benchmark("render", kind="macro")
+def _render_benchmarks(s):
+    import numpy as np
+
+    rng = np.random.default_rng(42)
+    n = 5_000
+    positions = rng.uniform(0, 800, size=(n, 2)).astype(np.float32)
+    velocities = rng.normal(0, 2, size=(n, 2)).astype(np.float32)
+
+    g = s.create_graphics(800, 800)
+
+    def particles():
+        positions[:] = (positions + velocities) % 800
+        g.begin_draw()
+        g.background(0)
+        g.stroke(255)
+        g.points(positions)
+        g.end_draw()
+
+    def shapes():
+        g.begin_draw()
+        g.background(255)
+        g.fill(200, 50, 50)
+        for x, y in positions[:1000]:
+            g.rect(x, y, 10, 10)
+        g.end_draw()
+
+    def pixel_filter():
+        g.load_np_pixels()
+        g.np_pixels[:, :, 1:] = 255 - g.np_pixels[:, :, 1:]
+        g.update_np_pixels()
+
+    yield "render.particles[5000]", particles, n
+    yield "render.rects[1000]", shapes, 1000
+    yield "render.np_pixels_filter[800x800]", pixel_filter, 800 * 800
+
+
+def _import_py5_benchmark(repeat):
+    # time `import py5` in a new process, including starting the JVM
+    code = "import time; t = time.perf_counter(); import py5; print(time.perf_counter() - t); import os; os._exit(0)"
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        times.append(float(output.strip().splitlines()[-1]))
+
+    return _summarize(times, 1)
+
+
+######################################################################
+# RUNNING BENCHMARKS
+######################################################################
+
+
+def _selected(name, patterns):
+    return not patterns or any(fnmatch.fnmatch(name, p) or p in name for p in patterns)
+
+
+def _machine_metadata():
+    import numpy as np
+
+    return dict(
+        timestamp=dt.datetime.now(dt.timezone.utc).isoformat(),
+        hostname=platform.node(),
+        platform=platform.platform(),
+        machine=platform.machine(),
+        processor=platform.processor(),
+        cpu_count=os.cpu_count(),
+        python_version=platform.python_version(),
+        python_implementation=platform.python_implementation(),
+        py5_version=VERSION,
+        numpy_version=np.__version__,
+    )
+
+
+def run_benchmarks(
+    patterns=None, *, repeat=5, min_time=0.1, frames=200, renderer="HIDDEN"
+):
+    """Run the benchmarks whose names match any of the patterns and return the
+    results with machine metadata."""
+    results = {}
+
+    if _selected("import.py5", patterns):
+        print("running import.py5", file=sys.stderr)
+        try:
+            results["import.py5"] = _import_py5_benchmark(min(repeat, 3))
+        except Exception as e:
+            results["import.py5"] = dict(error=str(e))
+
+    import py5
+
+    class BenchmarkSketch(py5.Sketch):
+        def settings(self):
+            self.size(400, 400, getattr(self, renderer))
+
+        def setup(self):
+            self.frame_rate(10_000)
+            for _, kind, func in _BENCHMARKS:
+                try:
+                    for name, bench_func, ops in func(self):
+                        if not _selected(name, patterns):
+                            continue
+                        print(f"running {name}", file=sys.stderr)
+                        try:
+                            result = time_function(
+                                bench_func, repeat=repeat, min_time=min_time
+                            )
+                            result["kind"] = kind
+                            if ops:
+                                result["ops_per_second"] = ops / result["min"]
+                            results[name] = result
+                        except Exception as e:
+                            results[name] = dict(kind=kind, error=str(e))
+                except Exception as e:
+                    results[func.__name__] = dict(kind=kind, error=str(e))
+
+            self.java_version = str(self.java_version_name)
+            self.frame_times = []
+            self.run_frame_benchmark = _selected("bridge.draw_frame", patterns)
+
+        def draw(self):
+            # the frame time includes the draw() callback and the pre and post
+            # frame work done by py5 and Processing
+            self.frame_times.append(time.perf_counter())
+            if not self.run_frame_benchmark or len(self.frame_times) > frames:
+                self.exit_sketch()
+
+    sketch = BenchmarkSketch()
+    sketch.run_sketch(block=True)
+
+    if len(sketch.frame_times) > 10:
+        # skip the first frames while things warm up
+        frame_times = sketch.frame_times[10:]
+        chunk = max(1, len(frame_times) // repeat)
+        times = [
+            (frame_times[i + chunk - 1] - frame_times[i]) / max(1, chunk - 1)
+            for i in range(0, len(frame_times) - chunk + 1, chunk)
+        ]
+        results["bridge.draw_frame"] = dict(_summarize(times, chunk), kind="macro")
+
+    metadata = _machine_metadata()
+    metadata["java_version"] = getattr(sketch, "java_version", None)
+    metadata["renderer"] = renderer
+
+    return dict(metadata=metadata, results=results)
+
+
+######################################################################
+# REPORTING
+######################################################################
+
+
+def _format_time(t):
+    for unit, scale in [("s", 1), ("ms", 1e-3), ("us", 1e-6)]:
+        if t >= scale:
+            return f"{t / scale:8.2f}{unit}"
+    return f"{t / 1e-9:8.2f}ns"
+
+
+def print_results(results, file=sys.stdout):
+    for name, result in sorted(results["results"].items()):
+        if "error" in result:
+            print(f"{name:56s}  error: {result['error']}", file=file)
+            continue
+        line = f"{name:56s} {_format_time(result['min'])}  median {_format_time(result['median'])}"
+        if "ops_per_second" in result:
+            line += f"  {result['ops_per_second']:,.0f} ops/s"
+        print(line, file=file)
+
+
+def compare_results(old, new, *, threshold=0.1, file=sys.stdout):
+    """Compare two benchmark results and return the names of the benchmarks
+    that got slower by more than the threshold."""
+    regressions = []
+    for name in sorted(set(old["results"]) | set(new["results"])):
+        old_result = old["results"].get(name, {})
+        new_result = new["results"].get(name, {})
+        if "min" not in old_result or "min" not in new_result:
+            status = "only in old" if "min" in old_result else "only in new"
+            if "min" not in old_result and "min" not in new_result:
+                status = "error"
+            print(f"{name:56s} {status}", file=file)
+            continue
+
+        ratio = new_result["min"] / old_result["min"]
+        if ratio > 1 + threshold:
+            status = "REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 / (1 + threshold):
+            status = "improvement"
+        else:
+            status = ""
+        print(
+            f"{name:56s} {_format_time(old_result['min'])} -> {_format_time(new_result['min'])}  {ratio:6.2f}x  {status}",
+            file=file,
+        )
+
+    old_machine, new_machine = (
+        {k: v for k, v in r["metadata"].items() if k not in ["timestamp"]}
+        for r in [old, new]
+    )
+    if old_machine != new_machine:
+        print(
+            "\nnote: the results come from different machines or software versions:",
+            file=file,
+        )
+        for key in sorted(set(old_machine) | set(new_machine)):
+            if old_machine.get(key) != new_machine.get(key):
+                print(
+                    f"  {key}: {old_machine.get(key)} -> {new_machine.get(key)}",
+                    file=file,
+                )
+
+    print(
+        f"\n{len(regressions)} regression(s) with a threshold of {threshold:.0%}",
+        file=file,
+    )
+
+    return regressions
+
+
+######################################################################
+# COMMAND LINE INTERFACE
+######################################################################
+
+
+parser = argparse.ArgumentParser(description="Run py5's performance benchmarks")
+parser.add_argument(
+    "-k",
+    "--filter",
+    action="append",
+    dest="patterns",
+    help="only run benchmarks matching this name or wildcard pattern (repeatable)",
+)
+parser.add_argument(
+    "-o", "--output", dest="output", help="write the results to this JSON file"
+)
+parser.add_argument(
+    "-r",
+    "--repeat",
+    type=int,
+    default=5,
+    dest="repeat",
+    help="number of measurements for each benchmark",
+)
+parser.add_argument(
+    "--min-time",
+    type=float,
+    default=0.1,
+    dest="min_time",
+    help="minimum duration of each measurement in seconds",
+)
+parser.add_argument(
+    "--renderer",
+    default="HIDDEN",
+    dest="renderer",
+    help="renderer for the benchmark Sketch",
+)
+parser.add_argument(
+    "-l", "--list", action="store_true", dest="list", help="list benchmark groups"
+)
+parser.add_argument(
+    "--compare",
+    nargs=2,
+    metavar=("OLD", "NEW"),
+    dest="compare",
+    help="compare two results files instead of running benchmarks",
+)
+parser.add_argument(
+    "--threshold",
+    type=float,
+    default=0.1,
+    dest="threshold",
+    help="relative slowdown reported as a regression when comparing results",
+)
+
+
+def main(args=None):
+    args = args or parser.parse_args()
+
+    if args.list:
+        for group, kind, _ in _BENCHMARKS:
+            print(f"{group} ({kind})")
+        print("import.py5 (macro)")
+        print("bridge.draw_frame (macro)")
+        return 0
+
+    if args.compare:
+        old, new = (json.loads(Path(f).read_text()) for f in args.compare)
+        regressions = compare_results(old, new, threshold=args.threshold)
+        return 1 if regressions else 0
+
+    results = run_benchmarks(
+        args.patterns,
+        repeat=args.repeat,
+        min_time=args.min_time,
+        renderer=args.renderer,
+    )
+    print_results(results)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"results written to {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
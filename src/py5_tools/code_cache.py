@@ -0,0 +1,114 @@
+# *****************************************************************************
+#
+#   Part of the py5 library
+#   Copyright (C) 2020-2026 Jim Schmitz
+#
+#   This library is free software: you can redistribute it and/or modify it
+#   under the terms of the GNU Lesser General Public License as published by
+#   the Free Software Foundation, either version 2.1 of the License, or (at
+#   your option) any later version.
+#
+#   This library is distributed in the hope that it will be useful, but
+#   WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser
+#   General Public License for more details.
+#
+#   You should have received a copy of the GNU Lesser General Public License
+#   along with this library. If not, see <https://www.gnu.org/licenses/>.
+#
+# *****************************************************************************
+"""
+On-disk cache for transformed and compiled imported mode code.
+
+Cache entries are stored in the py5 home directory, one entry for each source
+file and kind of processing. An entry is only used if it was made from the same
+source code with the same py5 and Python versions, much like the `*.pyc` files
+in a `__pycache__` directory. Set the `PY5_DISABLE_CODE_CACHE` environment
+variable to disable the cache. Enable debug logging for the
+`py5_tools.code_cache` logger to see cache hits and misses.
+"""
+
+import hashlib
+import importlib.util
+import logging
+import marshal
+import os
+import sys
+from pathlib import Path
+from types import CodeType
+from typing import Any, Union
+
+from .constants import PY5_HOME, VERSION
+
+CACHE_DIR = Path(PY5_HOME) / "code-cache"
+
+logger = logging.getLogger(__name__)
+
+
+def _is_enabled():
+    return not os.environ.get("PY5_DISABLE_CODE_CACHE")
+
+
+def _entry_path(kind, filename):
+    name = hashlib.sha256(f"{kind}\0{Path(filename).absolute()}".encode()).hexdigest()
+    return CACHE_DIR / f"{name[:32]}.{kind}"
+
+
+def _source_digest(source):
+    h = hashlib.sha256(importlib.util.MAGIC_NUMBER)
+    h.update(VERSION.encode())
+    h.update(b"\0")
+    h.update(source.encode("utf-8", "surrogatepass"))
+    return h.digest()
+
+
+def relocate(code: CodeType, filename: Union[Path, str]) -> CodeType:
+    """Make a cached code object report a different source filename."""
+    filename = str(filename)
+    if code.co_filename == filename:
+        return code
+    consts = tuple(
+        relocate(c, filename) if isinstance(c, CodeType) else c for c in code.co_consts
+    )
+    return code.replace(co_filename=filename, co_consts=consts)
+
+
+def load(kind: str, filename: Union[Path, str], source: str) -> Any:
+    """Get the cached result for the given source, or None if there isn't one."""
+    if not _is_enabled():
+        return None
+
+    path = _entry_path(kind, filename)
+    digest = _source_digest(source)
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        if data[: len(digest)] == digest:
+            value = marshal.loads(data[len(digest) :])
+            logger.debug("code cache hit for %s (%s)", filename, kind)
+            return value
+    except FileNotFoundError:
+        pass
+    except (OSError, EOFError, ValueError, TypeError) as e:
+        logger.debug("unable to read code cache entry %s: %s", path, e)
+
+    logger.debug("code cache miss for %s (%s)", filename, kind)
+    return None
+
+
+def store(kind: str, filename: Union[Path, str], source: str, value: Any) -> None:
+    """Cache a result, such as a code object, made from the given source."""
+    if not _is_enabled() or sys.dont_write_bytecode:
+        return
+
+    path = _entry_path(kind, filename)
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        data = _source_digest(source) + marshal.dumps(value)
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except (OSError, ValueError) as e:
+        logger.debug("unable to write code cache entry %s: %s", path, e)
+        temp_path.unlink(missing_ok=True)
@@ -22,6 +22,7 @@ from __future__ import annotations
 import sys
 import tempfile
 import time
+import weakref
 from pathlib import Path
 from typing import Callable, Iterable
 
@@ -33,7 +34,9 @@ from PIL.Image import Image as PIL_Image
 
 from .. import environ as _environ
 from .. import imported as _imported
+from .frame_server import FrameStreamServer
 from .hooks import (
+    FrameStreamHook,
     GrabFramesHook,
     QueuedBatchProcessingHook,
     SaveFramesHook,
@@ -653,10 +656,141 @@ def capture_frames(
     return results
 
 
+_frame_stream_servers = weakref.WeakKeyDictionary()
+
+
+def stream_frames(
+    *,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    frame_rate: float = 15.0,
+    scale: float = 1.0,
+    quality: int = 75,
+    time_limit: float = 0.0,
+    sketch: Sketch = None,
+    hook_post_draw: bool = False,
+) -> FrameStreamServer:
+    """Stream a running Sketch's frames to web browsers and other clients with a local
+    web server.
+
+    Parameters
+    ----------
+
+    frame_rate: float = 15.0
+        maximum number of frames per second to stream
+
+    hook_post_draw: bool = False
+        attach hook to Sketch's post_draw method instead of draw
+
+    host: str = "127.0.0.1"
+        network interface the web server listens on
+
+    port: int = 0
+        port the web server listens on (default 0 means any available port)
+
+    quality: int = 75
+        JPEG stream quality between 1 (worst) and 100 (best)
+
+    scale: float = 1.0
+        scale factor to adjust the height and width of the streamed frames
+
+    sketch: Sketch = None
+        running Sketch
+
+    time_limit: float = 0.0
+        time limit in seconds for the stream; set to 0 (default) for no limit
+
+    Notes
+    -----
+
+    Stream a running Sketch's frames to web browsers and other clients with a local
+    web server. This makes it possible to watch a Sketch running on a computer with
+    no display, such as a headless installation, or to watch a Sketch from another
+    device.
+
+    The returned `FrameStreamServer` object's `url` property is the address of a
+    web page that displays the stream. The server provides the following endpoints:
+
+    * `/stream.mjpg`: a Motion JPEG stream that browsers can display in an `<img>`
+      tag and that tools like `ffplay` or VLC can play
+    * `/ws`: a WebSocket that sends each frame as a binary JPEG message
+    * `/frame.jpg`: a single JPEG image of the most recent frame, which is useful
+      for testing with `curl`
+
+    The Sketch's animation thread only copies the pixels, and only when there is at
+    least one connected client. The JPEG encoding is done by a separate thread. If
+    the Sketch produces frames faster than they can be encoded, the older frames
+    are dropped and only the newest frame is encoded. Frames identical to the
+    previous frame are not encoded or sent again. Slow clients skip frames instead
+    of slowing down the Sketch.
+
+    Use `frame_rate` to limit the number of frames per second streamed, `scale` to
+    resize the streamed frames, and `quality` to set the JPEG quality factor. If
+    the stream causes the Sketch's frame rate to drop, try lowering these values.
+
+    By default the server only accepts connections from the same computer. Set the
+    `host` parameter to `"0.0.0.0"` to accept connections from other computers on
+    the network. There is no authentication, so only do that on a trusted network.
+
+    By default the Sketch will be the currently running Sketch, as returned by
+    `get_current_sketch()`. Use the `sketch` parameter to specify a different
+    running Sketch, such as a Sketch created using class mode.
+
+    The stream stops when the time limit expires, when the Sketch exits, or when
+    the returned object's `stop()` method is called. Calling `stream_frames()` again
+    for the same Sketch stops the previous stream.
+
+    If your Sketch has a `post_draw()` method, use the `hook_post_draw` parameter to
+    make this function run after `post_draw()` instead of `draw()`. This is
+    important when using Processing libraries that support `post_draw()` such as
+    Camera3D or ColorBlindness."""
+    import py5
+
+    if sketch is None:
+        sketch = py5.get_current_sketch()
+        using_current_sketch = True
+    else:
+        using_current_sketch = False
+
+    if sketch.is_dead:
+        msg = f'The {"current " if using_current_sketch else ""}Sketch is dead. The py5_tools.stream_frames() function cannot be used on a Sketch in the dead state.'
+        if using_current_sketch:
+            msg += f' Call {"" if _imported.get_imported_mode() else "py5."}reset_py5() to reset py5 to the ready state.'
+        raise RuntimeError(msg)
+
+    if frame_rate is not None and frame_rate <= 0:
+        raise RuntimeError("The frame_rate parameter must be None or greater than zero")
+    if time_limit < 0:
+        raise RuntimeError(
+            "The time_limit parameter must be greater than or equal to zero"
+        )
+    if quality < 1 or quality > 100:
+        raise RuntimeError(
+            "The quality parameter must be between 1 (worst) and 100 (best)"
+        )
+    if scale <= 0:
+        raise RuntimeError("The scale parameter must be greater than zero")
+
+    # a Sketch has at most one stream at a time
+    if (previous_server := _frame_stream_servers.get(sketch)) is not None:
+        previous_server.stop()
+
+    server = FrameStreamServer(host, port, scale, quality)
+    _frame_stream_servers[sketch] = server
+    hook = FrameStreamHook(server, frame_rate, time_limit)
+    sketch._add_post_hook(
+        "post_draw" if hook_post_draw else "draw", hook.hook_name, hook
+    )
+    hook._msg_writer.print(f"streaming Sketch frames at {server.url}")
+
+    return server
+
+
 __all__ = [
     "screenshot",
     "save_frames",
     "offline_frame_processing",
     "animated_gif",
     "capture_frames",
+    "stream_frames",
 ]
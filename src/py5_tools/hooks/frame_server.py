@@ -0,0 +1,333 @@
+# *****************************************************************************
+#
+#   Part of the py5 library
+#   Copyright (C) 2020-2026 Jim Schmitz
+#
+#   This library is free software: you can redistribute it and/or modify it
+#   under the terms of the GNU Lesser General Public License as published by
+#   the Free Software Foundation, either version 2.1 of the License, or (at
+#   your option) any later version.
+#
+#   This library is distributed in the hope that it will be useful, but
+#   WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser
+#   General Public License for more details.
+#
+#   You should have received a copy of the GNU Lesser General Public License
+#   along with this library. If not, see <https://www.gnu.org/licenses/>.
+#
+# *****************************************************************************
+import base64
+import hashlib
+import io
+import struct
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import PIL.Image
+
+_BOUNDARY = "py5frame"
+_WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_KEEPALIVE_TIMEOUT = 5.0
+
+_INDEX_HTML = """<!DOCTYPE html>
+<html>
+<head><title>py5 Sketch</title></head>
+<body style="margin: 0; background: #222;">
+<img src="stream.mjpg" style="display: block; margin: auto;">
+</body>
+</html>
+"""
+
+
+def _websocket_frame(opcode, payload=b""):
+    # servers send unmasked frames
+    if len(payload) < 126:
+        header = struct.pack("!BB", 0x80 | opcode, len(payload))
+    elif len(payload) < 65536:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, len(payload))
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, len(payload))
+    return header + payload
+
+
+def _read_websocket_frame(rfile):
+    header = rfile.read(2)
+    if len(header) < 2:
+        return None
+    opcode = header[0] & 0x0F
+    length = header[1] & 0x7F
+    if length == 126:
+        (length,) = struct.unpack("!H", rfile.read(2))
+    elif length == 127:
+        (length,) = struct.unpack("!Q", rfile.read(8))
+    mask = rfile.read(4) if header[1] & 0x80 else None
+    payload = rfile.read(length)
+    if len(payload) < length:
+        return None
+    if mask is not None:
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+    return opcode, payload
+
+
+class _FrameRequestHandler(BaseHTTPRequestHandler):
+    # WebSocket upgrades require HTTP/1.1
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        stream = self.server.frame_stream
+        path = self.path.split("?")[0]
+        try:
+            if path in ["/", "/index.html"]:
+                self._send_index()
+            elif path == "/stream.mjpg":
+                self._send_mjpeg(stream)
+            elif path == "/frame.jpg":
+                self._send_frame(stream)
+            elif (
+                path == "/ws" and "websocket" in self.headers.get("Upgrade", "").lower()
+            ):
+                self._send_websocket(stream)
+            else:
+                self.send_error(404)
+        except (BrokenPipeError, ConnectionResetError):
+            # the client went away
+            pass
+
+    def _send_index(self):
+        body = _INDEX_HTML.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_frame(self, stream):
+        with stream._client():
+            # wait briefly for a fresh frame. it won't come if nothing has changed.
+            _, jpeg = stream._next_jpeg(stream._jpeg_seq, timeout=1.0) or (0, None)
+        if jpeg is None:
+            self.send_error(503)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "image/jpeg")
+        self.send_header("Content-Length", str(len(jpeg)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(jpeg)
+
+    def _send_mjpeg(self, stream):
+        self.send_response(200)
+        self.send_header(
+            "Content-Type", f"multipart/x-mixed-replace; boundary={_BOUNDARY}"
+        )
+        self.send_header("Cache-Control", "no-store")
+        # the stream has no length, so it ends when the connection is closed
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        with stream._client():
+            seq = -1
+            while next_jpeg := stream._next_jpeg(seq, timeout=_KEEPALIVE_TIMEOUT):
+                seq, jpeg = next_jpeg
+                if jpeg is None:
+                    continue
+                self.wfile.write(
+                    f"--{_BOUNDARY}\r\nContent-Type: image/jpeg\r\n"
+                    f"Content-Length: {len(jpeg)}\r\n\r\n".encode("ascii")
+                    + jpeg
+                    + b"\r\n"
+                )
+                self.wfile.flush()
+
+    def _send_websocket(self, stream):
+        key = self.headers.get("Sec-WebSocket-Key", "")
+        accept = base64.b64encode(
+            hashlib.sha1((key + _WEBSOCKET_GUID).encode("ascii")).digest()
+        ).decode("ascii")
+        self.send_response(101)
+        self.send_header("Upgrade", "websocket")
+        self.send_header("Connection", "Upgrade")
+        self.send_header("Sec-WebSocket-Accept", accept)
+        self.end_headers()
+        self.close_connection = True
+
+        write_lock = threading.Lock()
+        closed = threading.Event()
+
+        def send(opcode, payload=b""):
+            # nothing can be sent after a close frame
+            with write_lock:
+                if closed.is_set():
+                    return
+                if opcode == 0x8:
+                    closed.set()
+                self.wfile.write(_websocket_frame(opcode, payload))
+                self.wfile.flush()
+
+        def read_client_frames():
+            # answer pings and close requests. other messages are ignored.
+            try:
+                while frame := _read_websocket_frame(self.rfile):
+                    opcode, payload = frame
+                    if opcode == 0x8:
+                        send(0x8, payload[:2])
+                        return
+                    elif opcode == 0x9:
+                        send(0xA, payload)
+            except (OSError, ValueError, struct.error):
+                pass
+            closed.set()
+
+        threading.Thread(
+            name="py5-frame-server-websocket", target=read_client_frames, daemon=True
+        ).start()
+
+        with stream._client():
+            seq = -1
+            while not closed.is_set() and (
+                next_jpeg := stream._next_jpeg(seq, timeout=_KEEPALIVE_TIMEOUT)
+            ):
+                seq, jpeg = next_jpeg
+                if jpeg is not None:
+                    send(0x2, jpeg)
+            send(0x8)
+
+    def log_message(self, *args):
+        pass
+
+
+class _ClientContext:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def __enter__(self):
+        with self.stream._jpeg_cond:
+            self.stream._client_count += 1
+
+    def __exit__(self, *exc):
+        with self.stream._jpeg_cond:
+            self.stream._client_count -= 1
+
+
+class FrameStreamServer:
+    """Serve JPEG encoded Sketch frames over HTTP as MJPEG and over WebSockets.
+
+    Frames are submitted by the animation thread and encoded on a separate thread.
+    If a new frame arrives before the previous one was encoded, the previous one is
+    dropped, so a slow encoder or slow clients never hold up the Sketch.
+    """
+
+    def __init__(self, host, port, scale, quality):
+        self.scale = scale
+        self.quality = quality
+        self.frames_encoded = 0
+        self.frames_dropped = 0
+        self.frames_unchanged = 0
+
+        self._frame = None
+        self._last_frame = None
+        self._frame_cond = threading.Condition()
+        self._jpeg = None
+        self._jpeg_seq = 0
+        self._jpeg_cond = threading.Condition()
+        self._client_count = 0
+        self._stopped = False
+
+        self._httpd = ThreadingHTTPServer((host, port), _FrameRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.frame_stream = self
+
+        self._server_thread = threading.Thread(
+            name="py5-frame-server", target=self._httpd.serve_forever, daemon=True
+        )
+        self._encoder_thread = threading.Thread(
+            name="py5-frame-encoder", target=self._encode_frames, daemon=True
+        )
+        self._server_thread.start()
+        self._encoder_thread.start()
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def client_count(self) -> int:
+        return self._client_count
+
+    @property
+    def has_clients(self) -> bool:
+        return self._client_count > 0
+
+    @property
+    def is_stopped(self) -> bool:
+        return self._stopped
+
+    def submit_frame(self, frame):
+        with self._frame_cond:
+            if self._frame is not None:
+                self.frames_dropped += 1
+            self._frame = frame
+            self._frame_cond.notify()
+
+    def stop(self) -> None:
+        if self._stopped:
+            return
+        self._stopped = True
+        with self._frame_cond:
+            self._frame_cond.notify_all()
+        with self._jpeg_cond:
+            self._jpeg_cond.notify_all()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _client(self):
+        return _ClientContext(self)
+
+    def _next_jpeg(self, last_seq, timeout=None):
+        # returns None after the server stops. after a timeout the current jpeg is
+        # returned again, which also lets the handlers notice disconnected clients.
+        with self._jpeg_cond:
+            self._jpeg_cond.wait_for(
+                lambda: self._stopped or self._jpeg_seq > max(last_seq, 0), timeout
+            )
+            if self._stopped:
+                return None
+            return self._jpeg_seq, self._jpeg
+
+    def _encode_frames(self):
+        while True:
+            with self._frame_cond:
+                self._frame_cond.wait_for(
+                    lambda: self._stopped or self._frame is not None
+                )
+                if self._stopped:
+                    return
+                frame, self._frame = self._frame, None
+
+            # identical frames do not need to be encoded and sent again
+            if (
+                self._last_frame is not None
+                and self._jpeg is not None
+                and np.array_equal(frame, self._last_frame)
+            ):
+                self.frames_unchanged += 1
+                continue
+            self._last_frame = frame
+
+            img = PIL.Image.fromarray(frame, mode="RGB")
+            if self.scale != 1.0:
+                img = img.resize(
+                    tuple(max(1, int(self.scale * x)) for x in img.size),
+                    PIL.Image.Resampling.BILINEAR,
+                )
+            b = io.BytesIO()
+            img.save(b, format="JPEG", quality=self.quality)
+
+            with self._jpeg_cond:
+                self._jpeg = b.getvalue()
+                self._jpeg_seq += 1
+                self.frames_encoded += 1
+                self._jpeg_cond.notify_all()
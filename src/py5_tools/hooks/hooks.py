@@ -334,3 +334,38 @@ class SketchPortalHook(BaseHook):
             self.last_frame_time = time.time()
         except Exception as e:
             self.hook_error(sketch, e)
+
+
+class FrameStreamHook(BaseHook):
+    def __init__(self, server, frame_rate, time_limit):
+        super().__init__("py5frame_stream_hook")
+        self.server = server
+        self.period = 1 / frame_rate if frame_rate else 0
+        self.time_limit = time_limit
+        self.last_frame_time = 0
+        self.start_time = time.time()
+
+    def __call__(self, sketch):
+        try:
+            if self.server.is_stopped or (
+                self.time_limit and time.time() > self.start_time + self.time_limit
+            ):
+                self.server.stop()
+                self.hook_finished(sketch)
+                return
+            # grabbing pixels costs time, so only do it when someone is watching
+            if (
+                not self.server.has_clients
+                or time.time() < self.last_frame_time + self.period
+            ):
+                return
+            sketch.load_np_pixels()
+            self.server.submit_frame(sketch.np_pixels[:, :, 1:].copy())
+            self.last_frame_time = time.time()
+        except Exception as e:
+            self.server.stop()
+            self.hook_error(sketch, e)
+
+    def sketch_terminated(self):
+        self.server.stop()
+        super().sketch_terminated()
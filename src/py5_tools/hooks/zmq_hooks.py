@@ -138,7 +138,7 @@ def sketch_portal(
     wasting resources. A Sketch can only have one open portal, so opening a new
     portal with different options will replace an existing portal."""
     raise RuntimeError(
-        "The sketch_widget() functionality is broken and was removed in py5 version 0.10.0. It will be re-introduced in a future release. Sorry!"
+        "The sketch_widget() functionality is broken and was removed in py5 version 0.10.0. It will be re-introduced in a future release. Sorry! In the meantime, use py5_tools.stream_frames() to watch a running Sketch in a web browser."
     )
 
     environment = _environ.Environment()
@@ -18,6 +18,8 @@
 #
 # *****************************************************************************
 import ast
+import builtins
+import os
 import re
 import sys
 from importlib.abc import Loader, MetaPathFinder
@@ -26,6 +28,8 @@ from pathlib import Path
 
 import py5_tools
 
+from . import code_cache
+
 PY5_IMPORTED_MODE_CODE_MARKER_REGEX = re.compile(
     r"^# PY5 IMPORTED MODE CODE\s*$", re.MULTILINE | re.IGNORECASE
 )
@@ -45,26 +49,65 @@ class Py5ImportedModeFinder(MetaPathFinder):
     def __init__(self):
         super().__init__()
         self._validated_py5_module_mode_paths = []
+        # directory listings and marker verdicts, validated with modification times
+        self._directory_listings = {}
+        self._marker_verdicts = {}
+
+    def invalidate_caches(self):
+        self._directory_listings.clear()
+        self._marker_verdicts.clear()
+
+    def _list_directory(self, directory):
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return frozenset()
+
+        cached = self._directory_listings.get(directory)
+        if cached is None or cached[0] != mtime:
+            try:
+                names = frozenset(os.listdir(directory))
+            except OSError:
+                names = frozenset()
+            self._directory_listings[directory] = cached = (mtime, names)
+
+        return cached[1]
+
+    def _has_marker(self, filename):
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return False
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._marker_verdicts.get(filename)
+        if cached is None or cached[0] != key:
+            with open(filename) as f:
+                data = f.read()
+            verdict = PY5_IMPORTED_MODE_CODE_MARKER_REGEX.search(data) is not None
+            self._marker_verdicts[filename] = cached = (key, verdict)
+
+        return cached[1]
 
     def find_spec(self, fullname, path, target=None):
         if path is None or path == "":
-            path = [Path.cwd()]
-
-            # first, determine if this is py5 imported mode code
-            marker_file1 = Path(path[0], fullname + ".py")
-            marker_file2 = Path(path[0], fullname, "__init__.py")
-
-            if marker_file1.exists():
-                with open(marker_file1) as f:
-                    data = f.read()
-                if not PY5_IMPORTED_MODE_CODE_MARKER_REGEX.search(data):
+            cwd = os.getcwd()
+            path = [cwd]
+
+            # first, determine if this is py5 imported mode code. most imports
+            # are for other modules and are declined after a cached directory
+            # listing lookup, without reading any files.
+            names = self._list_directory(cwd)
+            if fullname + ".py" in names:
+                if not self._has_marker(os.path.join(cwd, fullname + ".py")):
                     return None
-            elif marker_file2.exists():
-                with open(marker_file2) as f:
-                    data = f.read()
-                if PY5_IMPORTED_MODE_CODE_MARKER_REGEX.search(data):
+            elif fullname in names:
+                marker_file2 = Path(cwd, fullname, "__init__.py")
+                if self._has_marker(str(marker_file2)):
                     self._validated_py5_module_mode_paths.append(marker_file2.parent)
                 else:
+                    # a regular package, or a namespace package without a
+                    # __init__.py file. leave it to the other finders.
                     return None
             else:
                 # if we get here, this must be a module without a __init__.py file?
@@ -113,45 +156,59 @@ class Py5ImportedModeLoader(Loader):
         with open(self.filename) as f:
             code_src = f.read()
 
-        # parse the unaltered code to check for reserved word problems
-        code_ast = ast.parse(code_src, filename=self.filename, mode="exec")
-        problems = py5_tools.parsing.check_reserved_words(code_src, code_ast)
-        if problems:
-            msg = (
-                "There "
-                + (
-                    "is a problem"
-                    if len(problems) == 1
-                    else f"are {len(problems)} problems"
+        if (
+            source := code_cache.load("imported-module", self.filename, code_src)
+        ) is None:
+            # parse the unaltered code to check for reserved word problems
+            code_ast = ast.parse(code_src, filename=self.filename, mode="exec")
+            problems = py5_tools.parsing.check_reserved_words(code_src, code_ast)
+            if problems:
+                msg = (
+                    "There "
+                    + (
+                        "is a problem"
+                        if len(problems) == 1
+                        else f"are {len(problems)} problems"
+                    )
+                    + ' with the imported "'
+                    + str(module.__name__)
+                    + '" module.\n'
                 )
-                + ' with the imported "'
-                + str(module.__name__)
-                + '" module.\n'
-            )
-            msg += "=" * len(msg) + "\n" + "\n".join(problems)
-            raise Py5ImportError(msg)
-
-        # add the necessary helper methods for for dynamic variables
-        code_src = PY5_HEADER + "\n\n\n" + code_src
-
-        # parse and compile the altered code
-        code_ast = ast.parse(code_src, filename=self.filename, mode="exec")
-        code_ast = py5_tools.parsing.transform_py5_code(code_ast)
-        source = compile(code_ast, self.filename, "exec")
-
-        # exec the code in a temporary namespace
-        import py5
-
-        exec(source, ns := {**vars(py5), **vars(module)})
-
-        # add user's code to the module. the filtering makes sure we don't add
-        # py5 methods necessary for proper execution to the module's namespace
-        for name, value in ns.items():
-            if (
-                name not in py5.__dict__
-                and name not in py5_tools.reference.PY5_DYNAMIC_VARIABLES
-            ):
-                setattr(module, name, value)
+                msg += "=" * len(msg) + "\n" + "\n".join(problems)
+                raise Py5ImportError(msg)
+
+            # transform and compile the code
+            code_ast = py5_tools.parsing.transform_py5_code(code_ast)
+            source = compile(code_ast, self.filename, "exec")
+            code_cache.store("imported-module", self.filename, code_src, source)
+
+        # exec the code in the module's namespace. the py5 functions and the
+        # helper functions for dynamic variables are found in a shared builtins
+        # namespace, so they are available without being added to the module.
+        module.__builtins__ = _get_py5_builtins()
+        exec(source, vars(module))
+
+
+_py5_builtins = None
+
+
+def _get_py5_builtins():
+    global _py5_builtins
+    import py5
+
+    # rebuild if reset_py5() replaced the current Sketch
+    if _py5_builtins is None or _py5_builtins[0] is not py5.get_current_sketch():
+        namespace = dict(vars(builtins))
+        namespace.update(
+            (name, value)
+            for name, value in vars(py5).items()
+            if not (name.startswith("__") and name.endswith("__"))
+        )
+        # add the necessary helper methods for dynamic variables
+        exec(PY5_HEADER, namespace)
+        _py5_builtins = (py5.get_current_sketch(), namespace)
+
+    return _py5_builtins[1]
 
 
 def activate_py5_import_hook():
@@ -27,7 +27,7 @@ from pathlib import Path
 
 import stackprinter
 
-from . import import_hook, jvm, parsing
+from . import code_cache, import_hook, jvm, parsing
 
 _imported_mode = False
 _imported_mode_locked = False
@@ -55,41 +55,19 @@ def get_imported_mode() -> bool:
 
 
 _STATIC_CODE_FRAMEWORK = """
-import ast as _PY5STATIC_ast
-
 import py5_tools
 py5_tools.set_imported_mode(True)
-import py5_tools.parsing as _PY5STATIC_parsing
+import py5_tools.imported as _PY5STATIC_imported
 from py5 import *
 _PY5_NS_ = locals().copy()
 
 
 def settings():
-    with open('{0}', 'r') as f:
-        exec(
-            compile(
-                _PY5STATIC_parsing.transform_py5_code(
-                    _PY5STATIC_ast.parse(f.read(), filename='{0}', mode='exec'),
-                ),
-                filename='{0}',
-                mode='exec'
-            ),
-            _PY5_NS_
-        )
+    exec(_PY5STATIC_imported._compile_static_code('{0}', {2!r}, 'static-settings'), _PY5_NS_)
 
 
 def setup():
-    with open('{1}', 'r') as f:
-        exec(
-            compile(
-                _PY5STATIC_parsing.transform_py5_code(
-                    _PY5STATIC_ast.parse(f.read(), filename='{1}', mode='exec'),
-                ),
-                filename='{1}',
-                mode='exec'
-            ),
-            _PY5_NS_
-        )
+    exec(_PY5STATIC_imported._compile_static_code('{1}', {2!r}, 'static-setup'), _PY5_NS_)
 """
 
 _CODE_FRAMEWORK = """{0}
@@ -107,6 +85,23 @@ SETUP_REGEX = re.compile(r"^def setup\s*\(\s*\):", flags=re.MULTILINE)
 DRAW_REGEX = re.compile(r"^def draw\s*\(\s*\):", flags=re.MULTILINE)
 
 
+def _compile_static_code(filename, sketch_path, kind):
+    with open(filename, "r") as f:
+        code = f.read()
+
+    # the generated file is in a new directory for every run, so the compiled
+    # code is cached for the original Sketch file
+    if (code_obj := code_cache.load(kind, sketch_path, code)) is None:
+        code_obj = compile(
+            parsing.transform_py5_code(ast.parse(code, filename=filename, mode="exec")),
+            filename=filename,
+            mode="exec",
+        )
+        code_cache.store(kind, sketch_path, code, code_obj)
+
+    return code_cache.relocate(code_obj, filename)
+
+
 def is_static_mode(code):
     no_settings = SETTINGS_REGEX.search(code) is None
     no_setup = SETUP_REGEX.search(code) is None
@@ -167,12 +162,18 @@ def _run_static_code(
     sketch_args,
     block,
 ):
-    success, result = parsing.check_for_problems(code, sketch_path)
+    if (cached_result := code_cache.load("static-split", sketch_path, code)) is None:
+        success, result = parsing.check_for_problems(code, sketch_path)
+        code_cache.store("static-split", sketch_path, code, (success, result))
+    else:
+        success, result = cached_result
+
     if success:
         py5static_globals, py5static_settings, py5static_setup = result
 
-        tempdir = Path(tempfile.TemporaryDirectory().name)
-        tempdir.mkdir(parents=True, exist_ok=True)
+        # each run gets its own directory so concurrent runs of the same Sketch
+        # don't overwrite each other's generated files
+        tempdir = Path(tempfile.mkdtemp(prefix="py5-static-"))
         settings_filename = tempdir / "_PY5_STATIC_SETTINGS_CODE_.py"
         setup_filename = tempdir / "_PY5_STATIC_SETUP_CODE_.py"
 
@@ -187,7 +188,9 @@ def _run_static_code(
 
         new_sketch_path = tempdir / "_PY5_STATIC_FRAMEWORK_CODE_.py"
         new_sketch_code = _STATIC_CODE_FRAMEWORK.format(
-            settings_filename.as_posix(), setup_filename.as_posix()
+            settings_filename.as_posix(),
+            setup_filename.as_posix(),
+            sketch_path.absolute().as_posix(),
         )
         with open(new_sketch_path, "w") as f:
             f.write(new_sketch_code)
@@ -240,51 +243,64 @@ def _run_code(
         with open(sketch_path, "r", encoding="utf8") as f:
             user_code = f.read()
 
-        # does the code parse? if not, display an error message
-        try:
-            # this will make sure indentation and syntax errors are correctly attributed to the user's code and not the _CODE_FRAMEWORK template
-            ast.parse(user_code, filename=sketch_path, mode="exec")
-            # now do the real parsing
-            sketch_code = _CODE_FRAMEWORK.format(
-                user_code, exit_if_error, py5_options_str, sketch_args_str, block
-            )
-            sketch_ast = ast.parse(sketch_code, filename=sketch_path, mode="exec")
-        except IndentationError as e:
-            msg = (
-                f"There is an indentation problem with your code on line {e.lineno}:\n"
+        sketch_code = _CODE_FRAMEWORK.format(
+            user_code, exit_if_error, py5_options_str, sketch_args_str, block
+        )
+
+        # the generated static mode framework names files in a new directory for
+        # every run, so only the compiled settings and setup code is cached for it
+        use_cache = sketch_path == original_sketch_path
+        if (
+            sketch_compiled := (
+                code_cache.load("sketch", sketch_path, sketch_code)
+                if use_cache
+                else None
             )
-            arrow_msg = f"--> {e.lineno}    "
-            msg += f"{arrow_msg}{e.text}"
-            msg += " " * (len(arrow_msg) + e.offset) + "^"
-            print(msg, file=sys.stderr)
-            return
-        except Exception as e:
-            msg = stackprinter.format(e)
-            m = re.search(r"^SyntaxError:", msg, flags=re.MULTILINE)
-            if m:
-                msg = msg[m.start(0) :]
-            msg = "There is a problem with your code:\n" + msg
-            print(msg, file=sys.stderr)
-            return
-
-        problems = parsing.check_reserved_words(sketch_code, sketch_ast)
-        if problems:
-            msg = (
-                "There "
-                + (
-                    "is a problem"
-                    if len(problems) == 1
-                    else f"are {len(problems)} problems"
+        ) is None:
+            # does the code parse? if not, display an error message
+            try:
+                # this will make sure indentation and syntax errors are correctly attributed to the user's code and not the _CODE_FRAMEWORK template
+                ast.parse(user_code, filename=sketch_path, mode="exec")
+                # now do the real parsing
+                sketch_ast = ast.parse(sketch_code, filename=sketch_path, mode="exec")
+            except IndentationError as e:
+                msg = f"There is an indentation problem with your code on line {e.lineno}:\n"
+                arrow_msg = f"--> {e.lineno}    "
+                msg += f"{arrow_msg}{e.text}"
+                msg += " " * (len(arrow_msg) + e.offset) + "^"
+                print(msg, file=sys.stderr)
+                return
+            except Exception as e:
+                msg = stackprinter.format(e)
+                m = re.search(r"^SyntaxError:", msg, flags=re.MULTILINE)
+                if m:
+                    msg = msg[m.start(0) :]
+                msg = "There is a problem with your code:\n" + msg
+                print(msg, file=sys.stderr)
+                return
+
+            problems = parsing.check_reserved_words(sketch_code, sketch_ast)
+            if problems:
+                msg = (
+                    "There "
+                    + (
+                        "is a problem"
+                        if len(problems) == 1
+                        else f"are {len(problems)} problems"
+                    )
+                    + " with your Sketch code"
                 )
-                + " with your Sketch code"
+                msg += "\n" + "=" * len(msg) + "\n" + "\n".join(problems)
+                print(msg, file=sys.stderr)
+                return
+
+            sketch_compiled = compile(
+                parsing.transform_py5_code(sketch_ast),
+                filename=sketch_path,
+                mode="exec",
             )
-            msg += "\n" + "=" * len(msg) + "\n" + "\n".join(problems)
-            print(msg, file=sys.stderr)
-            return
-
-        sketch_compiled = compile(
-            parsing.transform_py5_code(sketch_ast), filename=sketch_path, mode="exec"
-        )
+            if use_cache:
+                code_cache.store("sketch", sketch_path, sketch_code, sketch_compiled)
 
         sys.path.extend([(sketch_path.absolute().parent).as_posix(), os.getcwd()])
         py5_ns = dict()
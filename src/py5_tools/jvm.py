@@ -32,6 +32,7 @@ _PY5_REQUIRED_JAVA_VERSION = 17
 
 _options = []
 _classpath = []
+_headless = os.environ.get("PY5_HEADLESS", "").lower() in ("1", "true", "yes")
 
 
 def is_jvm_running() -> bool:
@@ -78,6 +79,50 @@ def add_options(*options: list[str]) -> None:
     _options.extend(options)
 
 
+def set_headless_mode(headless: bool = True) -> None:
+    """Configure py5 to run without a display server.
+
+    Parameters
+    ----------
+
+    headless: bool = True
+        run the JVM in headless mode
+
+    Notes
+    -----
+
+    Configure py5 to run without a display server. This must be called before `import
+    py5`. The JVM will be started with `java.awt.headless=true` and py5 will no
+    longer refuse to start when there is no graphical environment available. Setting
+    the `PY5_HEADLESS` environment variable to `1` has the same effect.
+
+    Headless mode only supports renderers that do not need a window. A Sketch using
+    the default `JAVA2D` renderer will be rendered offscreen with the `HIDDEN`
+    renderer instead, and the `SVG`, `PDF`, and `DXF` renderers work as usual.
+    The OpenGL renderers `P2D` and `P3D` and the `FX2D` renderer require a display
+    and cannot be used. Methods such as `save_frame()`, `create_graphics()`,
+    `render_frame()`, and the frame hooks in `py5_tools` work normally.
+
+    After the JVM has started, the headless setting cannot be changed. This function
+    will throw a `RuntimeError` if it is called after the JVM has already started.
+    Use `py5_tools.is_jvm_running()` to first determine if the JVM is running."""
+    global _headless
+    _check_jvm_running()
+    _headless = headless
+
+
+def is_headless_mode() -> bool:
+    """Determine if py5 is configured to run without a display server.
+
+    Notes
+    -----
+
+    Determine if py5 is configured to run without a display server. Use
+    `py5_tools.set_headless_mode()` or the `PY5_HEADLESS` environment variable to
+    enable headless mode before importing py5."""
+    return _headless
+
+
 def get_classpath() -> str:
     """Get the Java classpath.
 
@@ -262,12 +307,17 @@ def _start_jvm() -> None:
     ):
         _options.append("--enable-native-access=javafx.graphics")
 
+    if _headless and "-Djava.awt.headless=true" not in _options:
+        _options.append("-Djava.awt.headless=true")
+
     jpype.startJVM(default_jvm_path, *_options, convertStrings=False)
 
 
 __all__ = [
     "is_jvm_running",
     "add_options",
+    "set_headless_mode",
+    "is_headless_mode",
     "get_classpath",
     "add_classpath",
     "add_jars",
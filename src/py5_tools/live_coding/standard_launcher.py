@@ -64,6 +64,7 @@ def launch_live_coding(
     activate_keyboard_shortcuts=False,
     watch_dir=False,
     archive_dir="archive",
+    incremental_reload=False,
 ):
     try:
         sys.path[0] = str(Path(filename).absolute().parent)
@@ -91,6 +92,7 @@ def launch_live_coding(
             watch_dir=watch_dir,
             archive_dir=archive_dir,
             mock_run_sketch=mock_run_sketch,
+            incremental_reload=incremental_reload,
         )
 
         sketch = py5.get_current_sketch()
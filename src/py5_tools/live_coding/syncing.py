@@ -17,6 +17,7 @@
 #   along with this library. If not, see <https://www.gnu.org/licenses/>.
 #
 # *****************************************************************************
+import ast
 import datetime as dt
 import glob
 import inspect
@@ -187,7 +188,12 @@ class UserFunctionWrapperOneParam(UserFunctionWrapper):
 
 
 def exec_user_code(
-    sketch, filename, global_namespace, mock_run_sketch, activate_keyboard_shortcuts
+    sketch,
+    filename,
+    global_namespace,
+    mock_run_sketch,
+    activate_keyboard_shortcuts,
+    code_ast=None,
 ):
     # get user functions by executing code in the given filename, for LIVE_CODING_FILE mode
     import py5.bridge as py5_bridge
@@ -197,8 +203,10 @@ def exec_user_code(
     # execute user code and put new functions into the global namespace
 
     try:
-        with open(filename, "r") as f:
-            exec(compile(f.read(), filename=filename, mode="exec"), global_namespace)
+        if code_ast is None:
+            with open(filename, "r") as f:
+                code_ast = ast.parse(f.read(), filename=filename, mode="exec")
+        exec(compile(code_ast, filename=filename, mode="exec"), global_namespace)
     except Py5RunSketchBlockException:
         # MockRunSketch instance has replaced run_sketch() in the py5 module
         functions, function_param_counts = (
@@ -220,6 +228,116 @@ def exec_user_code(
     )
 
 
+def _bound_names(node):
+    # names a top-level statement assigns to in the module namespace
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return {node.name}
+    if isinstance(node, (ast.Import, ast.ImportFrom)):
+        return {(a.asname or a.name).split(".")[0] for a in node.names}
+    return {
+        n.id
+        for n in ast.walk(node)
+        if isinstance(n, ast.Name) and isinstance(n.ctx, (ast.Store, ast.Del))
+    }
+
+
+def _loaded_names(node):
+    return {
+        n.id
+        for n in ast.walk(node)
+        if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Load)
+    }
+
+
+def _is_def(node):
+    return isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+
+
+def exec_changed_user_code(
+    sketch,
+    filename,
+    global_namespace,
+    old_code_ast,
+    code_ast,
+    activate_keyboard_shortcuts,
+):
+    # re-execute only the top-level statements that changed since old_code_ast was
+    # executed, for LIVE_CODING_FILE mode. returns None if a full reload is needed.
+    import py5.bridge as py5_bridge
+
+    for node in code_ast.body:
+        # __future__ imports affect how everything else is compiled and star
+        # imports bind names that can't be known from the code
+        if isinstance(node, ast.ImportFrom) and (
+            node.module == "__future__" or any(a.name == "*" for a in node.names)
+        ):
+            return None
+
+    # unchanged statements are matched by their code, ignoring their position
+    old_statements = dict()
+    for node in old_code_ast.body:
+        old_statements.setdefault(ast.dump(node), []).append(node)
+
+    # a statement is executed again if its code changed or if it uses a name
+    # that a changed statement assigns to. a function definition that only moved
+    # is also executed again so that tracebacks point to the correct line numbers.
+    changed_names = set()
+    statements = []
+    for node in code_ast.body:
+        if old_nodes := old_statements.get(ast.dump(node)):
+            old_node = old_nodes.pop(0)
+            if not changed_names.isdisjoint(_loaded_names(node)):
+                changed_names |= _bound_names(node)
+            elif not (
+                _is_def(node)
+                and (old_node.lineno, old_node.end_lineno)
+                != (node.lineno, node.end_lineno)
+            ):
+                continue
+        else:
+            changed_names |= _bound_names(node)
+        statements.append(node)
+
+    # forget functions and classes whose definitions were removed
+    remaining_names = set().union(*[_bound_names(node) for node in code_ast.body])
+    for old_nodes in old_statements.values():
+        for old_node in old_nodes:
+            if (
+                isinstance(
+                    old_node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+                )
+                and old_node.name not in remaining_names
+            ):
+                global_namespace.pop(old_node.name, None)
+
+    for node in statements:
+        try:
+            exec(
+                compile(
+                    ast.Module(body=[node], type_ignores=[]),
+                    filename=filename,
+                    mode="exec",
+                ),
+                global_namespace,
+            )
+        except Py5RunSketchBlockException:
+            # the Sketch is already running and a blocking run_sketch() call
+            # would have stopped the code execution here
+            break
+
+    functions, function_param_counts = py5_bridge._extract_py5_user_function_data(
+        global_namespace
+    )
+
+    return process_user_functions(
+        sketch,
+        functions,
+        function_param_counts,
+        global_namespace,
+        activate_keyboard_shortcuts,
+    )
+
+
 def retrieve_user_code(sketch, namespace, activate_keyboard_shortcuts):
     # get user functions from the given namespace, for LIVE_CODING_GLOBALS mode
     import py5.bridge as py5_bridge
@@ -287,6 +405,7 @@ class SyncDraw:
         watch_dir=False,
         archive_dir=None,
         mock_run_sketch=None,
+        incremental_reload=False,
     ):
         self.live_coding_mode = live_coding_mode
 
@@ -300,6 +419,7 @@ class SyncDraw:
         self.watch_dir = watch_dir
         self.archive_dir = Path(archive_dir)
         self.mock_run_sketch = mock_run_sketch
+        self.incremental_reload = incremental_reload
 
         if self.watch_dir:
             self.getmtime = lambda f: max(
@@ -328,6 +448,7 @@ class SyncDraw:
         self.user_supplied_draw = False
         self.user_setup_code = None
         self.run_setup_again = False
+        self.code_ast = None
 
     ######################################################################
     # HOOK METHODS
@@ -487,14 +608,13 @@ class SyncDraw:
 
     def keep_functions_current_from_globals(self, s):
         try:
-            self.functions, self.function_param_counts, self.user_supplied_draw = (
-                retrieve_user_code(
+            self._process_new_functions(
+                s,
+                *retrieve_user_code(
                     s, self.global_namespace, self.activate_keyboard_shortcuts
-                )
+                ),
             )
 
-            self._process_new_functions(s)
-
             if not UserFunctionWrapper.running_state:
                 s.println("Resuming Sketch execution...")
                 UserFunctionWrapper.running_state = True
@@ -531,20 +651,47 @@ class SyncDraw:
             ):
                 self.mtime = new_mtime
 
-                if self.import_hook is not None:
-                    self.import_hook.flush_imported_modules()
+                with open(self.filename, "r") as f:
+                    code_ast = ast.parse(f.read(), filename=self.filename, mode="exec")
+
+                new_functions = None
+                if (
+                    self.incremental_reload
+                    and self.code_ast is not None
+                    and not force_update
+                    # with watch_dir, a change to another file requires a full reload
+                    and (
+                        not self.watch_dir
+                        or new_mtime == os.path.getmtime(self.filename)
+                    )
+                ):
+                    # a failed update can leave the namespace in an unknown state
+                    old_code_ast, self.code_ast = self.code_ast, None
+                    new_functions = exec_changed_user_code(
+                        s,
+                        self.filename,
+                        self.global_namespace,
+                        old_code_ast,
+                        code_ast,
+                        self.activate_keyboard_shortcuts,
+                    )
+
+                if new_functions is None:
+                    self.code_ast = None
+                    if self.import_hook is not None:
+                        self.import_hook.flush_imported_modules()
 
-                self.functions, self.function_param_counts, self.user_supplied_draw = (
-                    exec_user_code(
+                    new_functions = exec_user_code(
                         s,
                         self.filename,
                         self.global_namespace,
                         self.mock_run_sketch,
                         self.activate_keyboard_shortcuts,
+                        code_ast=code_ast,
                     )
-                )
 
-                self._process_new_functions(s)
+                self.code_ast = code_ast
+                self._process_new_functions(s, *new_functions)
 
                 if not UserFunctionWrapper.running_state:
                     if s.has_thread("keep_functions_current_from_file"):
@@ -586,25 +733,44 @@ class SyncDraw:
 
             return False
 
-    def _process_new_functions(self, s):
+    def _process_new_functions(
+        self, s, functions, function_param_counts, user_supplied_draw
+    ):
         self.update_count += 1
+        self.user_supplied_draw = user_supplied_draw
 
         new_user_setup_code = (
-            inspect.getsource(self.functions["setup"].f)
-            if "setup" in self.functions
-            else None
+            inspect.getsource(functions["setup"].f) if "setup" in functions else None
         )
 
         if self.startup:
+            self.functions, self.function_param_counts = (
+                functions,
+                function_param_counts,
+            )
             self.user_setup_code = new_user_setup_code
             self.startup = False
         else:
-            s._py5_bridge.set_functions(self.functions, self.function_param_counts)
-            s._instance.buildPy5Bridge(
-                s._py5_bridge,
-                s._environ.in_ipython_session,
-                s._environ.in_jupyter_zmq_shell,
-            )
+            if functions.keys() == self.functions.keys() and all(
+                function_param_counts.get(fname, 0)
+                == self.function_param_counts.get(fname, 0)
+                for fname in functions
+            ):
+                # the same user functions exist, so the running Sketch can keep
+                # the wrappers it already has and call the new code through them
+                for fname, wrapper in functions.items():
+                    self.functions[fname].f = wrapper.f
+            else:
+                self.functions, self.function_param_counts = (
+                    functions,
+                    function_param_counts,
+                )
+                s._py5_bridge.set_functions(self.functions, self.function_param_counts)
+                s._instance.buildPy5Bridge(
+                    s._py5_bridge,
+                    s._environ.in_ipython_session,
+                    s._environ.in_jupyter_zmq_shell,
+                )
 
             if self.always_rerun_setup or self.user_setup_code != new_user_setup_code:
                 self.run_setup_again = True
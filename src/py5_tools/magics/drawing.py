@@ -18,7 +18,9 @@
 #
 # *****************************************************************************
 import ast
+import hashlib
 import io
+import os
 import re
 import sys
 import tempfile
@@ -36,6 +38,7 @@ from IPython.core.magic_arguments import (
 from IPython.display import SVG, Image, display
 
 from .. import imported, parsing
+from ..constants import PY5_HOME, VERSION
 from .util import CellMagicHelpFormatter, filename_check, variable_name_check
 
 _CODE_FRAMEWORK_BEGIN = """
@@ -138,6 +141,98 @@ def _py5_setup():
 """
 
 
+RESULT_CACHE_DIR = Path(PY5_HOME) / "magic-results"
+
+
+def _cache_arguments(func):
+    for decorator in [
+        argument(
+            "--clear-cache",
+            dest="clear_cache",
+            action="store_true",
+            help="delete all cached results before running",
+        ),
+        argument(
+            "--refresh-cache",
+            dest="refresh_cache",
+            action="store_true",
+            help="run the code and replace the cached result",
+        ),
+        argument(
+            "--cache-key",
+            type=str,
+            dest="cache_key",
+            default="",
+            help="value representing the code's dependencies, such as a data file hash",
+        ),
+        argument(
+            "--cache",
+            dest="cache",
+            action="store_true",
+            help="reuse the cached result from a previous run of the same code",
+        ),
+    ]:
+        func = decorator(func)
+    return func
+
+
+def _result_cache_path(renderer, code, width, height, cache_key):
+    key = "\0".join(
+        [
+            VERSION,
+            renderer,
+            str(width),
+            str(height),
+            str(imported.get_imported_mode()),
+            cache_key,
+            code,
+        ]
+    )
+    return RESULT_CACHE_DIR / hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _run_sketch_cached(renderer, code, width, height, user_ns, safe_exec, args):
+    # the result depends on the code, the dimensions, the renderer and the
+    # user's cache key. the results are stored as bytes, like the PDF and PNG
+    # output. the SVG and DXF output is text.
+    text_mode = renderer in ["SVG", "DXF"]
+
+    if args.clear_cache and RESULT_CACHE_DIR.exists():
+        for cache_file in RESULT_CACHE_DIR.iterdir():
+            cache_file.unlink(missing_ok=True)
+        print("Cleared cached results")
+
+    if not args.cache:
+        return _run_sketch(renderer, code, width, height, user_ns, safe_exec)
+
+    if not safe_exec:
+        print(
+            "The --cache and --unsafe arguments cannot be used together because a cached result would skip changes to the user namespace.",
+            file=sys.stderr,
+        )
+        return None
+
+    cache_path = _result_cache_path(renderer, code, width, height, args.cache_key)
+    if not args.refresh_cache and cache_path.exists():
+        try:
+            result = cache_path.read_bytes()
+            return result.decode("utf-8") if text_mode else result
+        except (OSError, UnicodeDecodeError):
+            pass
+
+    result = _run_sketch(renderer, code, width, height, user_ns, safe_exec)
+    if result is not None:
+        try:
+            RESULT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            temp_path.write_bytes(result.encode("utf-8") if text_mode else result)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            pass
+
+    return result
+
+
 def _run_sketch(renderer, code, width, height, user_ns, safe_exec):
     if renderer == "SVG":
         template = _SAVE_OUTPUT_CODE_TEMPLATE + _CODE_TEMPLATE_END
@@ -252,6 +347,7 @@ class DrawingMagics(Magics):
         action="store_true",
         help="allow new variables to enter the user namespace",
     )
+    @_cache_arguments
     @kwds(formatter_class=CellMagicHelpFormatter)
     @cell_magic
     def py5drawpdf(self, line, cell):
@@ -279,11 +375,26 @@ class DrawingMagics(Magics):
         instead of a copy, making them available in other notebook cells. This may be
         very useful to you, but be aware that using py5 objects in a different notebook
         cell or reusing them in another Sketch can result in nasty errors and bizzare
-        consequences."""
+        consequences.
+
+        Use the `--cache` argument to store the output and reuse it the next time the
+        same code is run with the same dimensions and renderer, without running the
+        Sketch again. The cell's code cannot know if variables or data files it uses
+        have changed, so pass a value representing them with `--cache-key`, such as a
+        version number or a hash of a data file. IPython will substitute variables in
+        the magic line, as in `--cache-key {data_version}`. Use `--refresh-cache` to run
+        the code and replace the cached output or `--clear-cache` to delete all cached
+        output. The `--cache` argument cannot be combined with `--unsafe`."""
         args = parse_argstring(self.py5drawpdf, line)
 
-        pdf = _run_sketch(
-            "PDF", cell, args.width, args.height, self.shell.user_ns, not args.unsafe
+        pdf = _run_sketch_cached(
+            "PDF",
+            cell,
+            args.width,
+            args.height,
+            self.shell.user_ns,
+            not args.unsafe,
+            args,
         )
         if pdf:
             filename = filename_check(args.filename)
@@ -303,6 +414,7 @@ class DrawingMagics(Magics):
         action="store_true",
         help="allow new variables to enter the user namespace",
     )
+    @_cache_arguments
     @kwds(formatter_class=CellMagicHelpFormatter)
     @cell_magic
     def py5drawsvg(self, line, cell):
@@ -330,11 +442,26 @@ class DrawingMagics(Magics):
         instead of a copy, making them available in other notebook cells. This may be
         very useful to you, but be aware that using py5 objects in a different notebook
         cell or reusing them in another Sketch can result in nasty errors and bizzare
-        consequences."""
+        consequences.
+
+        Use the `--cache` argument to store the output and reuse it the next time the
+        same code is run with the same dimensions and renderer, without running the
+        Sketch again. The cell's code cannot know if variables or data files it uses
+        have changed, so pass a value representing them with `--cache-key`, such as a
+        version number or a hash of a data file. IPython will substitute variables in
+        the magic line, as in `--cache-key {data_version}`. Use `--refresh-cache` to run
+        the code and replace the cached output or `--clear-cache` to delete all cached
+        output. The `--cache` argument cannot be combined with `--unsafe`."""
         args = parse_argstring(self.py5drawsvg, line)
 
-        svg = _run_sketch(
-            "SVG", cell, args.width, args.height, self.shell.user_ns, not args.unsafe
+        svg = _run_sketch_cached(
+            "SVG",
+            cell,
+            args.width,
+            args.height,
+            self.shell.user_ns,
+            not args.unsafe,
+            args,
         )
         if svg:
             if args.filename:
@@ -363,6 +490,7 @@ class DrawingMagics(Magics):
         action="store_true",
         help="allow new variables to enter the user namespace",
     )
+    @_cache_arguments
     @kwds(formatter_class=CellMagicHelpFormatter)
     @cell_magic
     def py5draw(self, line, cell):
@@ -396,7 +524,16 @@ class DrawingMagics(Magics):
         instead of a copy, making them available in other notebook cells. This may be
         very useful to you, but be aware that using py5 objects in a different notebook
         cell or reusing them in another Sketch can result in nasty errors and bizzare
-        consequences."""
+        consequences.
+
+        Use the `--cache` argument to store the output and reuse it the next time the
+        same code is run with the same dimensions and renderer, without running the
+        Sketch again. The cell's code cannot know if variables or data files it uses
+        have changed, so pass a value representing them with `--cache-key`, such as a
+        version number or a hash of a data file. IPython will substitute variables in
+        the magic line, as in `--cache-key {data_version}`. Use `--refresh-cache` to run
+        the code and replace the cached output or `--clear-cache` to delete all cached
+        output. The `--cache` argument cannot be combined with `--unsafe`."""
         args = parse_argstring(self.py5draw, line)
 
         if sys.platform == "darwin":
@@ -421,13 +558,14 @@ class DrawingMagics(Magics):
             print(f"unknown renderer {args.renderer}", file=sys.stderr)
             return
 
-        png = _run_sketch(
+        png = _run_sketch_cached(
             args.renderer,
             cell,
             args.width,
             args.height,
             self.shell.user_ns,
             not args.unsafe,
+            args,
         )
         if png:
             if args.filename or args.variable:
@@ -457,6 +595,7 @@ class DXFDrawingMagic(Magics):
         action="store_true",
         help="allow new variables to enter the user namespace",
     )
+    @_cache_arguments
     @kwds(formatter_class=CellMagicHelpFormatter)
     @cell_magic
     def py5drawdxf(self, line, cell):
@@ -486,11 +625,26 @@ class DXFDrawingMagic(Magics):
         instead of a copy, making them available in other notebook cells. This may be
         very useful to you, but be aware that using py5 objects in a different notebook
         cell or reusing them in another Sketch can result in nasty errors and bizzare
-        consequences."""
+        consequences.
+
+        Use the `--cache` argument to store the output and reuse it the next time the
+        same code is run with the same dimensions and renderer, without running the
+        Sketch again. The cell's code cannot know if variables or data files it uses
+        have changed, so pass a value representing them with `--cache-key`, such as a
+        version number or a hash of a data file. IPython will substitute variables in
+        the magic line, as in `--cache-key {data_version}`. Use `--refresh-cache` to run
+        the code and replace the cached output or `--clear-cache` to delete all cached
+        output. The `--cache` argument cannot be combined with `--unsafe`."""
         args = parse_argstring(self.py5drawdxf, line)
 
-        dxf = _run_sketch(
-            "DXF", cell, args.width, args.height, self.shell.user_ns, not args.unsafe
+        dxf = _run_sketch_cached(
+            "DXF",
+            cell,
+            args.width,
+            args.height,
+            self.shell.user_ns,
+            not args.unsafe,
+            args,
         )
         if dxf:
             filename = filename_check(args.filename)
@@ -18,6 +18,7 @@
 #
 # *****************************************************************************
 import sys
+import threading
 
 from . import environ as _environ
 
@@ -97,3 +98,95 @@ class _PrintlnFileStream:
     def shutdown(self):
         if self.f is not None:
             self.f.close()
+
+
+class _CoalescingPrintlnStream:
+    """Buffer another println stream, sending the output in batches.
+
+    Text is collected and sent to the wrapped stream at most once every
+    `interval` seconds, with consecutive stdout or stderr text joined into one
+    message. At most `max_lines` lines of text are kept for each batch and the
+    rest are replaced with a count of the dropped lines. Printing with `flush`
+    set to `True` sends the batch right away.
+    """
+
+    def __init__(self, stream, interval=0.1, max_lines=100):
+        self.stream = stream
+        self.interval = interval
+        self.max_lines = max_lines
+        self._buffer = []
+        self._line_count = 0
+        self._dropped = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def print(self, text, end="\n", stderr=False, flush=False):
+        text += end
+        with self._lock:
+            stopped = self._stop_event.is_set()
+            if not stopped:
+                self._append(text, stderr)
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        name="py5-println", target=self._run, daemon=True
+                    )
+                    self._thread.start()
+
+        if stopped:
+            # send any buffered text first so the output stays in order
+            with self._flush_lock:
+                self._flush()
+                self.stream.print(text, end="", stderr=stderr, flush=flush)
+        elif flush:
+            self.flush()
+
+    def _append(self, text, stderr):
+        line_count = text.count("\n")
+        room = self.max_lines - self._line_count
+        if line_count > room:
+            if room > 0:
+                self._buffer.append(("\n".join(text.split("\n")[:room]) + "\n", stderr))
+            self._dropped += line_count - max(room, 0)
+            self._line_count = self.max_lines
+        else:
+            self._buffer.append((text, stderr))
+            self._line_count += line_count
+
+    def flush(self):
+        with self._flush_lock:
+            self._flush()
+
+    def _flush(self):
+        with self._lock:
+            buffer, self._buffer = self._buffer, []
+            dropped, self._dropped = self._dropped, 0
+            self._line_count = 0
+
+        chunks = []
+        for text, stderr in buffer:
+            if chunks and chunks[-1][1] == stderr:
+                chunks[-1][0].append(text)
+            else:
+                chunks.append(([text], stderr))
+        if dropped:
+            chunks.append(
+                ([f"[{dropped} more lines of println() output not shown]\n"], True)
+            )
+
+        for texts, stderr in chunks:
+            self.stream.print("".join(texts), end="", stderr=stderr)
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self.flush()
+
+    def shutdown(self):
+        with self._lock:
+            # no more text will be added to the buffer after this
+            self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.interval * 10)
+        self.flush()
+        self.stream.shutdown()
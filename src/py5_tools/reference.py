@@ -79,13 +79,17 @@ PY5_DIR_STR = ['__version__',
     'blend_mode',
     'blue',
     'BLUR',
+    'borrow_graphics',
+    'borrow_image',
     'BOTTOM',
     'BOX',
     'box',
     'BREAK',
     'brightness',
+    'buffer_pool_stats',
     'BURN',
     'camera',
+    'cancel_idle_task',
     'ceil',
     'CENTER',
     'CHORD',
@@ -216,6 +220,7 @@ PY5_DIR_STR = ['__version__',
     'hour',
     'HSB',
     'hue',
+    'idle_task_stats',
     'IMAGE',
     'image',
     'image_mode',
@@ -227,6 +232,8 @@ PY5_DIR_STR = ['__version__',
     'is_mouse_pressed',
     'is_ready',
     'is_running',
+    'iter_records',
+    'iter_strings',
     'JAVA2D',
     'java_platform',
     'java_version_name',
@@ -256,6 +263,7 @@ PY5_DIR_STR = ['__version__',
     'load_image',
     'load_json',
     'load_np_pixels',
+    'load_numpy',
     'load_pickle',
     'load_pixels',
     'load_shader',
@@ -384,6 +392,7 @@ PY5_DIR_STR = ['__version__',
     'rect_mode',
     'red',
     'redraw',
+    'register_callback',
     'register_exception_msg',
     'register_image_conversion',
     'register_shape_conversion',
@@ -393,8 +402,14 @@ PY5_DIR_STR = ['__version__',
     'render_frame_sequence',
     'render_sequence',
     'REPEAT',
+    'repeating_thread_stats',
     'REPLACE',
+    'request_assets',
+    'request_bytes',
     'request_image',
+    'request_images',
+    'request_json',
+    'request_strings',
     'reset_matrix',
     'reset_py5',
     'reset_shader',
@@ -409,6 +424,7 @@ PY5_DIR_STR = ['__version__',
     'rotate_y',
     'rotate_z',
     'ROUND',
+    'run_async',
     'run_sketch',
     'rwidth',
     'saturation',
@@ -418,7 +434,9 @@ PY5_DIR_STR = ['__version__',
     'save_json',
     'save_pickle',
     'save_strings',
+    'save_tiled',
     'scale',
+    'schedule_idle_task',
     'SCREEN',
     'screen_x',
     'screen_y',
@@ -427,6 +445,8 @@ PY5_DIR_STR = ['__version__',
     'select_folder',
     'select_input',
     'select_output',
+    'set_buffer_pool_budget',
+    'set_http_options',
     'set_matrix',
     'set_np_pixels',
     'set_pixels',
@@ -568,13 +588,17 @@ PY5_ALL_STR = ['__version__',
     'blend_mode',
     'blue',
     'BLUR',
+    'borrow_graphics',
+    'borrow_image',
     'BOTTOM',
     'BOX',
     'box',
     'BREAK',
     'brightness',
+    'buffer_pool_stats',
     'BURN',
     'camera',
+    'cancel_idle_task',
     'ceil',
     'CENTER',
     'CHORD',
@@ -699,11 +723,14 @@ PY5_ALL_STR = ['__version__',
     'hour',
     'HSB',
     'hue',
+    'idle_task_stats',
     'IMAGE',
     'image',
     'image_mode',
     'intercept_escape',
     'INVERT',
+    'iter_records',
+    'iter_strings',
     'JAVA2D',
     'JClass',
     'join_thread',
@@ -729,6 +756,7 @@ PY5_ALL_STR = ['__version__',
     'load_image',
     'load_json',
     'load_np_pixels',
+    'load_numpy',
     'load_pickle',
     'load_pixels',
     'load_shader',
@@ -844,6 +872,7 @@ PY5_ALL_STR = ['__version__',
     'rect_mode',
     'red',
     'redraw',
+    'register_callback',
     'register_exception_msg',
     'register_image_conversion',
     'register_shape_conversion',
@@ -853,8 +882,14 @@ PY5_ALL_STR = ['__version__',
     'render_frame_sequence',
     'render_sequence',
     'REPEAT',
+    'repeating_thread_stats',
     'REPLACE',
+    'request_assets',
+    'request_bytes',
     'request_image',
+    'request_images',
+    'request_json',
+    'request_strings',
     'reset_matrix',
     'reset_py5',
     'reset_shader',
@@ -866,6 +901,7 @@ PY5_ALL_STR = ['__version__',
     'rotate_y',
     'rotate_z',
     'ROUND',
+    'run_async',
     'run_sketch',
     'saturation',
     'save',
@@ -874,7 +910,9 @@ PY5_ALL_STR = ['__version__',
     'save_json',
     'save_pickle',
     'save_strings',
+    'save_tiled',
     'scale',
+    'schedule_idle_task',
     'SCREEN',
     'screen_x',
     'screen_y',
@@ -883,6 +921,8 @@ PY5_ALL_STR = ['__version__',
     'select_folder',
     'select_input',
     'select_output',
+    'set_buffer_pool_budget',
+    'set_http_options',
     'set_matrix',
     'set_np_pixels',
     'set_pixels',
@@ -48,6 +48,14 @@ parser.add_argument(
     dest="show_framerate",
     help="show framerate",
 )
+parser.add_argument(
+    "-i",
+    "--incremental-reload",
+    action="store_true",
+    default=False,
+    dest="incremental_reload",
+    help="only rerun the functions and statements that changed when file is updated",
+)
 parser.add_argument(
     "-k",
     "--activate-keyboard-shortcuts",
@@ -92,6 +100,7 @@ def main(args=None):
         activate_keyboard_shortcuts=args.activate_keyboard_shortcuts,
         watch_dir=args.watch_dir,
         archive_dir=args.archive_dir,
+        incremental_reload=args.incremental_reload,
     )
 
 
@@ -27,6 +27,31 @@ parser = argparse.ArgumentParser(
 )
 parser.add_argument(action="store", dest="src", help="path to imported mode code")
 parser.add_argument(action="store", dest="dest", help="path to module mode code")
+parser.add_argument(
+    "-j",
+    "--jobs",
+    action="store",
+    type=int,
+    default=1,
+    dest="jobs",
+    help="number of files to translate in parallel, or 0 for one per CPU",
+)
+parser.add_argument(
+    "--autopep8",
+    action="store",
+    choices=["all", "changed", "none"],
+    default="all",
+    dest="autopep8_mode",
+    help="format all translated files with autopep8, only the files the translation changed, or none of them",
+)
+parser.add_argument(
+    "-f",
+    "--force",
+    action="store_true",
+    default=False,
+    dest="force",
+    help="translate all files, including files unchanged since the previous translation",
+)
 
 
 def main(args=None):
@@ -40,9 +65,17 @@ def main(args=None):
         return
 
     if src.is_dir() and (dest.is_dir() or not dest.exists()):
-        translators.imported2module.translate_dir(src, dest)
+        translators.imported2module.translate_dir(
+            src,
+            dest,
+            jobs=args.jobs,
+            autopep8_mode=args.autopep8_mode,
+            force=args.force,
+        )
     elif src.is_file() and (dest.is_file() or not dest.exists()):
-        translators.imported2module.translate_file(src, dest)
+        translators.imported2module.translate_file(
+            src, dest, autopep8_mode=args.autopep8_mode
+        )
     else:
         print("Error: The two arguments must both be directories or both be files")
 
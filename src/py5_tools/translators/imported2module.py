@@ -39,16 +39,46 @@ def post_translate(code):
     return code
 
 
-def translate_code(code):
-    return util.translate_code(translate_token, code, post_translate=post_translate)
-
-
-def translate_file(src: Union[str, Path], dest: Union[str, Path]):
-    util.translate_file(translate_token, src, dest, post_translate=post_translate)
-
-
-def translate_dir(src: Union[str, Path], dest: Union[str, Path], ext=".py"):
-    util.translate_dir(translate_token, src, dest, ext, post_translate=post_translate)
+def translate_code(code, *, autopep8_mode="all"):
+    return util.translate_code(
+        translate_token,
+        code,
+        post_translate=post_translate,
+        autopep8_mode=autopep8_mode,
+    )
+
+
+def translate_file(
+    src: Union[str, Path], dest: Union[str, Path], *, autopep8_mode="all"
+):
+    util.translate_file(
+        translate_token,
+        src,
+        dest,
+        post_translate=post_translate,
+        autopep8_mode=autopep8_mode,
+    )
+
+
+def translate_dir(
+    src: Union[str, Path],
+    dest: Union[str, Path],
+    ext=".py",
+    *,
+    jobs=1,
+    autopep8_mode="all",
+    force=False,
+):
+    util.translate_dir(
+        translate_token,
+        src,
+        dest,
+        ext,
+        post_translate=post_translate,
+        jobs=jobs,
+        autopep8_mode=autopep8_mode,
+        force=force,
+    )
 
 
 __all__ = ["translate_token", "translate_code", "translate_file", "translate_dir"]
@@ -59,16 +59,34 @@ def translate_token(token):
         return token.lower()
 
 
-def translate_code(code):
-    return util.translate_code(translate_token, code)
-
-
-def translate_file(src: Union[str, Path], dest: Union[str, Path]):
-    util.translate_file(translate_token, src, dest)
-
-
-def translate_dir(src: Union[str, Path], dest: Union[str, Path], ext=".pyde"):
-    util.translate_dir(translate_token, src, dest, ext)
+def translate_code(code, *, autopep8_mode="all"):
+    return util.translate_code(translate_token, code, autopep8_mode=autopep8_mode)
+
+
+def translate_file(
+    src: Union[str, Path], dest: Union[str, Path], *, autopep8_mode="all"
+):
+    util.translate_file(translate_token, src, dest, autopep8_mode=autopep8_mode)
+
+
+def translate_dir(
+    src: Union[str, Path],
+    dest: Union[str, Path],
+    ext=".pyde",
+    *,
+    jobs=1,
+    autopep8_mode="all",
+    force=False,
+):
+    util.translate_dir(
+        translate_token,
+        src,
+        dest,
+        ext,
+        jobs=jobs,
+        autopep8_mode=autopep8_mode,
+        force=force,
+    )
 
 
 __all__ = ["translate_token", "translate_code", "translate_file", "translate_dir"]
@@ -17,17 +17,39 @@
 #   along with this library. If not, see <https://www.gnu.org/licenses/>.
 #
 # *****************************************************************************
+import hashlib
+import json
+import os
 import shlex
+import time
+from concurrent.futures import ProcessPoolExecutor
 from io import StringIO
 from pathlib import Path
 from typing import Callable, Union
 
 import autopep8
 
+from ..constants import VERSION
 
-def translate_code(
-    translate_token: Callable, code: str, post_translate: Callable = None
+MANIFEST_FILENAME = ".py5translate_manifest.json"
+AUTOPEP8_MODES = ["all", "changed", "none"]
+STAGES = ["read", "tokenize", "post_translate", "autopep8", "write"]
+
+
+def _translate_code(
+    translate_token: Callable,
+    code: str,
+    post_translate: Callable = None,
+    autopep8_mode: str = "all",
+    timings: dict = None,
 ):
+    if autopep8_mode not in AUTOPEP8_MODES:
+        raise RuntimeError(
+            f"autopep8_mode must be one of {', '.join(AUTOPEP8_MODES)}, not {autopep8_mode}"
+        )
+    timings = {} if timings is None else timings
+    start = time.perf_counter()
+
     tokens = shlex.shlex(code)
     tokens.whitespace = ""
     tokens.wordchars += "."
@@ -57,36 +79,116 @@ def translate_code(
         out.write(token)
 
     new_code = out.getvalue()
+    timings["tokenize"] = (now := time.perf_counter()) - start
 
     if post_translate:
         new_code = post_translate(new_code)
+    timings["post_translate"] = (start := time.perf_counter()) - now
 
-    new_code = autopep8.fix_code(
-        autopep8.fix_2to3(new_code), options=dict(aggressive=2)
-    )
+    # with the "changed" mode, code the translation didn't change is left as is
+    if autopep8_mode == "all" or (autopep8_mode == "changed" and new_code != code):
+        # autopep8 removed fix_2to3() along with lib2to3
+        if hasattr(autopep8, "fix_2to3"):
+            new_code = autopep8.fix_2to3(new_code)
+        new_code = autopep8.fix_code(new_code, options=dict(aggressive=2))
+    timings["autopep8"] = time.perf_counter() - start
 
     return new_code
 
 
-def translate_file(
+def translate_code(
+    translate_token: Callable,
+    code: str,
+    post_translate: Callable = None,
+    *,
+    autopep8_mode: str = "all",
+):
+    return _translate_code(
+        translate_token,
+        code,
+        post_translate=post_translate,
+        autopep8_mode=autopep8_mode,
+    )
+
+
+def _translate_file(
     translate_token: Callable,
     src: Union[str, Path],
     dest: Union[str, Path],
     post_translate: Callable = None,
+    autopep8_mode: str = "all",
+    timings: dict = None,
 ):
     src = Path(src)
     dest = Path(dest)
+    timings = {} if timings is None else timings
 
+    start = time.perf_counter()
     with open(src, "r", encoding="utf8") as f:
-        new_code = translate_code(
-            translate_token, f.read(), post_translate=post_translate
-        )
+        code = f.read()
+    timings["read"] = time.perf_counter() - start
+
+    new_code = _translate_code(
+        translate_token,
+        code,
+        post_translate=post_translate,
+        autopep8_mode=autopep8_mode,
+        timings=timings,
+    )
 
+    start = time.perf_counter()
     if not dest.parent.exists():
-        dest.parent.mkdir(parents=True)
+        dest.parent.mkdir(parents=True, exist_ok=True)
 
     with open(dest, "w", encoding="utf8") as f:
         f.write(new_code)
+    timings["write"] = time.perf_counter() - start
+
+    return new_code
+
+
+def translate_file(
+    translate_token: Callable,
+    src: Union[str, Path],
+    dest: Union[str, Path],
+    post_translate: Callable = None,
+    *,
+    autopep8_mode: str = "all",
+):
+    _translate_file(
+        translate_token,
+        src,
+        dest,
+        post_translate=post_translate,
+        autopep8_mode=autopep8_mode,
+    )
+
+
+def _hash_file(filename):
+    with open(filename, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _translate_dir_job(translate_token, post_translate, autopep8_mode, src, dest):
+    # runs in a worker process when translating with more than one job
+    timings = {}
+    try:
+        new_code = _translate_file(
+            translate_token,
+            src,
+            dest,
+            post_translate=post_translate,
+            autopep8_mode=autopep8_mode,
+            timings=timings,
+        )
+        return (
+            timings,
+            hashlib.sha256(new_code.encode("utf8")).hexdigest(),
+            None,
+        )
+    except Exception as e:
+        # exceptions might not be picklable
+        return timings, None, str(e)
 
 
 def translate_dir(
@@ -95,22 +197,115 @@ def translate_dir(
     dest: Union[str, Path],
     ext: str,
     post_translate: Callable = None,
+    *,
+    jobs: int = 1,
+    autopep8_mode: str = "all",
+    force: bool = False,
 ):
     src = Path(src)
     dest = Path(dest)
+    start_time = time.perf_counter()
 
     print("translating code in", str(src))
 
-    count = 0
-    for src_file in src.glob("**/*" + ext):
+    if autopep8_mode not in AUTOPEP8_MODES:
+        raise RuntimeError(
+            f"autopep8_mode must be one of {', '.join(AUTOPEP8_MODES)}, not {autopep8_mode}"
+        )
+
+    # the manifest from the previous run identifies files that don't need to be
+    # translated again. the translation settings must also match.
+    manifest_file = dest / MANIFEST_FILENAME
+    translator = f"{translate_token.__module__}.{translate_token.__qualname__}"
+    settings = dict(py5_version=VERSION, translator=translator, autopep8=autopep8_mode)
+    old_files = {}
+    if not force and manifest_file.exists():
         try:
-            dest_file = dest / src_file.relative_to(src).with_suffix(".py")
-            translate_file(
-                translate_token, src_file, dest_file, post_translate=post_translate
-            )
-            print("translated " + str(src_file.relative_to(src)))
+            with open(manifest_file, "r", encoding="utf8") as f:
+                manifest = json.load(f)
+            if manifest.get("settings") == settings:
+                old_files = manifest.get("files", {})
+        except (OSError, ValueError):
+            pass
+
+    files = {}
+    tasks = []
+    skipped = 0
+    for src_file in sorted(src.glob("**/*" + ext)):
+        rel_path = src_file.relative_to(src).as_posix()
+        dest_file = dest / src_file.relative_to(src).with_suffix(".py")
+        try:
+            source_hash = _hash_file(src_file)
+            if (
+                (old_entry := old_files.get(rel_path))
+                and old_entry["source"] == source_hash
+                and dest_file.exists()
+                and _hash_file(dest_file) == old_entry["dest"]
+            ):
+                files[rel_path] = old_entry
+                skipped += 1
+                continue
+        except OSError:
+            source_hash = None
+        tasks.append((rel_path, source_hash, src_file, dest_file))
+
+    count = 0
+    errors = 0
+    totals = dict.fromkeys(STAGES, 0.0)
+
+    def process_result(rel_path, source_hash, result):
+        nonlocal count, errors
+        timings, dest_hash, error = result
+        for stage, t in timings.items():
+            totals[stage] += t
+        progress = f"[{count + errors + 1}/{len(tasks)}]"
+        if error is None:
+            print(progress, "translated " + rel_path)
+            if source_hash is not None:
+                files[rel_path] = dict(source=source_hash, dest=dest_hash)
             count += 1
-        except:
-            print("error translating " + str(src_file.relative_to(src)))
+        else:
+            print(progress, "error translating " + rel_path)
+            errors += 1
+
+    if jobs is None or jobs < 1:
+        jobs = os.cpu_count() or 1
+    job_args = (translate_token, post_translate, autopep8_mode)
+    if jobs == 1 or len(tasks) <= 1:
+        for rel_path, source_hash, src_file, dest_file in tasks:
+            process_result(
+                rel_path,
+                source_hash,
+                _translate_dir_job(*job_args, src_file, dest_file),
+            )
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+            futures = [
+                (
+                    rel_path,
+                    source_hash,
+                    executor.submit(_translate_dir_job, *job_args, src_file, dest_file),
+                )
+                for rel_path, source_hash, src_file, dest_file in tasks
+            ]
+            for rel_path, source_hash, future in futures:
+                process_result(rel_path, source_hash, future.result())
+
+    if files or manifest_file.exists():
+        try:
+            dest.mkdir(parents=True, exist_ok=True)
+            with open(manifest_file, "w", encoding="utf8") as f:
+                json.dump(dict(settings=settings, files=files), f, indent=2)
+        except OSError:
+            print("unable to write translation manifest", str(manifest_file))
 
     print("complete: translated", count, "files written to output directory", str(dest))
+    if skipped:
+        print("skipped", skipped, "unchanged files")
+    if errors:
+        print("failed to translate", errors, "files")
+    print(
+        "time per stage:",
+        ", ".join(f"{stage} {totals[stage]:0.2f}s" for stage in STAGES),
+    )
+    print(f"elapsed time {time.perf_counter() - start_time:0.2f}s using {jobs} job(s)")